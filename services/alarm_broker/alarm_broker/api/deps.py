@@ -5,10 +5,10 @@ import secrets
 from collections.abc import AsyncIterator
 from functools import lru_cache
 
-from arq.connections import ArqRedis
 from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from alarm_broker.core.redis_proto import PingableRedis
 from alarm_broker.settings import Settings, get_settings
 
 
@@ -48,7 +48,7 @@ async def get_session(
         yield session
 
 
-def get_redis(request: Request) -> ArqRedis:
+def get_redis(request: Request) -> PingableRedis:
     redis = getattr(request.app.state, "redis", None)
     if redis is None:
         raise RuntimeError("Redis not initialized")
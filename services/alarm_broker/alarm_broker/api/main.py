@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import logging
 import time
 import uuid
 from contextlib import asynccontextmanager
@@ -23,12 +22,15 @@ from alarm_broker.core.errors import (
     RateLimitError,
     ValidationError,
 )
+from alarm_broker.core.logging import get_logger, request_id_var
 from alarm_broker.core.metrics import record_http_request
+from alarm_broker.core.redis_proto import as_pingable
 from alarm_broker.db.engine import create_async_engine_from_url
 from alarm_broker.db.session import create_sessionmaker
 from alarm_broker.settings import Settings, get_settings
+from alarm_broker.worker.serialization import deserialize_job, serialize_job
 
-logger = logging.getLogger("alarm_broker")
+logger = get_logger("alarm_broker")
 
 
 def _lifespan(
@@ -46,15 +48,22 @@ def _lifespan(
         if injected_engine is not None:
             engine = injected_engine
         else:
-            engine = create_async_engine_from_url(resolved_settings.database_url)
+            engine = create_async_engine_from_url(
+                resolved_settings.database_url,
+                pool_size=resolved_settings.db_pool_size,
+                max_overflow=resolved_settings.db_max_overflow,
+                pool_recycle=resolved_settings.db_pool_recycle_seconds,
+            )
         app.state.engine = engine
         app.state.sessionmaker = create_sessionmaker(engine)
 
         if injected_redis is not None:
-            app.state.redis = injected_redis
+            app.state.redis = as_pingable(injected_redis)
         else:
             app.state.redis = await create_pool(
-                RedisSettings.from_dsn(str(resolved_settings.redis_url))
+                RedisSettings.from_dsn(str(resolved_settings.redis_url)),
+                job_serializer=serialize_job,
+                job_deserializer=deserialize_job,
             )
 
         try:
@@ -75,17 +84,38 @@ def _install_observability_middleware(app: FastAPI) -> None:
         start = time.perf_counter()
         request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
         request.state.request_id = request_id
-
+        # Every record logged while handling this request carries its id
+        context_token = request_id_var.set(request_id)
         try:
-            response = await call_next(request)
-        except Exception:
+            try:
+                response = await call_next(request)
+            except Exception:
+                duration_ms = int((time.perf_counter() - start) * 1000)
+                logger.exception(
+                    "request_failed",
+                    extra={
+                        "route": request.url.path,
+                        "status_code": 500,
+                        "latency_ms": duration_ms,
+                        "alarm_id": getattr(request.state, "alarm_id", None),
+                    },
+                )
+                record_http_request(
+                    method=request.method,
+                    route=request.url.path,
+                    status_code=500,
+                    duration_ms=duration_ms,
+                )
+                raise
+
             duration_ms = int((time.perf_counter() - start) * 1000)
-            logger.exception(
-                "request_failed",
+            response.headers["X-Request-ID"] = request_id
+
+            logger.info(
+                "request_completed",
                 extra={
-                    "request_id": request_id,
                     "route": request.url.path,
-                    "status_code": 500,
+                    "status_code": response.status_code,
                     "latency_ms": duration_ms,
                     "alarm_id": getattr(request.state, "alarm_id", None),
                 },
@@ -93,32 +123,13 @@ def _install_observability_middleware(app: FastAPI) -> None:
             record_http_request(
                 method=request.method,
                 route=request.url.path,
-                status_code=500,
+                status_code=response.status_code,
                 duration_ms=duration_ms,
             )
-            raise
 
-        duration_ms = int((time.perf_counter() - start) * 1000)
-        response.headers["X-Request-ID"] = request_id
-
-        logger.info(
-            "request_completed",
-            extra={
-                "request_id": request_id,
-                "route": request.url.path,
-                "status_code": response.status_code,
-                "latency_ms": duration_ms,
-                "alarm_id": getattr(request.state, "alarm_id", None),
-            },
-        )
-        record_http_request(
-            method=request.method,
-            route=request.url.path,
-            status_code=response.status_code,
-            duration_ms=duration_ms,
-        )
-
-        return response
+            return response
+        finally:
+            request_id_var.reset(context_token)
 
 
 def _install_security_headers_middleware(app: FastAPI) -> None:
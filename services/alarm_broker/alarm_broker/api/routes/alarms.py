@@ -2,22 +2,22 @@ from __future__ import annotations
 
 import csv
 import io
-import json
 import logging
 import uuid
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from enum import StrEnum
 from typing import Any, TypeVar
 
-from arq.connections import ArqRedis
+import orjson
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy import and_, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from alarm_broker.api.deps import get_redis, get_session, require_admin
+from alarm_broker.api.deps import get_redis, get_session, get_sessionmaker, require_admin
 from alarm_broker.api.schemas import (
+    ALARM_LIST_ADAPTER,
     AckIn,
     AlarmNoteIn,
     AlarmNoteOut,
@@ -48,64 +48,22 @@ logger = logging.getLogger("alarm_broker")
 
 T = TypeVar("T")
 
+# Output field names, serialized straight from ORM rows on list endpoints
+_ALARM_OUT_FIELDS = tuple(AlarmOut.model_fields)
+_NOTE_OUT_FIELDS = tuple(AlarmNoteOut.model_fields)
 
-async def _execute_bulk_operation(
-    session: AsyncSession,
-    redis: ArqRedis,
-    alarm_ids: list[uuid.UUID],
-    process_alarm: Callable[[Alarm], Coroutine[Any, Any, bool]],
-    after_change: Callable[[Alarm], Coroutine[Any, Any, None]] | None = None,
-) -> BulkOperationOut:
-    """Execute a bulk operation on alarms with common pattern.
 
-    Args:
-        session: Database session
-        redis: Redis connection
-        alarm_ids: List of alarm IDs to process
-        process_alarm: Async function to process each alarm, returns True if changed
-        after_change: Optional async function called after each successful change
+def _json_rows_response(rows: Sequence[Any], fields: tuple[str, ...]) -> Response:
+    """Encode trusted DB rows as a JSON array in a single orjson pass.
 
-    Returns:
-        BulkOperationOut with counts
+    The response models stay declared on the routes for the OpenAPI schema;
+    OPT_UTC_Z keeps UTC timestamps identical to pydantic's output.
     """
-    alarms = (await session.scalars(select(Alarm).where(Alarm.id.in_(alarm_ids)))).all()
-    by_id = {alarm.id: alarm for alarm in alarms}
-
-    changed = 0
-    unchanged = 0
-    missing: list[uuid.UUID] = []
-
-    for alarm_id in alarm_ids:
-        alarm = by_id.get(alarm_id)
-        if alarm is None:
-            missing.append(alarm_id)
-            continue
-
-        try:
-            was_changed = await process_alarm(alarm)
-        except HTTPException as exc:
-            if exc.status_code == status.HTTP_409_CONFLICT:
-                unchanged += 1
-                continue
-            raise
-        except ConflictError:
-            # ConflictError is raised by acknowledge_alarm when alarm is not in TRIGGERED status
-            unchanged += 1
-            continue
-
-        if was_changed:
-            changed += 1
-            if after_change:
-                await after_change(alarm)
-        else:
-            unchanged += 1
-
-    return BulkOperationOut(
-        requested=len(alarm_ids),
-        changed=changed,
-        unchanged=unchanged,
-        missing=missing,
+    body = orjson.dumps(
+        [{field: getattr(row, field) for field in fields} for row in rows],
+        option=orjson.OPT_UTC_Z,
     )
+    return Response(content=body, media_type="application/json")
 
 
 class SortOrder(StrEnum):
@@ -182,9 +140,62 @@ def _apply_alarm_filters(
     return stmt
 
 
+async def _apply_cursor_and_sort(
+    stmt,
+    session: AsyncSession,
+    cursor: uuid.UUID | None,
+    sort_by: SortField,
+    sort_order: SortOrder,
+):
+    """Apply keyset cursor pagination and ordering to an alarm query.
+
+    Args:
+        stmt: SQLAlchemy select statement
+        session: Database session used to resolve the cursor alarm
+        cursor: Pagination cursor (alarm ID)
+        sort_by: Field to sort by
+        sort_order: Sort order (asc or desc)
+
+    Returns:
+        Updated select statement with cursor condition and ordering applied
+    """
+    # Apply cursor pagination
+    if cursor is not None:
+        cursor_alarm = await session.get(Alarm, cursor)
+        if cursor_alarm:
+            if sort_order == SortOrder.DESC:
+                stmt = stmt.where(
+                    or_(
+                        Alarm.created_at < cursor_alarm.created_at,
+                        and_(
+                            Alarm.created_at == cursor_alarm.created_at,
+                            Alarm.id < cursor_alarm.id,
+                        ),
+                    )
+                )
+            else:
+                stmt = stmt.where(
+                    or_(
+                        Alarm.created_at > cursor_alarm.created_at,
+                        and_(
+                            Alarm.created_at == cursor_alarm.created_at,
+                            Alarm.id > cursor_alarm.id,
+                        ),
+                    )
+                )
+
+    # Apply sorting
+    sort_column = getattr(Alarm, sort_by.value)
+    if sort_order == SortOrder.DESC:
+        stmt = stmt.order_by(sort_column.desc(), Alarm.id.desc())
+    else:
+        stmt = stmt.order_by(sort_column.asc(), Alarm.id.asc())
+
+    return stmt
+
+
 @router.get("", response_model=list[AlarmOut])
 async def list_alarms(
-    response: Response,
     # Filtering
     status: AlarmStatus | None = None,
     severity: str | None = None,
@@ -203,11 +214,10 @@ async def list_alarms(
     sort_by: SortField = SortField.CREATED_AT,
     sort_order: SortOrder = SortOrder.DESC,
     session: AsyncSession = Depends(get_session),
-) -> list[AlarmOut]:
+) -> Response:
     """List alarms with filtering, pagination, and sorting.
 
     Args:
-        response: FastAPI response for setting headers
         status: Filter by alarm status
         severity: Filter by severity level
         person_id: Filter by person ID
@@ -242,37 +252,7 @@ async def list_alarms(
         created_before=created_before,
     )
 
-    # Apply cursor pagination
-    if cursor is not None:
-        cursor_alarm = await session.get(Alarm, cursor)
-        if cursor_alarm:
-            if sort_order == SortOrder.DESC:
-                stmt = stmt.where(
-                    or_(
-                        Alarm.created_at < cursor_alarm.created_at,
-                        and_(
-                            Alarm.created_at == cursor_alarm.created_at,
-                            Alarm.id < cursor_alarm.id,
-                        ),
-                    )
-                )
-            else:
-                stmt = stmt.where(
-                    or_(
-                        Alarm.created_at > cursor_alarm.created_at,
-                        and_(
-                            Alarm.created_at == cursor_alarm.created_at,
-                            Alarm.id > cursor_alarm.id,
-                        ),
-                    )
-                )
-
-    # Apply sorting
-    sort_column = getattr(Alarm, sort_by.value)
-    if sort_order == SortOrder.DESC:
-        stmt = stmt.order_by(sort_column.desc(), Alarm.id.desc())
-    else:
-        stmt = stmt.order_by(sort_column.asc(), Alarm.id.asc())
+    stmt = await _apply_cursor_and_sort(stmt, session, cursor, sort_by, sort_order)
 
     # Apply limit
     stmt = stmt.limit(limit + 1)
@@ -280,10 +260,66 @@ async def list_alarms(
 
     has_more = len(alarms) > limit
     page = alarms[:limit]
+    response = _json_rows_response(page, _ALARM_OUT_FIELDS)
     if has_more and page:
         response.headers["X-Next-Cursor"] = str(page[-1].id)
 
-    return [AlarmOut.model_validate(alarm, from_attributes=True) for alarm in page]
+    return response
+
+
+@router.get(".ndjson")
+async def stream_alarms_ndjson(
+    # Filtering
+    status: AlarmStatus | None = None,
+    severity: str | None = None,
+    person_id: str | None = None,
+    room_id: str | None = None,
+    site_id: str | None = None,
+    device_id: str | None = None,
+    source: str | None = None,
+    # Date range filtering
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    # Pagination
+    limit: int = Query(default=1000, ge=1, le=10000),
+    cursor: uuid.UUID | None = None,
+    # Sorting
+    sort_by: SortField = SortField.CREATED_AT,
+    sort_order: SortOrder = SortOrder.DESC,
+    sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
+) -> StreamingResponse:
+    """Stream alarms as newline-delimited JSON.
+
+    Accepts the same filters as the list endpoint, but writes each row as
+    soon as it is read from the database cursor instead of buffering the
+    whole page. To fetch the next page, pass the ID of the last row as
+    ``cursor``.
+
+    Returns:
+        StreamingResponse with one AlarmOut JSON object per line
+    """
+    stmt = _apply_alarm_filters(
+        select(Alarm),
+        status=status,
+        severity=severity,
+        person_id=person_id,
+        room_id=room_id,
+        site_id=site_id,
+        device_id=device_id,
+        source=source,
+        created_after=created_after,
+        created_before=created_before,
+    )
+
+    async def rows() -> AsyncIterator[bytes]:
+        # The session lives inside the generator so it stays open while streaming
+        async with sessionmaker() as session:
+            query = await _apply_cursor_and_sort(stmt, session, cursor, sort_by, sort_order)
+            result = await session.stream_scalars(query.limit(limit))
+            async for alarm in result:
+                yield AlarmOut.from_orm_fast(alarm).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
 
 
 @router.get("/export")
@@ -347,11 +383,8 @@ async def export_alarms(
 
     # Export as JSON
     if format == ExportFormat.JSON:
-        data = [
-            AlarmOut.model_validate(alarm, from_attributes=True).model_dump(mode="json")
-            for alarm in alarms
-        ]
-        content = json.dumps(data, indent=2, default=str)
+        items = [AlarmOut.from_orm_fast(alarm) for alarm in alarms]
+        content = ALARM_LIST_ADAPTER.dump_json(items, indent=2)
         media_type = "application/json"
         filename = f"alarms_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
@@ -428,69 +461,89 @@ async def alarm_stats(
     }
 
 
-async def _execute_bulk_state_transition(
-    alarm_ids: list[uuid.UUID],
-    target_status: AlarmStatus,
+async def _bulk_transition(
     request: Request,
     session: AsyncSession,
-    actor_or_acked_by: str | None,
+    alarm_ids: list[uuid.UUID],
+    target_status: AlarmStatus,
+    actor: str | None,
     note: str | None,
-    is_ack: bool = False,
 ) -> BulkOperationOut:
-    """Execute a bulk state transition on alarms.
+    """Transition multiple alarms to ``target_status`` in one commit.
+
+    Acknowledgements go through acknowledge_alarm, all other targets through
+    transition_alarm. Invalid transitions count as unchanged. Events are
+    enqueued only after the commit succeeded.
 
     Args:
-        alarm_ids: List of alarm UUIDs to process
-        target_status: The target AlarmStatus to transition to
         request: FastAPI request object (for Redis)
         session: Database session
-        actor_or_acked_by: Actor or user who triggered the change
+        alarm_ids: List of alarm UUIDs to process
+        target_status: The target AlarmStatus to transition to
+        actor: Actor or user who triggered the change
         note: Optional note for the transition
-        is_ack: If True, use acknowledge_alarm instead of transition_alarm
 
     Returns:
         BulkOperationOut with counts
     """
-    redis = get_redis(request)
+    is_ack = target_status == AlarmStatus.ACKNOWLEDGED
+    alarms = (await session.scalars(select(Alarm).where(Alarm.id.in_(alarm_ids)))).all()
+    by_id = {alarm.id: alarm for alarm in alarms}
 
-    async def process(alarm: Alarm) -> bool:
-        if is_ack:
-            return await acknowledge_alarm(
-                session,
-                alarm,
-                acked_by=actor_or_acked_by,
-                note=note,
-            )
-        return await transition_alarm(
-            session,
-            alarm,
-            target_status=target_status,
-            actor=actor_or_acked_by,
-            note=note,
-        )
+    changed: list[Alarm] = []
+    unchanged = 0
+    missing: list[uuid.UUID] = []
 
-    async def after_change(alarm: Alarm) -> None:
-        if is_ack:
-            await enqueue_alarm_acked_event(
-                redis,
-                alarm_id=alarm.id,
-                acked_by=actor_or_acked_by,
-                note=note,
-                logger=logger,
+    for alarm_id in alarm_ids:
+        alarm = by_id.get(alarm_id)
+        if alarm is None:
+            missing.append(alarm_id)
+            continue
+
+        try:
+            if is_ack:
+                was_changed = await acknowledge_alarm(
+                    session, alarm, acked_by=actor, note=note, commit=False
+                )
+            else:
+                was_changed = await transition_alarm(
+                    session,
+                    alarm,
+                    target_status=target_status,
+                    actor=actor,
+                    note=note,
+                    commit=False,
+                )
+        except HTTPException as exc:
+            if exc.status_code != status.HTTP_409_CONFLICT:
+                raise
+            was_changed = False
+        except ConflictError:
+            # Raised by acknowledge_alarm when the alarm is not TRIGGERED
+            was_changed = False
+
+        if was_changed:
+            changed.append(alarm)
+        else:
+            unchanged += 1
+
+    if changed:
+        await session.commit()
+        redis = get_redis(request)
+        for alarm in changed:
+            if is_ack:
+                await enqueue_alarm_acked_event(
+                    redis, alarm_id=alarm.id, acked_by=actor, note=note, logger=logger
+                )
+            await enqueue_alarm_state_changed_event(
+                redis, alarm_id=alarm.id, state=alarm.status.value, logger=logger
             )
-        await enqueue_alarm_state_changed_event(
-            redis,
-            alarm_id=alarm.id,
-            state=alarm.status.value,
-            logger=logger,
-        )
 
-    return await _execute_bulk_operation(
-        session,
-        redis,
-        alarm_ids,
-        process,
-        after_change,
+    return BulkOperationOut(
+        requested=len(alarm_ids),
+        changed=len(changed),
+        unchanged=unchanged,
+        missing=missing,
     )
 
 
@@ -546,14 +599,8 @@ async def bulk_ack_alarms(
     session: AsyncSession = Depends(get_session),
 ) -> BulkOperationOut:
     """Acknowledge multiple alarms in bulk."""
-    return await _execute_bulk_state_transition(
-        alarm_ids=body.alarm_ids,
-        target_status=AlarmStatus.ACKNOWLEDGED,
-        request=request,
-        session=session,
-        actor_or_acked_by=body.acked_by,
-        note=body.note,
-        is_ack=True,
+    return await _bulk_transition(
+        request, session, body.alarm_ids, AlarmStatus.ACKNOWLEDGED, body.acked_by, body.note
     )
 
 
@@ -564,14 +611,8 @@ async def bulk_resolve_alarms(
     session: AsyncSession = Depends(get_session),
 ) -> BulkOperationOut:
     """Resolve multiple alarms in bulk."""
-    return await _execute_bulk_state_transition(
-        alarm_ids=body.alarm_ids,
-        target_status=AlarmStatus.RESOLVED,
-        request=request,
-        session=session,
-        actor_or_acked_by=body.actor,
-        note=body.note,
-        is_ack=False,
+    return await _bulk_transition(
+        request, session, body.alarm_ids, AlarmStatus.RESOLVED, body.actor, body.note
     )
 
 
@@ -582,14 +623,8 @@ async def bulk_cancel_alarms(
     session: AsyncSession = Depends(get_session),
 ) -> BulkOperationOut:
     """Cancel multiple alarms in bulk."""
-    return await _execute_bulk_state_transition(
-        alarm_ids=body.alarm_ids,
-        target_status=AlarmStatus.CANCELLED,
-        request=request,
-        session=session,
-        actor_or_acked_by=body.actor,
-        note=body.note,
-        is_ack=False,
+    return await _bulk_transition(
+        request, session, body.alarm_ids, AlarmStatus.CANCELLED, body.actor, body.note
     )
 
 
@@ -697,7 +732,7 @@ async def cancel_alarm_api(
 async def list_alarm_notes(
     alarm_id: uuid.UUID,
     session: AsyncSession = Depends(get_session),
-) -> list[AlarmNoteOut]:
+) -> Response:
     """List all notes for an alarm.
 
     Args:
@@ -718,7 +753,7 @@ async def list_alarm_notes(
         )
     ).all()
 
-    return [AlarmNoteOut.model_validate(note, from_attributes=True) for note in notes]
+    return _json_rows_response(notes, _NOTE_OUT_FIELDS)
 
 
 @router.post("/{alarm_id}/notes", response_model=AlarmNoteOut, status_code=status.HTTP_201_CREATED)
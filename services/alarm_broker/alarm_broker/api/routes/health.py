@@ -13,7 +13,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -24,6 +24,8 @@ from alarm_broker.settings import Settings
 
 router = APIRouter()
 
+_PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 # Application start time for uptime tracking
 _start_time = time.time()
 
@@ -66,11 +68,7 @@ async def readyz(
         db_ok = False
 
     try:
-        redis = get_redis(request)
-        if hasattr(redis, "ping"):
-            await redis.ping()
-        elif hasattr(redis, "get"):
-            await redis.get("__readyz__")
+        await get_redis(request).ping()
         redis_ok = True
         details["redis"] = "ok"
     except Exception:
@@ -143,9 +141,9 @@ async def healthz_details(
 @router.get("/metrics")
 async def metrics(
     sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
-) -> PlainTextResponse:
+) -> Response:
     content = await render_prometheus_metrics(sessionmaker)
-    return PlainTextResponse(content=content, media_type="text/plain")
+    return Response(content=content, media_type=_PROMETHEUS_CONTENT_TYPE)
 
 
 async def _check_database(sessionmaker: async_sessionmaker[AsyncSession]) -> dict[str, Any]:
@@ -197,11 +195,7 @@ async def _check_redis(request: Request) -> dict[str, Any]:
     try:
         redis = get_redis(request)
         start = time.time()
-
-        if hasattr(redis, "ping"):
-            await redis.ping()
-        elif hasattr(redis, "get"):
-            await redis.get("__healthz__")
+        await redis.ping()
 
         latency_ms = round((time.time() - start) * 1000, 2)
 
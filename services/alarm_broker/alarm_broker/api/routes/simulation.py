@@ -7,16 +7,22 @@ notifications that were sent during the simulation.
 
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from alarm_broker.api.deps import get_app_settings, require_admin
 from alarm_broker.connectors.mock import MockNotification, get_mock_store
 from alarm_broker.settings import Settings
 
-router = APIRouter(prefix="/v1/simulation", tags=["simulation"])
+router = APIRouter(
+    prefix="/v1/simulation",
+    tags=["simulation"],
+    dependencies=[Depends(require_admin)],
+)
 
 # Bundled simulation seed data path
 _SIMULATION_SEED_PATH = Path(__file__).resolve().parents[5] / "deploy" / "simulation_seed.yaml"
@@ -33,11 +39,12 @@ def _ensure_simulation_enabled(settings: Settings) -> None:
 
 
 def _serialize_notifications(notifications: list[MockNotification]) -> list[dict[str, Any]]:
+    # Timestamps stay datetimes; orjson renders them as ISO 8601 natively.
     return [
         {
             "id": item.id,
             "channel": item.channel,
-            "timestamp": item.timestamp.isoformat(),
+            "timestamp": item.timestamp,
             "payload": item.payload,
             "result": item.result,
             "error": item.error,
@@ -46,11 +53,11 @@ def _serialize_notifications(notifications: list[MockNotification]) -> list[dict
     ]
 
 
-@router.get("/notifications", dependencies=[Depends(require_admin)])
+@router.get("/notifications")
 async def get_simulation_notifications(
     channel: str | None = Query(default=None),
     settings: Settings = Depends(get_app_settings),
-) -> dict[str, Any]:
+) -> Response:
     """Get all notifications sent during simulation mode.
 
     This endpoint is only available in simulation mode. It returns all
@@ -60,7 +67,7 @@ async def get_simulation_notifications(
         channel: Optional filter by channel (zammad, sms, signal)
 
     Returns:
-        Dictionary containing simulation status and notifications
+        JSON response containing simulation status and notifications
 
     Raises:
         HTTPException: If simulation mode is not enabled
@@ -79,15 +86,16 @@ async def get_simulation_notifications(
     else:
         notifications = store.get_all()
 
-    return {
+    body = {
         "simulation_enabled": True,
         "channel_filter": channel,
         "total": len(notifications),
         "notifications": _serialize_notifications(notifications),
     }
+    return Response(content=orjson.dumps(body), media_type="application/json")
 
 
-@router.post("/notifications/clear", dependencies=[Depends(require_admin)])
+@router.post("/notifications/clear")
 async def clear_simulation_notifications(
     response: Response,
     settings: Settings = Depends(get_app_settings),
@@ -112,7 +120,7 @@ async def clear_simulation_notifications(
     return {"status": "ok", "message": "All simulation notifications cleared"}
 
 
-@router.get("/status", dependencies=[Depends(require_admin)])
+@router.get("/status")
 async def get_simulation_status(
     settings: Settings = Depends(get_app_settings),
 ) -> dict[str, Any]:
@@ -128,19 +136,16 @@ async def get_simulation_status(
 
     store = get_mock_store()
     notifications = store.get_all()
+    counts = Counter(n.channel for n in notifications)
 
     return {
         "simulation_enabled": True,
         "total_notifications": len(notifications),
-        "by_channel": {
-            "zammad": len(store.get_by_channel("zammad")),
-            "sms": len(store.get_by_channel("sms")),
-            "signal": len(store.get_by_channel("signal")),
-        },
+        "by_channel": {channel: counts[channel] for channel in ("zammad", "sms", "signal")},
     }
 
 
-@router.post("/seed", dependencies=[Depends(require_admin)])
+@router.post("/seed")
 async def load_simulation_seed(
     settings: Settings = Depends(get_app_settings),
 ) -> dict[str, str]:
@@ -6,6 +6,7 @@ This module provides the endpoint for Yealink phone alarm triggers.
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,13 +16,23 @@ from alarm_broker.api.schemas import TriggerResponse
 from alarm_broker.core.idempotency import bucket_10s
 from alarm_broker.core.ip_allowlist import ip_allowed
 from alarm_broker.core.rate_limit import minute_bucket
-from alarm_broker.services.trigger_service import TriggerService
+from alarm_broker.services.trigger_service import TriggerService, register_trigger_guard
 from alarm_broker.settings import Settings
 
 router = APIRouter()
 logger = logging.getLogger("alarm_broker")
 
 
+def _get_trigger_guard(request: Request, redis: Any) -> Any:
+    """Return the trigger guard script, registering it once per Redis client."""
+    guard = getattr(request.app.state, "trigger_guard", None)
+    if guard is None or getattr(request.app.state, "trigger_guard_redis", None) is not redis:
+        guard = register_trigger_guard(redis)
+        request.app.state.trigger_guard = guard
+        request.app.state.trigger_guard_redis = redis
+    return guard
+
+
 @router.get("/v1/yealink/alarm", response_model=TriggerResponse)
 async def yealink_alarm(
     request: Request,
@@ -83,6 +94,7 @@ async def yealink_alarm(
         settings,
         idempotency_bucket=bucket_10s(),
         rate_limit_bucket=rate_bucket,
+        guard_script=_get_trigger_guard(request, redis),
     )
     result = await trigger.process_trigger(
         token=token,
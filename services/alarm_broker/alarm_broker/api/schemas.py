@@ -5,19 +5,34 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 from alarm_broker.constants import PRIORITY_ALL
 from alarm_broker.db.models import AlarmStatus
 
 
+def _construct_from_row[M: BaseModel](model_cls: type[M], row: Any) -> M:
+    """Build an output model from a trusted ORM row without validation."""
+    values = {name: getattr(row, name) for name in model_cls.model_fields}
+    return model_cls.model_construct(_fields_set=set(values), **values)
+
+
+# Response models are built once and never mutated: freezing them drops the
+# assignment hooks, and unknown attributes are ignored instead of stored.
+_OUTPUT_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 class TriggerResponse(BaseModel):
+    model_config = _OUTPUT_CONFIG
+
     ok: bool = True
     alarm_id: uuid.UUID
     status: AlarmStatus
 
 
 class AlarmOut(BaseModel):
+    model_config = _OUTPUT_CONFIG
+
     id: uuid.UUID
     status: AlarmStatus
     source: str
@@ -39,6 +54,15 @@ class AlarmOut(BaseModel):
     cancelled_by: str | None
     meta: dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def from_orm_fast(cls, row: Any) -> AlarmOut:
+        """Build from a DB row, skipping validation of already typed columns."""
+        return _construct_from_row(cls, row)
+
+
+# Built once: constructing a TypeAdapter compiles a new serializer
+ALARM_LIST_ADAPTER: TypeAdapter[list[AlarmOut]] = TypeAdapter(list[AlarmOut])
+
 
 class AckIn(BaseModel):
     acked_by: str | None = Field(default=None, max_length=120)
@@ -99,7 +123,12 @@ class AlarmNoteOut(BaseModel):
     note: str
     note_type: str
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(**_OUTPUT_CONFIG, from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, row: Any) -> AlarmNoteOut:
+        """Build from a DB row, skipping validation of already typed columns."""
+        return _construct_from_row(cls, row)
 
 
 class BulkAckIn(BaseModel):
@@ -7,17 +7,58 @@ This package provides connectors for various external services:
 - Mock: Simulation mode connectors
 """
 
-from alarm_broker.connectors.base import BaseConnector, BaseConnectorConfig
-from alarm_broker.connectors.mock import (
-    MockNotificationStore,
-    MockSendXmsClient,
-    MockSignalClient,
-    MockZammadClient,
-    get_mock_store,
-)
-from alarm_broker.connectors.sendxms import SendXmsClient, SendXmsConfig, SendXmsConnector
-from alarm_broker.connectors.signal import SignalClient, SignalConfig, SignalConnector
-from alarm_broker.connectors.zammad import ZammadClient, ZammadConfig, ZammadConnector
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from alarm_broker.connectors.base import BaseConnector, BaseConnectorConfig
+    from alarm_broker.connectors.mock import (
+        MockNotificationStore,
+        MockSendXmsClient,
+        MockSignalClient,
+        MockZammadClient,
+        get_mock_store,
+    )
+    from alarm_broker.connectors.sendxms import SendXmsClient, SendXmsConfig, SendXmsConnector
+    from alarm_broker.connectors.signal import SignalClient, SignalConfig, SignalConnector
+    from alarm_broker.connectors.zammad import ZammadClient, ZammadConfig, ZammadConnector
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# the package does not pull in httpx or every connector module.
+_LAZY_EXPORTS: dict[str, str] = {
+    "BaseConnector": "alarm_broker.connectors.base",
+    "BaseConnectorConfig": "alarm_broker.connectors.base",
+    "ZammadConnector": "alarm_broker.connectors.zammad",
+    "ZammadClient": "alarm_broker.connectors.zammad",
+    "ZammadConfig": "alarm_broker.connectors.zammad",
+    "SendXmsConnector": "alarm_broker.connectors.sendxms",
+    "SendXmsClient": "alarm_broker.connectors.sendxms",
+    "SendXmsConfig": "alarm_broker.connectors.sendxms",
+    "SignalConnector": "alarm_broker.connectors.signal",
+    "SignalClient": "alarm_broker.connectors.signal",
+    "SignalConfig": "alarm_broker.connectors.signal",
+    "MockZammadClient": "alarm_broker.connectors.mock",
+    "MockSendXmsClient": "alarm_broker.connectors.mock",
+    "MockSignalClient": "alarm_broker.connectors.mock",
+    "MockNotificationStore": "alarm_broker.connectors.mock",
+    "get_mock_store": "alarm_broker.connectors.mock",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
 
 __all__ = [
     # Base classes
@@ -6,11 +6,204 @@ centralizing retry logic, HTTP client handling, and configuration patterns.
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Protocol
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+
+from alarm_broker.core.errors import CircuitOpenError, ConfigurationError
+
+logger = logging.getLogger("alarm_broker")
+
+# Retry policy: 3 attempts, exponential backoff of 0.5s, 1s (capped at 5s)
+_MAX_ATTEMPTS = 3
+_BACKOFF_BASE_S = 0.5
+_BACKOFF_CAP_S = 5.0
+
+# Default bound for one connector call, retries and backoff included
+DEFAULT_CALL_DEADLINE_S = 4.0
+
+
+# Pool tuning for the single client shared by all connectors
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+_HTTP_TIMEOUT = httpx.Timeout(connect=3.0, read=10.0, write=10.0, pool=5.0)
+
+
+class PooledAsyncClient(Protocol):
+    """Lifecycle contract for clients that run on the shared HTTP pool.
+
+    Connectors borrow the client from :func:`create_http_client` instead of
+    opening connections per call; ``aclose`` releases what the connector
+    itself holds. The pool is closed by its owner after all connectors.
+    """
+
+    async def aclose(self) -> None: ...
+
+
+def create_http_client(transport: str = "httpx") -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all connectors.
+
+    Keep-alive connections are reused across alarms, so TCP/TLS handshakes
+    are not paid per notification. HTTP/2 is enabled when the optional
+    ``h2`` package is installed (``httpx[http2]``).
+
+    Args:
+        transport: ``"httpx"`` for the native transport, or ``"aiohttp"`` to
+            send requests through aiohttp (requires ``httpx-aiohttp``) while
+            keeping the httpx client API
+
+    Returns:
+        Configured async HTTP client; the caller owns and closes it
+
+    Raises:
+        ConfigurationError: If the aiohttp transport is selected but not installed
+    """
+    if transport == "aiohttp":
+        try:
+            from httpx_aiohttp import AiohttpTransport
+        except ImportError as exc:
+            raise ConfigurationError(
+                "CONNECTOR_HTTP_TRANSPORT=aiohttp requires the 'aiohttp' extra"
+            ) from exc
+        return httpx.AsyncClient(transport=AiohttpTransport(), timeout=_HTTP_TIMEOUT)
+
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=_HTTP_LIMITS,
+        timeout=_HTTP_TIMEOUT,
+    )
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Only retry rate limiting, server errors and transport failures.
+
+    Other 4xx responses (bad payload, invalid credentials) will not succeed
+    on a second attempt and are raised immediately.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code == 429 or code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+async def retry_async[T](
+    factory: Callable[[], Awaitable[T]],
+    *,
+    operation: str,
+    max_attempts: int = _MAX_ATTEMPTS,
+    base: float = 1.0,
+    cap: float = 30.0,
+    jitter: float = 0.5,
+    retryable: Callable[[Exception], bool] = _is_retryable,
+) -> T:
+    """Await ``factory()`` and retry transient HTTP failures.
+
+    The one retry loop in the code base: connectors drive it from
+    ``_request_with_retry``, other HTTP calls (webhooks) use it directly.
+    By default 429, 5xx and transport errors are retried with jittered
+    exponential backoff, other errors are raised immediately.
+
+    Args:
+        factory: Creates a fresh awaitable per attempt
+        operation: Name used in retry log records
+        max_attempts: Total attempts including the first one
+        base: Backoff before the first retry, in seconds
+        cap: Upper bound for a single backoff
+        jitter: Up to this fraction is added to each backoff
+        retryable: Decides whether an error is worth another attempt
+
+    Returns:
+        Result of the first successful attempt
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await factory()
+        except httpx.HTTPError as exc:
+            if attempt == max_attempts - 1 or not retryable(exc):
+                raise
+            delay = min(cap, base * 2**attempt) * (1 + random.uniform(0, jitter))
+            logger.warning(
+                "retry_attempt",
+                extra={
+                    "operation": operation,
+                    "attempt": attempt + 1,
+                    "delay_s": round(delay, 2),
+                    "error": str(exc),
+                },
+            )
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+class CircuitBreaker:
+    """Circuit breaker guarding calls to a single backend.
+
+    CLOSED: requests pass; consecutive outage failures are counted.
+    OPEN: requests are rejected until ``reset_timeout`` seconds have passed.
+    HALF_OPEN: a single probe request is let through; success closes the
+    breaker, failure opens it again. A probe that has not reported back
+    within ``reset_timeout`` is replaced by a new one.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, *, threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe request through."""
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state == self.CLOSED:
+            return True
+        if self.retry_after() > 0.0:
+            return False
+        # Restart the clock so a lost probe cannot wedge the breaker half-open
+        self.opened_at = time.monotonic()
+        if self.state == self.OPEN:
+            self._transition(self.HALF_OPEN)
+        return True
+
+    def record_success(self) -> None:
+        self.failure_count = 0
+        if self.state != self.CLOSED:
+            self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        self.failure_count += 1
+        if self.state == self.HALF_OPEN or self.failure_count >= self.threshold:
+            self.opened_at = time.monotonic()
+            if self.state != self.OPEN:
+                self._transition(self.OPEN)
+
+    def _transition(self, state: str) -> None:
+        logger.warning(
+            "circuit_breaker_state_changed",
+            extra={
+                "breaker": self.name,
+                "from_state": self.state,
+                "to_state": state,
+                "failure_count": self.failure_count,
+            },
+        )
+        self.state = state
 
 
 @dataclass(frozen=True)
@@ -21,11 +214,15 @@ class BaseConnectorConfig:
         enabled: Whether the connector is active
         base_url: Base URL for the external service
         api_key: API key for authentication (if applicable)
+        max_concurrency: Maximum in-flight requests to this backend
+        call_deadline_s: Hard deadline for one call, including all retries
     """
 
     enabled: bool = False
     base_url: str = ""
     api_key: str = ""
+    max_concurrency: int = 20
+    call_deadline_s: float = DEFAULT_CALL_DEADLINE_S
 
 
 class BaseConnector:
@@ -33,7 +230,9 @@ class BaseConnector:
 
     Provides common functionality:
     - HTTP client management
-    - Retry logic with exponential backoff
+    - Retry logic with exponential backoff for transient failures
+    - Circuit breaking while the backend is down
+    - Bulkhead limiting concurrent requests per backend
     - Header construction
     - Enabled state checking
     """
@@ -47,6 +246,19 @@ class BaseConnector:
         """
         self._http = http
         self._cfg = config
+        # Configs are frozen, so default headers are built exactly once
+        self._default_headers: Mapping[str, str] = MappingProxyType(self._build_default_headers())
+        self._breaker = CircuitBreaker(config.base_url)
+        # Bulkhead: a slow backend queues its own callers instead of
+        # exhausting the shared HTTP connection pool
+        self._bulkhead = asyncio.Semaphore(config.max_concurrency)
+
+    async def aclose(self) -> None:
+        """Release resources held by the connector.
+
+        The HTTP client is borrowed and stays open; its owner closes it.
+        """
+        return None
 
     def enabled(self) -> bool:
         """Check if the connector is enabled and properly configured.
@@ -56,10 +268,11 @@ class BaseConnector:
         """
         return self._cfg.enabled and bool(self._cfg.base_url)
 
-    def _headers(self) -> dict[str, str]:
+    def _build_default_headers(self) -> dict[str, str]:
         """Build default headers for requests.
 
-        Override this method to add custom headers.
+        Called once from ``__init__``; override this method to add custom
+        headers.
 
         Returns:
             Dictionary of HTTP headers
@@ -69,24 +282,28 @@ class BaseConnector:
             headers["Authorization"] = f"Bearer {self._cfg.api_key}"
         return headers
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, max=5),
-        reraise=True,
-    )
     async def _request_with_retry(
         self,
         method: str,
-        path: str,
+        path: str = "",
         *,
+        url: str | None = None,
         json: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         """Make an HTTP request with retry logic.
 
+        Retries up to three times with exponential backoff on HTTP 429,
+        5xx responses and transport errors. 5xx responses and transport
+        errors also count towards the connector's circuit breaker, as does
+        a call that misses its own deadline or a half-open probe that is
+        cancelled. The whole call, retries and backoff included, is bounded
+        by ``call_deadline_s``.
+
         Args:
             method: HTTP method (GET, POST, PUT, etc.)
             path: URL path (appended to base_url)
+            url: Precomputed absolute URL; takes precedence over ``path``
             json: JSON body for the request
             headers: Additional headers (merged with default headers)
 
@@ -94,68 +311,79 @@ class BaseConnector:
             HTTP response
 
         Raises:
+            CircuitOpenError: If the circuit breaker is open
+            TimeoutError: If the call deadline is exceeded
             httpx.HTTPStatusError: If the response status is not successful
             httpx.RequestError: If the request fails
         """
         if not self.enabled():
             raise RuntimeError("Connector is not enabled")
 
-        url = f"{self._cfg.base_url}{path}"
-        merged_headers = {**self._headers(), **(headers or {})}
+        if url is None:
+            url = f"{self._cfg.base_url}{path}"
+        # Encode once with orjson; Content-Type is part of the default headers
+        content = orjson.dumps(json) if json is not None else None
+        merged_headers = {**self._default_headers, **headers} if headers else self._default_headers
 
-        response = await self._http.request(
-            method,
-            url,
-            json=json,
-            headers=merged_headers,
-        )
-        response.raise_for_status()
-        return response
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, max=5),
-        reraise=True,
-    )
-    async def _post_with_retry(
-        self,
-        path: str,
-        *,
-        json: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
-    ) -> httpx.Response:
-        """Make a POST request with retry logic.
-
-        Args:
-            path: URL path (appended to base_url)
-            json: JSON body for the request
-            headers: Additional headers (merged with default headers)
+        if not self._breaker.allow():
+            raise CircuitOpenError(self._cfg.base_url, self._breaker.retry_after())
+        # Past allow() in HALF_OPEN means this call is the breaker's probe
+        probe = self._breaker.state == CircuitBreaker.HALF_OPEN
 
-        Returns:
-            HTTP response
-        """
-        return await self._request_with_retry("POST", path, json=json, headers=headers)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._cfg.call_deadline_s
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, max=5),
-        reraise=True,
-    )
-    async def _put_with_retry(
-        self,
-        path: str,
-        *,
-        json: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
-    ) -> httpx.Response:
-        """Make a PUT request with retry logic.
+        async def attempt() -> httpx.Response:
+            # Clamp the read timeout so a late retry cannot overshoot the deadline
+            remaining = deadline - loop.time()
+            timeout: Any = (
+                httpx.Timeout(remaining)
+                if remaining < _HTTP_TIMEOUT.read
+                else httpx.USE_CLIENT_DEFAULT
+            )
+            try:
+                async with self._bulkhead:
+                    response = await self._http.request(
+                        method,
+                        url,
+                        content=content,
+                        headers=merged_headers,
+                        timeout=timeout,
+                    )
+            except httpx.TransportError:
+                self._breaker.record_failure()
+                raise
+            # Any answer below 500 means the backend itself is up
+            if response.status_code >= 500:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+            response.raise_for_status()
+            return response
 
-        Args:
-            path: URL path (appended to base_url)
-            json: JSON body for the request
-            headers: Additional headers (merged with default headers)
+        def retryable(exc: Exception) -> bool:
+            # Stop retrying as soon as this call has tripped the breaker
+            return _is_retryable(exc) and self._breaker.state != CircuitBreaker.OPEN
 
-        Returns:
-            HTTP response
-        """
-        return await self._request_with_retry("PUT", path, json=json, headers=headers)
+        call_timeout = asyncio.timeout_at(deadline)
+        try:
+            async with call_timeout:
+                return await retry_async(
+                    attempt,
+                    operation=f"{method} {url}",
+                    base=_BACKOFF_BASE_S,
+                    cap=_BACKOFF_CAP_S,
+                    jitter=0.0,
+                    retryable=retryable,
+                )
+        except TimeoutError:
+            # Only our own deadline says the backend is too slow
+            if call_timeout.expired():
+                self._breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            # Caller-side cancels say nothing about the backend, but a probe
+            # must still settle or the breaker stays half-open
+            if probe and self._breaker.state == CircuitBreaker.HALF_OPEN:
+                self._breaker.record_failure()
+            raise
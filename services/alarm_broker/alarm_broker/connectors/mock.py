@@ -6,45 +6,54 @@ that store all sent notifications for later retrieval and demonstration purposes
 
 from __future__ import annotations
 
+import itertools
 import logging
-import threading
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 logger = logging.getLogger("alarm_broker")
 
+# Oldest notifications are dropped beyond this many
+_MAX_NOTIFICATIONS = 10_000
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MockNotification:
     """Represents a mock notification for demonstration purposes."""
 
     id: str
     channel: str  # zammad, sms, signal
-    timestamp: datetime
+    timestamp_ns: int  # time.time_ns() at creation
     payload: dict[str, Any]
     result: str = "ok"
     error: str | None = None
 
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a naive local datetime, converted on read."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
 
 class MockNotificationStore:
-    """Thread-safe storage for mock notifications.
+    """In-memory storage for mock notifications.
 
-    This store holds all notifications sent through mock connectors
-    during simulation mode, allowing retrieval for demonstration.
+    This store holds the most recent notifications sent through mock
+    connectors during simulation mode, allowing retrieval for demonstration.
+    Notifications are additionally indexed by channel, and IDs come from
+    ``itertools.count`` so concurrent callers never hand out duplicates.
     """
 
-    _instance: MockNotificationStore | None = None
-    _lock = threading.Lock()
+    def __init__(self) -> None:
+        self._reset()
 
-    def __new__(cls) -> MockNotificationStore:
-        """Singleton pattern to ensure one store across the application."""
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._notifications: list[MockNotification] = []
-                cls._instance._ticket_counter = 1000
-            return cls._instance
+    def _reset(self) -> None:
+        self._notifications: deque[MockNotification] = deque(maxlen=_MAX_NOTIFICATIONS)
+        self._by_channel: dict[str, deque[MockNotification]] = {}
+        self._id_counter = itertools.count(1)
+        self._ticket_counter = itertools.count(1001)
 
     def add(
         self,
@@ -62,14 +71,18 @@ class MockNotificationStore:
             error: Error message if result is not ok
         """
         notification = MockNotification(
-            id=f"mock-{len(self._notifications) + 1}",
+            id=f"mock-{next(self._id_counter)}",
             channel=channel,
-            timestamp=datetime.now(),
+            timestamp_ns=time.time_ns(),
             payload=payload,
             result=result,
             error=error,
         )
+        if len(self._notifications) == _MAX_NOTIFICATIONS:
+            # Keep the channel index in step with the bounded main deque
+            self._by_channel[self._notifications[0].channel].popleft()
         self._notifications.append(notification)
+        self._by_channel.setdefault(channel, deque()).append(notification)
         logger.debug(
             "mock_notification_stored",
             extra={"channel": channel, "notification_id": notification.id},
@@ -92,12 +105,11 @@ class MockNotificationStore:
         Returns:
             List of notifications for the specified channel
         """
-        return [n for n in self._notifications if n.channel == channel]
+        return list(self._by_channel.get(channel, ()))
 
     def clear(self) -> None:
         """Clear all stored notifications."""
-        self._notifications.clear()
-        self._ticket_counter = 1000
+        self._reset()
         logger.info("mock_notifications_cleared")
 
     def generate_ticket_id(self) -> int:
@@ -106,11 +118,11 @@ class MockNotificationStore:
         Returns:
             A unique mock ticket ID
         """
-        self._ticket_counter += 1
-        return self._ticket_counter
+        return next(self._ticket_counter)
 
 
 # Global store instance
+# One store per process, shared by all mock connectors via get_mock_store()
 _mock_store = MockNotificationStore()
 
 
@@ -118,7 +130,7 @@ def get_mock_store() -> MockNotificationStore:
     """Get the global mock notification store.
 
     Returns:
-        The singleton MockNotificationStore instance
+        The module-level MockNotificationStore instance
     """
     return _mock_store
 
@@ -193,6 +205,14 @@ class MockZammadClient:
             extra={"ticket_id": ticket_id, "subject": subject},
         )
 
+    async def flush(self) -> None:
+        """Nothing is queued in simulation mode."""
+        return None
+
+    async def aclose(self) -> None:
+        """Nothing to release in simulation mode."""
+        return None
+
 
 # Backward compatibility alias
 MockZammadConnector = MockZammadClient
@@ -238,6 +258,25 @@ class MockSendXmsClient:
         )
         logger.info("mock_sms_sent", extra={"to": to, "message_length": len(message)})
 
+    def bulk_enabled(self) -> bool:
+        """Simulate a provider with a bulk endpoint."""
+        return self._enabled
+
+    async def send_bulk_sms(self, recipients: list[str], message: str) -> list[None]:
+        """Record one mock SMS send per recipient.
+
+        Args:
+            recipients: Recipient phone numbers
+            message: Message content
+        """
+        for to in recipients:
+            await self.send_sms(to, message)
+        return [None] * len(recipients)
+
+    async def aclose(self) -> None:
+        """Nothing to release in simulation mode."""
+        return None
+
 
 # Backward compatibility alias
 MockSendXmsConnector = MockSendXmsClient
@@ -285,6 +324,10 @@ class MockSignalClient:
             extra={"group_id": group_id, "message_length": len(message)},
         )
 
+    async def aclose(self) -> None:
+        """Nothing to release in simulation mode."""
+        return None
+
 
 # Backward compatibility alias
 MockSignalConnector = MockSignalClient
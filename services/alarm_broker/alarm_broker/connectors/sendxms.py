@@ -6,11 +6,13 @@ for sending alarm notifications via SMS.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import httpx
 
 from alarm_broker.connectors.base import BaseConnector, BaseConnectorConfig
+from alarm_broker.core.errors import ConfigurationError
 
 
 @dataclass(frozen=True)
@@ -23,6 +25,10 @@ class SendXmsConfig(BaseConnectorConfig):
         api_key: API key for authentication
         from_name: Sender name/number for SMS
         send_path: API endpoint path for sending messages
+        bulk_send_path: API endpoint path for one message to many
+            recipients; empty to send one request per recipient
+        bulk_recipients_field: Body field carrying the recipient list on
+            bulk sends; see :meth:`SendXmsConnector.send_bulk_sms`
     """
 
     enabled: bool = False
@@ -30,6 +36,8 @@ class SendXmsConfig(BaseConnectorConfig):
     api_key: str = ""
     from_name: str = "Notfall"
     send_path: str = "/send"
+    bulk_send_path: str = ""
+    bulk_recipients_field: str = "to"
 
 
 class SendXmsConnector(BaseConnector):
@@ -62,11 +70,53 @@ class SendXmsConnector(BaseConnector):
             return
 
         payload = {"to": to, "message": message, "from": self._sms_cfg.from_name}
-        await self._post_with_retry(
-            self._sms_cfg.send_path,
-            json=payload,
-            headers={"Authorization": f"Bearer {self._sms_cfg.api_key}"},
-        )
+        # The Bearer header is part of the precomputed connector defaults
+        await self._request_with_retry("POST", self._sms_cfg.send_path, json=payload)
+
+    def bulk_enabled(self) -> bool:
+        """Check whether one request can carry many recipients.
+
+        Returns:
+            True if the connector is enabled and has a bulk endpoint
+        """
+        return self.enabled() and bool(self._sms_cfg.bulk_send_path)
+
+    async def send_bulk_sms(
+        self, recipients: Sequence[str], message: str
+    ) -> list[BaseException | None]:
+        """Send the same SMS message to several recipients.
+
+        One POST to ``bulk_send_path`` with the body of :meth:`send_sms`,
+        except that ``bulk_recipients_field`` (default ``"to"``) holds a JSON
+        array of all recipients. There is no standard SendXMS bulk contract:
+        point this at a gateway that accepts that shape, or rename the field
+        to match it. Only call this when :meth:`bulk_enabled` is true.
+
+        Args:
+            recipients: Recipient phone numbers
+            message: Message content
+
+        Returns:
+            One entry per recipient, in order: None if sent, else the error
+
+        Raises:
+            ConfigurationError: If no bulk endpoint is configured
+        """
+        if not self._sms_cfg.enabled or not recipients:
+            return [None] * len(recipients)
+        if not self._sms_cfg.bulk_send_path:
+            raise ConfigurationError("SENDXMS_BULK_SEND_PATH is not configured")
+
+        payload = {
+            "message": message,
+            "from": self._sms_cfg.from_name,
+            self._sms_cfg.bulk_recipients_field: list(recipients),
+        }
+        try:
+            await self._request_with_retry("POST", self._sms_cfg.bulk_send_path, json=payload)
+        except Exception as exc:
+            return [exc] * len(recipients)
+        return [None] * len(recipients)
 
 
 # Backward compatibility alias
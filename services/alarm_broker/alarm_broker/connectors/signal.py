@@ -67,7 +67,7 @@ class SignalConnector(BaseConnector):
 
         gid = group_id or self._signal_cfg.target_group_id
         payload = {"message": message, "groupId": gid}
-        await self._post_with_retry(self._signal_cfg.send_path, json=payload)
+        await self._request_with_retry("POST", self._signal_cfg.send_path, json=payload)
 
 
 # Backward compatibility alias
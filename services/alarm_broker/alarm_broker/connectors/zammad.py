@@ -6,12 +6,22 @@ and updating tickets related to alarm events.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
 
 from alarm_broker.connectors.base import BaseConnector, BaseConnectorConfig
+from alarm_broker.core.errors import ConnectorError
+
+# Internal notes for the same ticket arriving within this window are sent
+# as one PUT, with at most _NOTE_BATCH_MAX notes per request.
+_NOTE_BATCH_WINDOW_S = 0.25
+_NOTE_BATCH_MAX = 32
+
+_PendingNote = tuple[str, str, "asyncio.Future[None]"]
 
 
 @dataclass(frozen=True)
@@ -39,7 +49,8 @@ class ZammadConnector(BaseConnector):
     """Connector for Zammad helpdesk integration.
 
     Provides methods for creating tickets and adding internal notes
-    for alarm events.
+    for alarm events. Concurrent notes for the same ticket are coalesced
+    into a single update request.
     """
 
     def __init__(self, http: httpx.AsyncClient, config: ZammadConfig) -> None:
@@ -49,8 +60,13 @@ class ZammadConnector(BaseConnector):
             http: Async HTTP client instance
             config: Zammad configuration
         """
-        super().__init__(http, config)
         self._zammad_cfg = config
+        super().__init__(http, config)
+        self._pending_notes: dict[int, list[_PendingNote]] = {}
+        self._flusher: asyncio.Task[None] | None = None
+        # Endpoint URLs are fixed per config; only the ticket id varies
+        self._tickets_url = f"{config.base_url}/api/v1/tickets"
+        self._ticket_url_tmpl = self._tickets_url + "/%d"
 
     def enabled(self) -> bool:
         """Check if Zammad integration is enabled.
@@ -60,13 +76,16 @@ class ZammadConnector(BaseConnector):
         """
         return bool(self._zammad_cfg.api_token and self._zammad_cfg.base_url)
 
-    def _headers(self) -> dict[str, str]:
+    def _build_default_headers(self) -> dict[str, str]:
         """Build headers for Zammad API requests.
 
         Returns:
-            Dictionary with Authorization header
+            Dictionary with Content-Type and Authorization headers
         """
-        return {"Authorization": f"Bearer {self._zammad_cfg.api_token}"}
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._zammad_cfg.api_token}",
+        }
 
     async def create_ticket(self, payload: dict[str, Any]) -> int:
         """Create a new ticket in Zammad.
@@ -81,8 +100,8 @@ class ZammadConnector(BaseConnector):
             RuntimeError: If response doesn't contain a valid ticket ID
             httpx.HTTPStatusError: If the API request fails
         """
-        resp = await self._post_with_retry("/api/v1/tickets", json=payload)
-        data = resp.json()
+        resp = await self._request_with_retry("POST", url=self._tickets_url, json=payload)
+        data = orjson.loads(resp.content)
         ticket_id = data.get("id")
         if not isinstance(ticket_id, int):
             raise RuntimeError("Zammad response missing ticket id")
@@ -91,6 +110,10 @@ class ZammadConnector(BaseConnector):
     async def add_internal_note(self, ticket_id: int, subject: str, body: str) -> None:
         """Add an internal note to an existing ticket.
 
+        The note is queued for a short window so that notes for the same
+        ticket can share one request; this call returns once that request
+        has completed.
+
         Args:
             ticket_id: ID of the ticket to update
             subject: Note subject
@@ -98,16 +121,91 @@ class ZammadConnector(BaseConnector):
 
         Raises:
             httpx.HTTPStatusError: If the API request fails
+            ConnectorError: If the flush was cancelled before the note was sent
         """
-        payload = {
-            "article": {
-                "subject": subject,
-                "body": body,
-                "type": "note",
-                "internal": True,
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        note = (subject, body, future)
+        queue = self._pending_notes.setdefault(ticket_id, [])
+        queue.append(note)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_after_window())
+            self._flusher.add_done_callback(self._on_flusher_done)
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A cancelled caller's note must not be sent after all
+            if note in queue:
+                queue.remove(note)
+                if not queue and self._pending_notes.get(ticket_id) is queue:
+                    del self._pending_notes[ticket_id]
+            raise
+
+    async def flush(self) -> None:
+        """Send all queued internal notes immediately."""
+        pending, self._pending_notes = self._pending_notes, {}
+        try:
+            await asyncio.gather(
+                *(self._put_notes(ticket_id, notes) for ticket_id, notes in pending.items())
+            )
+        finally:
+            # Cancelled mid-flush: no caller may keep waiting for an unsent note
+            _abandon(pending)
+
+    async def aclose(self) -> None:
+        """Send queued internal notes before shutdown."""
+        await self.flush()
+
+    async def _flush_after_window(self) -> None:
+        # Notes queued while a flush is in flight see this task still running
+        # and start no flusher of their own, so keep going until none are left
+        while self._pending_notes:
+            await asyncio.sleep(_NOTE_BATCH_WINDOW_S)
+            await self.flush()
+
+    def _on_flusher_done(self, task: asyncio.Task[None]) -> None:
+        # A flusher cancelled before it could flush (possibly before it even
+        # started) leaves its queue behind; unless a newer flusher took over,
+        # fail those notes instead of letting their callers wait forever
+        if task.cancelled() and task is self._flusher:
+            pending, self._pending_notes = self._pending_notes, {}
+            _abandon(pending)
+
+    async def _put_notes(self, ticket_id: int, notes: list[_PendingNote]) -> None:
+        # Skip notes whose caller was cancelled after the queue was taken
+        notes = [note for note in notes if not note[2].done()]
+        for start in range(0, len(notes), _NOTE_BATCH_MAX):
+            batch = notes[start : start + _NOTE_BATCH_MAX]
+            subjects = list(dict.fromkeys(subject for subject, _, _ in batch))
+            payload = {
+                "article": {
+                    "subject": " / ".join(subjects),
+                    "body": "\n\n".join(body for _, body, _ in batch),
+                    "type": "note",
+                    "internal": True,
+                }
             }
-        }
-        await self._put_with_retry(f"/api/v1/tickets/{ticket_id}", json=payload)
+            try:
+                await self._request_with_retry(
+                    "PUT", url=self._ticket_url_tmpl % ticket_id, json=payload
+                )
+            except Exception as exc:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+
+
+def _abandon(pending: dict[int, list[_PendingNote]]) -> None:
+    """Fail every queued note that was not sent."""
+    for ticket_id, notes in pending.items():
+        for _, _, future in notes:
+            if not future.done():
+                future.set_exception(
+                    ConnectorError("zammad", "add_internal_note", details={"ticket_id": ticket_id})
+                )
 
 
 # Backward compatibility alias
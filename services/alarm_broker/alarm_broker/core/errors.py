@@ -16,6 +16,8 @@ class AlarmBrokerError(Exception):
     consistent error handling and logging.
     """
 
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
         """Initialize the exception.
 
@@ -46,7 +48,7 @@ class ConfigurationError(AlarmBrokerError):
     administrator intervention.
     """
 
-    pass
+    __slots__ = ()
 
 
 class ValidationError(AlarmBrokerError):
@@ -55,6 +57,8 @@ class ValidationError(AlarmBrokerError):
     This error indicates client-provided data is invalid.
     """
 
+    __slots__ = ("field",)
+
     def __init__(
         self,
         message: str,
@@ -82,6 +86,8 @@ class ValidationError(AlarmBrokerError):
 class NotFoundError(AlarmBrokerError):
     """Raised when a requested resource is not found."""
 
+    __slots__ = ("resource_type", "resource_id")
+
     def __init__(
         self,
         resource_type: str,
@@ -111,16 +117,20 @@ class ConflictError(AlarmBrokerError):
         - Duplicate resource creation
     """
 
-    pass
+    __slots__ = ()
 
 
 class ConnectorError(AlarmBrokerError):
     """Raised when an external service request fails.
 
     This error wraps failures from external integrations like
-    Zammad, SMS providers, or Signal.
+    Zammad, SMS providers, or Signal. The message is only formatted when
+    it is first read, so errors that are caught and discarded never pay
+    for stringifying the original error.
     """
 
+    __slots__ = ("connector", "operation", "original_error", "_message")
+
     def __init__(
         self,
         connector: str,
@@ -133,21 +143,70 @@ class ConnectorError(AlarmBrokerError):
         Args:
             connector: Name of the connector (e.g., "zammad", "signal")
             operation: Operation that failed (e.g., "create_ticket")
-            original_error: Original exception that caused the failure
+            original_error: Original exception that caused the failure;
+                its traceback is cleared
             details: Optional additional error details
         """
-        message = f"{connector} error during {operation}"
-        if original_error:
-            message = f"{message}: {original_error}"
-        super().__init__(message, details)
+        # Bypass AlarmBrokerError.__init__, which needs the formatted message
+        Exception.__init__(self, connector, operation)
         self.connector = connector
         self.operation = operation
-        self.original_error = original_error
+        # Keep the error but drop its traceback: the frames (and their locals)
+        # would otherwise stay alive for as long as this error is referenced
+        self.original_error = (
+            original_error.with_traceback(None) if original_error is not None else None
+        )
+        self._message: str | None = None
+        self.details = details or {}
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            message = f"{self.connector} error during {self.operation}"
+            if self.original_error:
+                message = f"{message}: {self.original_error}"
+            self._message = message
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class CircuitOpenError(ConnectorError):
+    """Raised when a connector's circuit breaker rejects a request.
+
+    The backend failed repeatedly; calls are short-circuited without
+    contacting it until the breaker's reset timeout has elapsed.
+    """
+
+    __slots__ = ("retry_after_seconds",)
+
+    def __init__(self, connector: str, retry_after_seconds: float) -> None:
+        """Initialize the circuit open error.
+
+        Args:
+            connector: Name of the connector (e.g., its base URL)
+            retry_after_seconds: Time until the breaker allows a probe request
+        """
+        super().__init__(
+            connector,
+            "request",
+            details={"retry_after_seconds": round(retry_after_seconds, 1)},
+        )
+        self.message = f"{connector} circuit open"
+        self.args = (self.message,)
+        self.retry_after_seconds = retry_after_seconds
 
 
 class RateLimitError(AlarmBrokerError):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ("limit", "window_seconds")
+
     def __init__(
         self,
         limit: int,
@@ -170,7 +229,7 @@ class RateLimitError(AlarmBrokerError):
 class AuthenticationError(AlarmBrokerError):
     """Raised when authentication fails."""
 
-    pass
+    __slots__ = ()
 
 
 class AuthorizationError(AlarmBrokerError):
@@ -180,10 +239,10 @@ class AuthorizationError(AlarmBrokerError):
     permission for the requested operation.
     """
 
-    pass
+    __slots__ = ()
 
 
 class IdempotencyError(AlarmBrokerError):
     """Raised when idempotency check fails."""
 
-    pass
+    __slots__ = ()
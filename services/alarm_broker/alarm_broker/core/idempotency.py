@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import time
+from functools import lru_cache
 
 
 def bucket_10s(now_epoch_seconds: int | None = None) -> int:
@@ -10,6 +11,14 @@ def bucket_10s(now_epoch_seconds: int | None = None) -> int:
     return now_epoch_seconds // 10
 
 
+@lru_cache(maxsize=1024)
+def _token_hasher(token: str) -> hashlib.blake2b:
+    """Hasher that has already absorbed ``token:``; callers must ``copy()`` it."""
+    return hashlib.blake2b(token.encode() + b":", digest_size=16)
+
+
 def idempotency_key(token: str, bucket: int) -> str:
-    raw = f"{token}:{bucket}".encode()
-    return hashlib.sha256(raw).hexdigest()
+    # Opaque cache key, not a MAC: BLAKE2b is cheaper than SHA-256 on short input
+    hasher = _token_hasher(token).copy()
+    hasher.update(bucket.to_bytes(8, "big"))
+    return hasher.hexdigest()
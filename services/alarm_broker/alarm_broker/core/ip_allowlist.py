@@ -1,14 +1,29 @@
 from __future__ import annotations
 
 import ipaddress
+from bisect import bisect_right
+from collections import OrderedDict
 from functools import lru_cache
 
+# Per IP version: sorted, non-overlapping (first_addresses, last_addresses) as ints.
+_Ranges = tuple[tuple[int, ...], tuple[int, ...]]
+
+
+# Compiled allowlists are evicted oldest-first once they hold more ranges than this
+_MAX_CACHED_RANGES = 4096
+_compiled_cache: OrderedDict[str, dict[int, _Ranges]] = OrderedDict()
+_compiled_sizes: dict[str, int] = {}
+_cached_ranges = 0
+
 
 @lru_cache(maxsize=32)
+def _split_allowlist(allowlist: str) -> tuple[str, ...]:
+    return tuple(s.strip() for s in allowlist.split(",") if s.strip())
+
+
 def _parse_allowlist(allowlist: str) -> list[ipaddress.IPv4Network | ipaddress.IPv6Network]:
-    items = [s.strip() for s in allowlist.split(",") if s.strip()]
     networks: list[ipaddress.IPv4Network | ipaddress.IPv6Network] = []
-    for item in items:
+    for item in _split_allowlist(allowlist):
         if "/" in item:
             networks.append(ipaddress.ip_network(item, strict=False))
         else:
@@ -18,16 +33,73 @@ def _parse_allowlist(allowlist: str) -> list[ipaddress.IPv4Network | ipaddress.I
     return networks
 
 
+def _compile_allowlist(allowlist: str) -> dict[int, _Ranges]:
+    """Collapse the allowlist into sorted address ranges for bisect lookups.
+
+    Results are kept in an LRU bounded by the total number of cached ranges
+    rather than by entry count, so a few huge allowlists cannot pin memory.
+    """
+    global _cached_ranges
+    compiled = _compiled_cache.get(allowlist)
+    if compiled is not None:
+        _compiled_cache.move_to_end(allowlist)
+        return compiled
+
+    networks = _parse_allowlist(allowlist)
+    compiled = {}
+    for version in (4, 6):
+        collapsed = list(ipaddress.collapse_addresses(n for n in networks if n.version == version))
+        compiled[version] = (
+            tuple(int(n.network_address) for n in collapsed),
+            tuple(int(n.broadcast_address) for n in collapsed),
+        )
+
+    size = len(compiled[4][0]) + len(compiled[6][0])
+    _compiled_cache[allowlist] = compiled
+    _compiled_sizes[allowlist] = size
+    _cached_ranges += size
+    # Always keep the newest entry, even if it alone exceeds the budget
+    while _cached_ranges > _MAX_CACHED_RANGES and len(_compiled_cache) > 1:
+        evicted, _ = _compiled_cache.popitem(last=False)
+        _cached_ranges -= _compiled_sizes.pop(evicted)
+    return compiled
+
+
+def clear_cache() -> None:
+    """Drop all cached allowlist and client IP parses, e.g. after a config reload."""
+    global _cached_ranges
+    _compiled_cache.clear()
+    _compiled_sizes.clear()
+    _cached_ranges = 0
+    _split_allowlist.cache_clear()
+    _parse_client_ip.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _parse_client_ip(ip: str) -> tuple[int, int] | None:
+    """Parse a client IP into ``(version, int)``; ``None`` if invalid.
+
+    The same few source IPs (phones, proxies) recur, so parsing is cached.
+    """
+    try:
+        addr = ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+    return addr.version, int(addr)
+
+
 def ip_allowed(ip: str, allowlist: str) -> bool:
     if not allowlist.strip():
         return True
+    parsed = _parse_client_ip(ip)
+    if parsed is None:
+        return False
     try:
-        addr = ipaddress.ip_address(ip)
-        networks = _parse_allowlist(allowlist)
+        compiled = _compile_allowlist(allowlist)
     except ValueError:
         return False
 
-    for net in networks:
-        if addr in net:
-            return True
-    return False
+    version, value = parsed
+    firsts, lasts = compiled[version]
+    idx = bisect_right(firsts, value) - 1
+    return idx >= 0 and value <= lasts[idx]
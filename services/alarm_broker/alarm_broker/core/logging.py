@@ -9,12 +9,65 @@ This module provides structured logging configuration with support for:
 
 from __future__ import annotations
 
-import json
+import atexit
+import copy
 import logging
+import queue
 import sys
+from contextvars import ContextVar
 from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+import orjson
+
+# Extras may carry non-string keys; unknown values are stringified via default=str
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Per-request context, attached to every record by ContextFilter
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+alarm_id_var: ContextVar[str | None] = ContextVar("alarm_id", default=None)
+
+_iso_second = -1
+_iso_prefix = ""
+
+
+def _iso_timestamp(created: float) -> str:
+    """Format an epoch timestamp like ``datetime.isoformat()`` in UTC.
+
+    The date/time part is rebuilt only when the second changes.
+    """
+    global _iso_second, _iso_prefix
+    second = int(created)
+    if second != _iso_second:
+        _iso_prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_second = second
+    micros = int((created - second) * 1_000_000)
+    return f"{_iso_prefix}.{micros:06d}+00:00"
+
+
+class ContextFilter(logging.Filter):
+    """Copy ``request_id``/``alarm_id`` from context variables onto records.
+
+    Call sites no longer need to pass them via ``extra``; explicit ``extra``
+    values still win. Filters run in the logging thread of the caller, which
+    is what makes the context variables visible here.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            request_id = request_id_var.get()
+            if request_id is not None:
+                record.request_id = request_id
+        if not hasattr(record, "alarm_id"):
+            alarm_id = alarm_id_var.get()
+            if alarm_id is not None:
+                record.alarm_id = alarm_id
+        return True
+
+
+_CONTEXT_FILTER = ContextFilter()
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON structured log formatter.
@@ -47,7 +100,7 @@ class StructuredFormatter(logging.Formatter):
         }
 
         if self.include_timestamp:
-            log_data["timestamp"] = datetime.now(UTC).isoformat()
+            log_data["timestamp"] = _iso_timestamp(record.created)
 
         if self.include_level:
             log_data["level"] = record.levelname
@@ -74,7 +127,7 @@ class StructuredFormatter(logging.Formatter):
         # Add location info
         log_data["location"] = f"{record.filename}:{record.lineno}"
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str, option=_JSON_OPTIONS).decode()
 
 
 class HumanReadableFormatter(logging.Formatter):
@@ -92,6 +145,14 @@ class HumanReadableFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._level_prefixes = {
+            level: f"{color}{level:8}{self.RESET}" for level, color in self.COLORS.items()
+        }
+        self._stamp_second = -1
+        self._stamp = ""
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record for human reading.
 
@@ -101,9 +162,14 @@ class HumanReadableFormatter(logging.Formatter):
         Returns:
             Human readable log string
         """
-        timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
-        color = self.COLORS.get(record.levelname, "")
-        level = f"{color}{record.levelname:8}{self.RESET}"
+        second = int(record.created)
+        if second != self._stamp_second:
+            self._stamp = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%d %H:%M:%S")
+            self._stamp_second = second
+        timestamp = self._stamp
+        level = self._level_prefixes.get(record.levelname)
+        if level is None:
+            level = f"{record.levelname:8}{self.RESET}"
 
         # Base message
         parts = [f"[{timestamp}] {level} {record.name}: {record.getMessage()}"]
@@ -128,6 +194,36 @@ class HumanReadableFormatter(logging.Formatter):
         return "\n".join(parts)
 
 
+class _RecordQueueHandler(QueueHandler):
+    """Queue handler that keeps ``exc_info`` for the listener's formatter.
+
+    The stdlib ``prepare`` pre-formats the record and drops ``exc_info``,
+    which would fold tracebacks into the message instead of the
+    ``exception`` field. Only the %-arguments are resolved here, since they
+    may be mutated after the call returns.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def configure_logging(
     level: str = "INFO",
     json_format: bool = False,
@@ -139,7 +235,13 @@ def configure_logging(
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: Use JSON structured logging
         loggers: Additional loggers to configure
+
+    Records are handed to a background thread through a queue, so a slow
+    stdout pipe never blocks the event loop on ``write()``.
     """
+    global _listener, _queue_handler
+    _stop_listener()
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -159,7 +261,13 @@ def configure_logging(
         formatter = HumanReadableFormatter()
 
     handler.setFormatter(formatter)
-    root_logger.addHandler(handler)
+
+    previous_queue_handler = _queue_handler
+    _queue_handler = _RecordQueueHandler(queue.SimpleQueue())
+    _queue_handler.setLevel(level)
+    _listener = QueueListener(_queue_handler.queue, handler, respect_handler_level=True)
+    _listener.start()
+    root_logger.addHandler(_queue_handler)
 
     # Configure specific loggers
     loggers_to_configure = ["alarm_broker", "uvicorn", "sqlalchemy"]
@@ -171,16 +279,23 @@ def configure_logging(
         logger.setLevel(level)
         # Don't propagate to root to avoid duplicate logs
         logger.propagate = False
-        logger.addHandler(handler)
+        if previous_queue_handler is not None:
+            logger.removeHandler(previous_queue_handler)
+        logger.addHandler(_queue_handler)
 
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name.
 
+    The logger carries the request context filter, so records pick up the
+    current ``request_id``/``alarm_id`` without per-call ``extra`` dicts.
+
     Args:
         name: Logger name (usually __name__)
 
     Returns:
         Configured logger instance
     """
-    return logging.getLogger(name)
+    logger = logging.getLogger(name)
+    logger.addFilter(_CONTEXT_FILTER)
+    return logger
@@ -1,111 +1,156 @@
 from __future__ import annotations
 
+import time
 from collections import Counter
-from threading import Lock
+from functools import lru_cache
+from types import MappingProxyType
 
-from sqlalchemy import func, select
+from sqlalchemy import String, cast, func, literal, null, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from alarm_broker.db.models import Alarm, AlarmNotification, AlarmStatus
 
-_lock = Lock()
-_http_requests_total: Counter[tuple[str, str, str]] = Counter()
-_http_request_duration_ms_total: Counter[tuple[str, str, str]] = Counter()
+# Only incremented from event-loop code, never from worker threads, so the
+# counters below need no lock
 _events_total: Counter[str] = Counter()
 
+# (method, route, status_code) -> (request count, total duration in ms)
+_http_totals: dict[tuple[str, str, str], tuple[int, int]] = {}
+
+# Buffered HTTP samples are folded into the totals in batches
+_FLUSH_BATCH = 256
+_FLUSH_INTERVAL_S = 0.05
+_http_pending: list[tuple[tuple[str, str, str], int]] = []
+_http_flushed_at = time.monotonic()
+
+
+def _flush_http() -> None:
+    global _http_flushed_at
+    for key, duration in _http_pending:
+        count, total = _http_totals.get(key, (0, 0))
+        _http_totals[key] = (count + 1, total + duration)
+    _http_pending.clear()
+    _http_flushed_at = time.monotonic()
+
 
 def record_http_request(*, method: str, route: str, status_code: int, duration_ms: int) -> None:
     key = (method.upper(), route, str(status_code))
-    with _lock:
-        _http_requests_total[key] += 1
-        _http_request_duration_ms_total[key] += max(0, int(duration_ms))
+    _http_pending.append((key, max(0, int(duration_ms))))
+    if (
+        len(_http_pending) >= _FLUSH_BATCH
+        or time.monotonic() - _http_flushed_at >= _FLUSH_INTERVAL_S
+    ):
+        _flush_http()
 
 
 def record_event(event: str) -> None:
-    with _lock:
-        _events_total[event] += 1
+    _events_total[event] += 1
+
+
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
 
 
 def _escape(value: str) -> str:
-    return value.replace("\\", "\\\\").replace('"', '\\"')
+    return value.translate(_ESCAPE_TABLE)
 
 
+# Bounded on purpose: routes are raw request paths and may embed ids or tokens
+@lru_cache(maxsize=4096)
 def _http_labels(method: str, route: str, status_code: str) -> str:
     return (
         f'method="{_escape(method)}",route="{_escape(route)}",status_code="{_escape(status_code)}"'
     )
 
 
-async def _alarm_counts(session: AsyncSession) -> dict[str, int]:
-    rows = (
-        await session.execute(select(Alarm.status, func.count(Alarm.id)).group_by(Alarm.status))
-    ).all()
-    counts = {status.value: 0 for status in AlarmStatus}
-    for status, count in rows:
-        counts[status.value] = int(count)
-    return counts
-
-
-async def _notification_counts(session: AsyncSession) -> list[tuple[str, str, int]]:
-    rows = (
-        await session.execute(
-            select(
-                AlarmNotification.channel,
-                func.coalesce(AlarmNotification.result, "unknown"),
-                func.count(AlarmNotification.id),
-            ).group_by(AlarmNotification.channel, AlarmNotification.result)
-        )
-    ).all()
-    return [(str(channel), str(result), int(count)) for channel, result, count in rows]
+# Built once; SQLAlchemy's compiled cache then reuses the compiled form per scrape
+_DB_COUNTS_STMT = union_all(
+    select(
+        literal("status", String),
+        cast(Alarm.status, String),
+        cast(null(), String),
+        func.count(Alarm.id),
+    ).group_by(Alarm.status),
+    select(
+        literal("notification", String),
+        AlarmNotification.channel,
+        func.coalesce(AlarmNotification.result, "unknown"),
+        func.count(AlarmNotification.id),
+    ).group_by(AlarmNotification.channel, AlarmNotification.result),
+)
 
 
-async def render_prometheus_metrics(
-    sessionmaker: async_sessionmaker[AsyncSession],
-) -> str:
-    lines: list[str] = []
+# Every status is exported, including those without any alarms
+_ZERO_STATUS_COUNTS = MappingProxyType({status.value: 0 for status in AlarmStatus})
+
+
+async def _db_counts(
+    session: AsyncSession,
+) -> tuple[dict[str, int], list[tuple[str, str, int]]]:
+    """Fetch alarm and notification aggregates in one round-trip.
+
+    Rows are tagged with their kind and split client-side.
+    """
+    rows = (await session.execute(_DB_COUNTS_STMT)).all()
 
-    lines.append("# HELP alarm_broker_http_requests_total Total number of HTTP requests.")
-    lines.append("# TYPE alarm_broker_http_requests_total counter")
-    with _lock:
-        http_requests_snapshot = dict(_http_requests_total)
-        http_duration_snapshot = dict(_http_request_duration_ms_total)
-        events_snapshot = dict(_events_total)
+    counts = dict(_ZERO_STATUS_COUNTS)
+    notifications: list[tuple[str, str, int]] = []
+    for kind, key, result, count in rows:
+        if kind == "status":
+            counts[key] = int(count)
+        else:
+            notifications.append((str(key), str(result), int(count)))
+    return counts, notifications
 
-    for (method, route, status_code), value in sorted(http_requests_snapshot.items()):
+
+async def render_prometheus_metrics(
+    sessionmaker: async_sessionmaker[AsyncSession],
+) -> bytes:
+    """Render all metrics in the Prometheus text exposition format (UTF-8)."""
+    out = bytearray()
+    write = out.extend
+
+    # Scrapes never see stale counts, so no background flush is needed
+    _flush_http()
+    http_snapshot = sorted(_http_totals.items())
+    events_snapshot = dict(_events_total)
+
+    write(b"# HELP alarm_broker_http_requests_total Total number of HTTP requests.\n")
+    write(b"# TYPE alarm_broker_http_requests_total counter\n")
+    for (method, route, status_code), (count, _total) in http_snapshot:
         labels = _http_labels(method, route, status_code)
-        lines.append(f"alarm_broker_http_requests_total{{{labels}}} {value}")
+        write(f"alarm_broker_http_requests_total{{{labels}}} {count}\n".encode())
 
-    lines.append(
-        "# HELP alarm_broker_http_request_duration_ms_total Total request duration in milliseconds."
+    write(
+        b"# HELP alarm_broker_http_request_duration_ms_total"
+        b" Total request duration in milliseconds.\n"
     )
-    lines.append("# TYPE alarm_broker_http_request_duration_ms_total counter")
-    for (method, route, status_code), value in sorted(http_duration_snapshot.items()):
+    write(b"# TYPE alarm_broker_http_request_duration_ms_total counter\n")
+    for (method, route, status_code), (_count, total) in http_snapshot:
         labels = _http_labels(method, route, status_code)
-        lines.append(f"alarm_broker_http_request_duration_ms_total{{{labels}}} {value}")
+        write(f"alarm_broker_http_request_duration_ms_total{{{labels}}} {total}\n".encode())
 
-    lines.append("# HELP alarm_broker_events_total Total number of internal events.")
-    lines.append("# TYPE alarm_broker_events_total counter")
+    write(b"# HELP alarm_broker_events_total Total number of internal events.\n")
+    write(b"# TYPE alarm_broker_events_total counter\n")
     for event, value in sorted(events_snapshot.items()):
-        lines.append(f'alarm_broker_events_total{{event="{_escape(event)}"}} {value}')
+        write(f'alarm_broker_events_total{{event="{_escape(event)}"}} {value}\n'.encode())
 
     async with sessionmaker() as session:
-        by_status = await _alarm_counts(session)
-        by_notification = await _notification_counts(session)
+        by_status, by_notification = await _db_counts(session)
 
-    lines.append("# HELP alarm_broker_alarms_by_status Number of alarms by status.")
-    lines.append("# TYPE alarm_broker_alarms_by_status gauge")
+    write(b"# HELP alarm_broker_alarms_by_status Number of alarms by status.\n")
+    write(b"# TYPE alarm_broker_alarms_by_status gauge\n")
     for state, count in sorted(by_status.items()):
-        lines.append(f'alarm_broker_alarms_by_status{{status="{_escape(state)}"}} {count}')
+        write(f'alarm_broker_alarms_by_status{{status="{_escape(state)}"}} {count}\n'.encode())
 
-    lines.append(
-        "# HELP alarm_broker_notifications_total Notification attempts grouped by channel/result."
+    write(
+        b"# HELP alarm_broker_notifications_total"
+        b" Notification attempts grouped by channel/result.\n"
     )
-    lines.append("# TYPE alarm_broker_notifications_total counter")
+    write(b"# TYPE alarm_broker_notifications_total counter\n")
     for channel, result, count in by_notification:
-        lines.append(
+        write(
             "alarm_broker_notifications_total"
-            f'{{channel="{_escape(channel)}",result="{_escape(result)}"}} {count}'
+            f'{{channel="{_escape(channel)}",result="{_escape(result)}"}} {count}\n'.encode()
         )
 
-    lines.append("")
-    return "\n".join(lines)
+    return bytes(out)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import time
+from functools import lru_cache
 
 
 def minute_bucket(now_epoch_seconds: int | None = None) -> int:
@@ -10,6 +11,10 @@ def minute_bucket(now_epoch_seconds: int | None = None) -> int:
     return now_epoch_seconds // 60
 
 
+@lru_cache(maxsize=1024)
+def _token_hash(token: str) -> str:
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
 def rate_limit_key(token: str, bucket: int) -> str:
-    token_hash = hashlib.sha256(token.encode()).hexdigest()
-    return f"rl:{token_hash}:{bucket}"
+    return f"rl:{_token_hash(token)}:{bucket}"
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class PingableRedis(Protocol):
+    """Minimal Redis surface required by health and readiness probes."""
+
+    async def ping(self) -> Any: ...
+
+
+class _GetPingAdapter:
+    """Adapt clients without ``ping`` by probing with a ``GET`` instead.
+
+    All other attributes are delegated to the wrapped client.
+    """
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    async def ping(self) -> Any:
+        return await self._client.get("__ping__")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+def as_pingable(client: Any) -> PingableRedis:
+    """Return ``client`` unchanged if it supports ``ping``, otherwise wrap it."""
+    if isinstance(client, PingableRedis):
+        return client
+    return _GetPingAdapter(client)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import String, cast, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.sqltypes import JSON
+
+
+class json_set_key(FunctionElement[Any]):  # noqa: N801 - SQL function naming
+    """``column`` with one top-level key set, merged by the database.
+
+    Only the key and value travel over the wire; the stored document is
+    never loaded into Python. Compiled per dialect because the schema uses
+    the generic ``JSON`` type (``json`` on PostgreSQL, text on SQLite).
+
+    Usage:
+        update(Alarm).values(meta=json_set_key(Alarm.meta, "ack_note", note))
+    """
+
+    type = JSON()
+    inherit_cache = True
+    name = "json_set_key"
+
+    def __init__(self, column: Any, key: str, value: str) -> None:
+        # Typed binds: asyncpg cannot infer parameter types inside jsonb_build_object
+        super().__init__(column, cast(literal(key), String), cast(literal(value), String))
+
+
+@compiles(json_set_key)
+def _compile_json_set_key(element: json_set_key, compiler: Any, **kw: Any) -> str:
+    column, key, value = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"json_set({column}, '$.' || {key}, {value})"
+
+
+@compiles(json_set_key, "postgresql")
+def _compile_json_set_key_pg(element: json_set_key, compiler: Any, **kw: Any) -> str:
+    column, key, value = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"CAST(CAST({column} AS JSONB) || jsonb_build_object({key}, {value}) AS JSON)"
@@ -4,8 +4,9 @@ import os
 import re
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from alarm_broker.db.models import (
     Device,
@@ -16,28 +17,32 @@ from alarm_broker.db.models import (
     Room,
     Site,
 )
+from alarm_broker.services.enrichment_service import invalidate as invalidate_enrichment
 from alarm_broker.settings import Settings
 
 _ENV_PATTERN = re.compile(r"^\$\{([A-Z0-9_]+)\}$")
 _TRUE_VALUES = {"1", "true", "yes", "on"}
 _FALSE_VALUES = {"0", "false", "no", "off"}
+_BOOL_VALUES = {**dict.fromkeys(_TRUE_VALUES, True), **dict.fromkeys(_FALSE_VALUES, False)}
 
 
 def _coerce_bool(value: Any) -> bool:
-    if isinstance(value, bool):
+    # Seed flags are almost always real bools already
+    value_type = type(value)
+    if value_type is bool:
         return value
-    if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in _TRUE_VALUES:
-            return True
-        if lowered in _FALSE_VALUES:
-            return False
+    if value_type is str:
+        return _BOOL_VALUES.get(value.strip().lower(), bool(value))
     return bool(value)
 
 
 def _expand_env(value: Any, settings: Settings) -> Any:
     if isinstance(value, str):
-        m = _ENV_PATTERN.match(value.strip())
+        stripped = value.strip()
+        # Almost no seed string is a ${VAR} reference; skip the regex for those
+        if not (stripped.startswith("${") and stripped.endswith("}")):
+            return value
+        m = _ENV_PATTERN.match(stripped)
         if not m:
             return value
         key = m.group(1)
@@ -48,11 +53,9 @@ def _expand_env(value: Any, settings: Settings) -> Any:
             env_val = str(getattr(settings, settings_key, "")) or None
         if env_val is None:
             return None
-        lowered = env_val.strip().lower()
-        if lowered in _TRUE_VALUES:
-            return True
-        if lowered in _FALSE_VALUES:
-            return False
+        as_bool = _BOOL_VALUES.get(env_val.strip().lower())
+        if as_bool is not None:
+            return as_bool
         if env_val.isdigit():
             return int(env_val)
         return env_val
@@ -63,69 +66,98 @@ def _expand_env(value: Any, settings: Settings) -> Any:
     return value
 
 
+async def _load_existing[T](
+    session: AsyncSession, model: type[T], key: InstrumentedAttribute[Any], values: list[Any]
+) -> dict[Any, T]:
+    """Load all rows whose ``key`` is in ``values`` with a single IN query."""
+    if not values:
+        return {}
+    rows = await session.scalars(select(model).where(key.in_(values)))
+    return {getattr(row, key.key): row for row in rows}
+
+
+async def _insert_new(
+    session: AsyncSession, model: type[Any], rows: dict[Any, dict[str, Any]]
+) -> None:
+    """Insert brand-new seed rows in one executemany batch."""
+    if rows:
+        await session.execute(insert(model), list(rows.values()))
+
+
 async def apply_seed(session: AsyncSession, raw: dict[str, Any], settings: Settings) -> None:
     data = _expand_env(raw or {}, settings)
 
-    for s in data.get("sites", []) or []:
-        obj = await session.get(Site, s["id"])
+    sites = data.get("sites", []) or []
+    existing_sites = await _load_existing(session, Site, Site.id, [s["id"] for s in sites])
+    new_sites: dict[Any, dict[str, Any]] = {}
+    for s in sites:
+        obj = existing_sites.get(s["id"])
         if not obj:
-            session.add(Site(id=s["id"], name=s["name"]))
+            new_sites[s["id"]] = {"id": s["id"], "name": s["name"]}
         else:
             obj.name = s["name"]
+    await _insert_new(session, Site, new_sites)
 
-    for r in data.get("rooms", []) or []:
-        obj = await session.get(Room, r["id"])
+    rooms = data.get("rooms", []) or []
+    existing_rooms = await _load_existing(session, Room, Room.id, [r["id"] for r in rooms])
+    new_rooms: dict[Any, dict[str, Any]] = {}
+    for r in rooms:
+        obj = existing_rooms.get(r["id"])
         if not obj:
-            session.add(
-                Room(
-                    id=r["id"],
-                    site_id=r["site_id"],
-                    label=r["label"],
-                    floor=r.get("floor"),
-                    notes=r.get("notes"),
-                )
-            )
+            new_rooms[r["id"]] = {
+                "id": r["id"],
+                "site_id": r["site_id"],
+                "label": r["label"],
+                "floor": r.get("floor"),
+                "notes": r.get("notes"),
+            }
         else:
             obj.site_id = r["site_id"]
             obj.label = r["label"]
             obj.floor = r.get("floor")
             obj.notes = r.get("notes")
+    await _insert_new(session, Room, new_rooms)
 
-    for p in data.get("persons", []) or []:
-        obj = await session.get(Person, p["id"])
+    persons = data.get("persons", []) or []
+    existing_persons = await _load_existing(session, Person, Person.id, [p["id"] for p in persons])
+    new_persons: dict[Any, dict[str, Any]] = {}
+    for p in persons:
+        obj = existing_persons.get(p["id"])
         if not obj:
-            session.add(
-                Person(
-                    id=p["id"],
-                    display_name=p["display_name"],
-                    role=p.get("role"),
-                    phone_mobile=p.get("phone_mobile"),
-                    phone_ext=p.get("phone_ext"),
-                    active=_coerce_bool(p.get("active", True)),
-                )
-            )
+            new_persons[p["id"]] = {
+                "id": p["id"],
+                "display_name": p["display_name"],
+                "role": p.get("role"),
+                "phone_mobile": p.get("phone_mobile"),
+                "phone_ext": p.get("phone_ext"),
+                "active": _coerce_bool(p.get("active", True)),
+            }
         else:
             obj.display_name = p["display_name"]
             obj.role = p.get("role")
             obj.phone_mobile = p.get("phone_mobile")
             obj.phone_ext = p.get("phone_ext")
             obj.active = _coerce_bool(p.get("active", True))
-
-    for d in data.get("devices", []) or []:
-        obj = await session.scalar(select(Device).where(Device.device_token == d["device_token"]))
+    await _insert_new(session, Person, new_persons)
+
+    devices = data.get("devices", []) or []
+    existing_devices = await _load_existing(
+        session, Device, Device.device_token, [d["device_token"] for d in devices]
+    )
+    new_devices: dict[Any, dict[str, Any]] = {}
+    for d in devices:
+        obj = existing_devices.get(d["device_token"])
         if not obj:
-            session.add(
-                Device(
-                    id=d["id"],
-                    vendor=d.get("vendor", "yealink"),
-                    model_family=d.get("model_family", "T5"),
-                    mac=d.get("mac"),
-                    account_ext=d.get("account_ext"),
-                    device_token=d["device_token"],
-                    person_id=d.get("person_id"),
-                    room_id=d.get("room_id"),
-                )
-            )
+            new_devices[d["device_token"]] = {
+                "id": d["id"],
+                "vendor": d.get("vendor", "yealink"),
+                "model_family": d.get("model_family", "T5"),
+                "mac": d.get("mac"),
+                "account_ext": d.get("account_ext"),
+                "device_token": d["device_token"],
+                "person_id": d.get("person_id"),
+                "room_id": d.get("room_id"),
+            }
         else:
             obj.id = d.get("id", obj.id)
             obj.vendor = d.get("vendor", obj.vendor)
@@ -134,6 +166,7 @@ async def apply_seed(session: AsyncSession, raw: dict[str, Any], settings: Setti
             obj.account_ext = d.get("account_ext")
             obj.person_id = d.get("person_id")
             obj.room_id = d.get("room_id")
+    await _insert_new(session, Device, new_devices)
 
     policy = data.get("escalation_policy")
     if policy:
@@ -145,44 +178,48 @@ async def apply_seed(session: AsyncSession, raw: dict[str, Any], settings: Setti
         else:
             obj.name = policy.get("name", obj.name)
 
-    for t in data.get("escalation_targets", []) or []:
-        obj = await session.get(EscalationTarget, t["id"])
+    targets = data.get("escalation_targets", []) or []
+    existing_targets = await _load_existing(
+        session, EscalationTarget, EscalationTarget.id, [t["id"] for t in targets]
+    )
+    new_targets: dict[Any, dict[str, Any]] = {}
+    for t in targets:
+        obj = existing_targets.get(t["id"])
         if not obj:
-            session.add(
-                EscalationTarget(
-                    id=t["id"],
-                    label=t["label"],
-                    channel=t["channel"],
-                    address=t["address"],
-                    enabled=_coerce_bool(t.get("enabled", True)),
-                )
-            )
+            new_targets[t["id"]] = {
+                "id": t["id"],
+                "label": t["label"],
+                "channel": t["channel"],
+                "address": t["address"],
+                "enabled": _coerce_bool(t.get("enabled", True)),
+            }
         else:
             obj.label = t["label"]
             obj.channel = t["channel"]
             obj.address = t["address"]
             obj.enabled = _coerce_bool(t.get("enabled", True))
+    await _insert_new(session, EscalationTarget, new_targets)
 
     # Replace steps for policies included in the seed
     steps = data.get("escalation_steps", []) or []
     if steps:
         policy_ids = sorted({s["policy_id"] for s in steps})
-        for pid in policy_ids:
-            existing = await session.scalars(
-                select(EscalationStep).where(EscalationStep.policy_id == pid)
-            )
-            for row in existing:
-                await session.delete(row)
-
-        for s in steps:
-            for target_id in s.get("target_ids") or []:
-                session.add(
-                    EscalationStep(
-                        policy_id=s["policy_id"],
-                        step_no=int(s["step_no"]),
-                        after_seconds=int(s["after_seconds"]),
-                        target_id=target_id,
-                    )
-                )
+        await session.execute(
+            delete(EscalationStep).where(EscalationStep.policy_id.in_(policy_ids))
+        )
+        step_rows = [
+            {
+                "policy_id": s["policy_id"],
+                "step_no": int(s["step_no"]),
+                "after_seconds": int(s["after_seconds"]),
+                "target_id": target_id,
+            }
+            for s in steps
+            for target_id in s.get("target_ids") or []
+        ]
+        if step_rows:
+            await session.execute(insert(EscalationStep), step_rows)
 
     await session.commit()
+    # Persons, rooms and sites may have been renamed
+    invalidate_enrichment()
@@ -1,49 +1,49 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from html import escape
 from pathlib import Path
-from string import Template
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 from alarm_broker.db.models import Alarm, AlarmStatus
 
-_TEMPLATE = Template(
-    Path(__file__)
-    .resolve()
-    .parents[1]
-    .joinpath("api", "templates", "ack.html")
-    .read_text(encoding="utf-8")
-)
-
-
-def render_ack_page(alarm: Alarm, enriched: dict[str, Any]) -> str:
-    person = escape(str(enriched.get("person_name") or (alarm.person_id or "-")), quote=True)
-    room = escape(str(enriched.get("room_label") or (alarm.room_id or "-")), quote=True)
-    created = escape(alarm.created_at.isoformat(), quote=True)
-    status_label = escape(alarm.status.value, quote=True)
-
-    is_triggered = alarm.status == AlarmStatus.TRIGGERED
-    status_descriptions = {
-        AlarmStatus.TRIGGERED: "Der Alarm ist neu und wartet auf Übernahme.",
-        AlarmStatus.ACKNOWLEDGED: "Der Alarm wurde übernommen und wird bearbeitet.",
-        AlarmStatus.RESOLVED: "Der Alarm wurde erfolgreich abgeschlossen.",
-        AlarmStatus.CANCELLED: "Der Alarm wurde storniert.",
+# Static German texts, HTML-escaped once at import
+_STATUS_DESCRIPTIONS = MappingProxyType(
+    {
+        status: escape(text, quote=True)
+        for status, text in {
+            AlarmStatus.TRIGGERED: "Der Alarm ist neu und wartet auf Übernahme.",
+            AlarmStatus.ACKNOWLEDGED: "Der Alarm wurde übernommen und wird bearbeitet.",
+            AlarmStatus.RESOLVED: "Der Alarm wurde erfolgreich abgeschlossen.",
+            AlarmStatus.CANCELLED: "Der Alarm wurde storniert.",
+        }.items()
     }
-    info_messages = {
-        AlarmStatus.TRIGGERED: "Bitte quittiere den Alarm, wenn du die Übernahme bestätigst.",
-        AlarmStatus.ACKNOWLEDGED: "Dieser Alarm wurde bereits bestätigt.",
-        AlarmStatus.RESOLVED: "Dieser Alarm ist bereits gelöst.",
-        AlarmStatus.CANCELLED: "Dieser Alarm wurde storniert.",
+)
+_INFO_MESSAGES = MappingProxyType(
+    {
+        status: escape(text, quote=True)
+        for status, text in {
+            AlarmStatus.TRIGGERED: "Bitte quittiere den Alarm, wenn du die Übernahme bestätigst.",
+            AlarmStatus.ACKNOWLEDGED: "Dieser Alarm wurde bereits bestätigt.",
+            AlarmStatus.RESOLVED: "Dieser Alarm ist bereits gelöst.",
+            AlarmStatus.CANCELLED: "Dieser Alarm wurde storniert.",
+        }.items()
     }
-    info_classes = {
+)
+_INFO_CLASSES = MappingProxyType(
+    {
         AlarmStatus.TRIGGERED: "warning",
         AlarmStatus.ACKNOWLEDGED: "success",
         AlarmStatus.RESOLVED: "success",
         AlarmStatus.CANCELLED: "",
     }
+)
+_DEFAULT_STATUS_DESCRIPTION = "Alarmstatus"
+_DEFAULT_INFO_MESSAGE = escape("Dieser Alarm wurde bereits bearbeitet.", quote=True)
 
-    form_block = (
-        """
+_FORM_TRIGGERED: Final[str] = """
     <form method=\"post\" onsubmit=\"return lockSubmit(this)\">
       <label for=\"acked_by\">Dein Name (optional)
         <input id=\"acked_by\" name=\"acked_by\" autocomplete=\"name\">
@@ -55,24 +55,77 @@ def render_ack_page(alarm: Alarm, enriched: dict[str, Any]) -> str:
       <p class=\"hint\">Die Seite aktualisiert nach dem Absenden automatisch.</p>
     </form>
 """
-        if is_triggered
-        else ""
+_FORM_EMPTY: Final[str] = ""
+
+# Template fields that only depend on whether the alarm still awaits an ACK
+_FIELDS_TRIGGERED = MappingProxyType(
+    {
+        "title": "Alarm übernehmen",
+        "headline": "Alarm übernehmen",
+        "status_color": "#b45309",
+        "form_block": _FORM_TRIGGERED,
+    }
+)
+_FIELDS_DEFAULT = MappingProxyType(
+    {
+        "title": "Alarm",
+        "headline": "Alarm",
+        "status_color": "#047857",
+        "form_block": _FORM_EMPTY,
+    }
+)
+
+
+# ``${name}`` placeholders after literal braces have been doubled
+_PLACEHOLDER = re.compile(r"\$\{\{(\w+)\}\}")
+
+
+@lru_cache(maxsize=1)
+def _template() -> str:
+    """Load the ACK page template on first render instead of at import.
+
+    The file uses ``string.Template`` syntax; it is converted once into a
+    ``str.format_map`` template so rendering needs no regex pass.
+    """
+    text = (
+        Path(__file__)
+        .resolve()
+        .parents[1]
+        .joinpath("api", "templates", "ack.html")
+        .read_text(encoding="utf-8")
     )
+    text = text.replace("$$", "$").replace("{", "{{").replace("}", "}}")
+    return _PLACEHOLDER.sub(r"{\1}", text)
+
+
+def render_ack_page(alarm: Alarm, enriched: dict[str, Any]) -> str:
+    return _render_cached(
+        alarm.status,
+        str(enriched.get("person_name") or (alarm.person_id or "-")),
+        str(enriched.get("room_label") or (alarm.room_id or "-")),
+        alarm.created_at.isoformat(),
+    )
+
+
+# The page is a pure function of these inputs; responders reloading the ACK
+# link hit the cache. Status is part of the key, so transitions re-render.
+@lru_cache(maxsize=512)
+def _render_cached(status: AlarmStatus, person_raw: str, room_raw: str, created_raw: str) -> str:
+    person = escape(person_raw, quote=True)
+    room = escape(room_raw, quote=True)
+    created = escape(created_raw, quote=True)
+    status_label = escape(status.value, quote=True)
 
-    return _TEMPLATE.substitute(
-        title="Alarm übernehmen" if is_triggered else "Alarm",
-        headline="Alarm übernehmen" if is_triggered else "Alarm",
-        status_label=status_label,
-        status_color="#b45309" if is_triggered else "#047857",
-        status_badge_class=escape(alarm.status.value, quote=True),
-        status_description=escape(status_descriptions.get(alarm.status, "Alarmstatus"), quote=True),
-        person=person,
-        room=room,
-        created=created,
-        info_class=escape(info_classes.get(alarm.status, ""), quote=True),
-        info_message=escape(
-            info_messages.get(alarm.status, "Dieser Alarm wurde bereits bearbeitet."),
-            quote=True,
-        ),
-        form_block=form_block,
+    return _template().format_map(
+        {
+            **(_FIELDS_TRIGGERED if status == AlarmStatus.TRIGGERED else _FIELDS_DEFAULT),
+            "status_label": status_label,
+            "status_badge_class": escape(status.value, quote=True),
+            "status_description": _STATUS_DESCRIPTIONS.get(status, _DEFAULT_STATUS_DESCRIPTION),
+            "person": person,
+            "room": room,
+            "created": created,
+            "info_class": _INFO_CLASSES.get(status, ""),
+            "info_message": _INFO_MESSAGES.get(status, _DEFAULT_INFO_MESSAGE),
+        }
     )
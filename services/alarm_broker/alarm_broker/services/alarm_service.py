@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import uuid
 from datetime import UTC, datetime
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from alarm_broker.db.models import Alarm, AlarmStatus
+from alarm_broker.db.sql import json_set_key
 
 _ALLOWED_TRANSITIONS: dict[AlarmStatus, set[AlarmStatus]] = {
     AlarmStatus.TRIGGERED: {
@@ -23,40 +25,87 @@ _ALLOWED_TRANSITIONS: dict[AlarmStatus, set[AlarmStatus]] = {
     AlarmStatus.CANCELLED: set(),
 }
 
+# Same table as bit rows: bit ``_ORDINAL[target]`` of ``_TRANSITION_MASK[current]``
+_ORDINAL: dict[AlarmStatus, int] = {s: i for i, s in enumerate(AlarmStatus)}
+_TRANSITION_MASK: dict[AlarmStatus, int] = {
+    current: sum(1 << _ORDINAL[target] for target in targets)
+    for current, targets in _ALLOWED_TRANSITIONS.items()
+}
 
-def _merge_meta_note(alarm: Alarm, key: str, note: str | None) -> None:
-    if note:
-        alarm.meta = {**(alarm.meta or {}), key: note}
+# The rejected (current, target) pairs are a fixed set, so their 409 details
+# are formatted once. Exceptions are not shared: each raise mutates its own
+# __traceback__/__context__, which concurrent requests would overwrite.
+_INVALID_TRANSITIONS: dict[tuple[AlarmStatus, AlarmStatus], str] = {
+    (current, target): f"Invalid status transition: {current.value} -> {target.value}"
+    for current in AlarmStatus
+    for target in AlarmStatus
+    if target != current and target not in _ALLOWED_TRANSITIONS[current]
+}
+
+
+# UPDATE ... RETURNING the entity refreshes the in-session Alarm from the
+# returned row, including values computed by the database
+_REFRESH_FROM_RETURNING = {"synchronize_session": False, "populate_existing": True}
+
+
+# Columns written per target status: (timestamp, actor, meta note key)
+_TRANSITION_COLUMNS: dict[AlarmStatus, tuple[str, str, str]] = {
+    AlarmStatus.RESOLVED: ("resolved_at", "resolved_by", "resolve_note"),
+    AlarmStatus.CANCELLED: ("cancelled_at", "cancelled_by", "cancel_note"),
+}
 
 
 async def get_alarm_by_ack_token(session: AsyncSession, ack_token: str) -> Alarm | None:
     return await session.scalar(select(Alarm).where(Alarm.ack_token == ack_token))
 
 
+def _ack_conflict(current: AlarmStatus) -> Exception:
+    # Raise ConflictError instead of silently returning False
+    from alarm_broker.core.errors import ConflictError
+
+    return ConflictError(
+        f"Cannot acknowledge alarm in {current.value} status",
+        details={
+            "current_status": current.value,
+            "expected_status": AlarmStatus.TRIGGERED.value,
+        },
+    )
+
+
 async def acknowledge_alarm(
     session: AsyncSession,
     alarm: Alarm,
     *,
     acked_by: str | None = None,
     note: str | None = None,
+    commit: bool = True,
 ) -> bool:
     if alarm.status != AlarmStatus.TRIGGERED:
-        # Raise ConflictError instead of silently returning False
-        from alarm_broker.core.errors import ConflictError
-
-        raise ConflictError(
-            f"Cannot acknowledge alarm in {alarm.status.value} status",
-            details={
-                "current_status": alarm.status.value,
-                "expected_status": AlarmStatus.TRIGGERED.value,
-            },
-        )
+        raise _ack_conflict(alarm.status)
 
-    alarm.status = AlarmStatus.ACKNOWLEDGED
-    alarm.acked_at = datetime.now(UTC)
-    alarm.acked_by = acked_by
-    _merge_meta_note(alarm, "ack_note", note)
-    await session.commit()
+    values: dict[str, Any] = {
+        "status": AlarmStatus.ACKNOWLEDGED,
+        "acked_at": datetime.now(UTC),
+        "acked_by": acked_by,
+    }
+    if note:
+        values["meta"] = json_set_key(Alarm.meta, "ack_note", note)
+
+    # Compare-and-set: a concurrent ack between our read and this statement
+    # matches no row instead of being overwritten
+    acked = await session.scalar(
+        update(Alarm)
+        .where(Alarm.id == alarm.id, Alarm.status == AlarmStatus.TRIGGERED)
+        .values(**values)
+        .returning(Alarm)
+        .execution_options(**_REFRESH_FROM_RETURNING)
+    )
+    if acked is None:
+        await session.refresh(alarm, ["status"])
+        raise _ack_conflict(alarm.status)
+
+    if commit:
+        await session.commit()
     return True
 
 
@@ -67,31 +116,44 @@ async def transition_alarm(
     target_status: AlarmStatus,
     actor: str | None = None,
     note: str | None = None,
+    commit: bool = True,
 ) -> bool:
-    current = alarm.status
-    if current == target_status:
-        return False
-
-    allowed = _ALLOWED_TRANSITIONS.get(current, set())
-    if target_status not in allowed:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Invalid status transition: {current.value} -> {target_status.value}",
+    values: dict[str, Any] = {"status": target_status}
+    columns = _TRANSITION_COLUMNS.get(target_status)
+    if columns is not None:
+        at_column, by_column, note_key = columns
+        values[at_column] = datetime.now(UTC)
+        values[by_column] = actor
+        if note:
+            values["meta"] = json_set_key(Alarm.meta, note_key, note)
+
+    # Optimistic concurrency: the UPDATE only applies if the status is still
+    # the one we validated. On a lost race the status is reloaded and checked
+    # again; statuses only move forward, so this ends after a few rounds.
+    while True:
+        current = alarm.status
+        if current == target_status:
+            return False
+
+        if not (_TRANSITION_MASK[current] >> _ORDINAL[target_status]) & 1:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=_INVALID_TRANSITIONS[(current, target_status)],
+            )
+
+        updated = await session.scalar(
+            update(Alarm)
+            .where(Alarm.id == alarm.id, Alarm.status == current)
+            .values(**values)
+            .returning(Alarm)
+            .execution_options(**_REFRESH_FROM_RETURNING)
         )
+        if updated is not None:
+            break
+        await session.refresh(alarm, ["status"])
 
-    now = datetime.now(UTC)
-    alarm.status = target_status
-
-    if target_status == AlarmStatus.RESOLVED:
-        alarm.resolved_at = now
-        alarm.resolved_by = actor
-        _merge_meta_note(alarm, "resolve_note", note)
-    elif target_status == AlarmStatus.CANCELLED:
-        alarm.cancelled_at = now
-        alarm.cancelled_by = actor
-        _merge_meta_note(alarm, "cancel_note", note)
-
-    await session.commit()
+    if commit:
+        await session.commit()
     return True
 
 
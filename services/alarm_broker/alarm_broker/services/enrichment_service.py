@@ -1,32 +1,88 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from alarm_broker.db.models import Alarm, Person, Room, Site
 
+# Person, room and site in one round trip instead of three sequential gets
+_ENRICH_STMT = (
+    select(Person.display_name, Room.label, Room.site_id, Site.name)
+    .select_from(Alarm)
+    .outerjoin(Person, Person.id == Alarm.person_id)
+    .outerjoin(Room, Room.id == Alarm.room_id)
+    .outerjoin(Site, Site.id == Room.site_id)
+)
+
+# Reference data changes only via seeding, so enrichments are reused briefly.
+# Best-effort: the cache is per process and only invalidated where the change
+# is made, so other processes (the arq worker) may render display names up to
+# _CACHE_TTL_S out of date. It only feeds message text, never who is paged.
+_CACHE_MAXSIZE = 2048
+_CACHE_TTL_S = 60.0
+
+_CacheKey = tuple[str | None, str | None, str | None]
+_cache: OrderedDict[_CacheKey, tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+def invalidate(person_id: str | None = None, room_id: str | None = None) -> None:
+    """Drop cached enrichments after reference data changed.
+
+    Only affects the calling process; caches in other processes expire
+    after ``_CACHE_TTL_S`` seconds.
+
+    Args:
+        person_id: Drop entries for this person
+        room_id: Drop entries for this room
+
+    Without arguments the whole cache is cleared.
+    """
+    if person_id is None and room_id is None:
+        _cache.clear()
+        return
+    stale = [
+        k
+        for k in _cache
+        if (person_id is not None and k[0] == person_id)
+        or (room_id is not None and k[1] == room_id)
+    ]
+    for key in stale:
+        del _cache[key]
+
 
 async def enrich_alarm_context(session: AsyncSession, alarm: Alarm) -> dict[str, Any]:
+    # site_id is part of the key because it is the fallback when the room is unknown
+    key = (alarm.person_id, alarm.room_id, alarm.site_id)
+    now = time.monotonic()
+    cached = _cache.get(key)
+    if cached is not None and cached[0] > now:
+        return dict(cached[1])
+
     enriched: dict[str, Any] = {}
     person_name = alarm.person_id
     room_label = alarm.room_id
     site_name = alarm.site_id
 
-    if alarm.person_id:
-        person = await session.get(Person, alarm.person_id)
-        if person:
-            person_name = person.display_name
-    if alarm.room_id:
-        room = await session.get(Room, alarm.room_id)
-        if room:
-            room_label = room.label
-            site_name = room.site_id
-            site = await session.get(Site, room.site_id)
-            if site:
-                site_name = site.name
+    if alarm.person_id or alarm.room_id:
+        row = (await session.execute(_ENRICH_STMT.where(Alarm.id == alarm.id))).one_or_none()
+        if row is not None:
+            display_name, label, room_site_id, site = row
+            if display_name is not None:
+                person_name = display_name
+            if label is not None:
+                room_label = label
+                site_name = site if site is not None else room_site_id
 
     enriched["person_name"] = person_name
     enriched["room_label"] = room_label
     enriched["site_name"] = site_name
-    return enriched
+
+    _cache[key] = (now + _CACHE_TTL_S, enriched)
+    _cache.move_to_end(key)
+    while len(_cache) > _CACHE_MAXSIZE:
+        _cache.popitem(last=False)
+    return dict(enriched)
@@ -1,6 +1,9 @@
 """Event Publisher - Zentralisiert das Event-Enqueuing."""
 
-from datetime import UTC, datetime
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 from arq.connections import ArqRedis
@@ -16,6 +19,27 @@ from alarm_broker.constants import (
 if TYPE_CHECKING:
     from alarm_broker.db.models import Alarm
 
+_iso_second = -1
+_iso_prefix = ""
+
+
+def _fast_iso_now() -> str:
+    """Aktuelle UTC-Zeit im Format von ``datetime.isoformat()``.
+
+    Der Datums-/Zeitteil wird nur neu formatiert, wenn die Sekunde wechselt;
+    Mikrosekunden werden immer ausgegeben.
+    """
+    global _iso_second, _iso_prefix
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if second != _iso_second:
+        t = time.gmtime(second)
+        _iso_prefix = (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+        )
+        _iso_second = second
+    return f"{_iso_prefix}.{nanos // 1000:06d}+00:00"
+
 
 class EventPublisher:
     """Zentralisierter Event-Publisher für Alarm-Events.
@@ -27,6 +51,13 @@ class EventPublisher:
         publisher = EventPublisher(redis)
         await publisher.publish_alarm_created(alarm_id=123)
         await publisher.publish_alarm_acknowledged(alarm_id=123, acknowledged_by="user@example.com")
+
+        # Mehrere Events eines Requests gemeinsam enqueuen
+        async with publisher.batch():
+            await publisher.publish_alarm_created(alarm_id=123)
+            await publisher.publish_alarm_state_changed(
+                123, old_state="none", new_state="triggered"
+            )
     """
 
     # Job name for processing alarm events
@@ -39,6 +70,37 @@ class EventPublisher:
             redis: ArqRedis instance for enqueuing jobs
         """
         self._redis = redis
+        self._buffer: list[dict[str, Any]] | None = None
+
+    def begin_batch(self) -> None:
+        """Events ab jetzt puffern statt sofort zu enqueuen."""
+        if self._buffer is None:
+            self._buffer = []
+
+    async def flush(self) -> None:
+        """Gepufferte Events nebenläufig enqueuen und den Batch-Modus beenden.
+
+        Die Redis-Roundtrips laufen parallel statt nacheinander. Schlägt ein
+        Enqueue fehl, wird der erste Fehler weitergereicht; die übrigen
+        Events werden trotzdem gesendet.
+        """
+        buffer, self._buffer = self._buffer, None
+        if buffer:
+            await asyncio.gather(
+                *(self._redis.enqueue_job(self.JOB_NAME, payload) for payload in buffer)
+            )
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Context-Manager um :meth:`begin_batch` und :meth:`flush`.
+
+        Bereits gepufferte Events werden auch bei einer Exception gesendet.
+        """
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            await self.flush()
 
     async def publish_alarm_created(self, alarm_id: int | str, **kwargs: Any) -> None:
         """Publish ein alarm.created Event.
@@ -136,9 +198,12 @@ class EventPublisher:
         payload = {
             "event_type": event_type,
             "alarm_id": alarm_id,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": _fast_iso_now(),
             **kwargs,
         }
+        if self._buffer is not None:
+            self._buffer.append(payload)
+            return
         await self._redis.enqueue_job(self.JOB_NAME, payload)
 
     @classmethod
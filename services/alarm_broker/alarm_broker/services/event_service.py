@@ -30,17 +30,18 @@ async def enqueue_alarm_acked_event(
     Returns:
         True if enqueued successfully
     """
+    aid = str(alarm_id)
+    publisher = EventPublisher(redis)
     try:
-        publisher = EventPublisher(redis)
         await publisher.publish_alarm_acknowledged(
-            alarm_id=str(alarm_id),
+            alarm_id=aid,
             acknowledged_by=acked_by or "unknown",
             note=note,
         )
         record_event("alarm_acked_enqueued")
         return True
     except Exception:
-        logger.exception("enqueue alarm_acked failed", extra={"alarm_id": str(alarm_id)})
+        logger.exception("enqueue alarm_acked failed", extra={"alarm_id": aid})
         return False
 
 
@@ -64,10 +65,11 @@ async def enqueue_alarm_state_changed_event(
     Returns:
         True if enqueued successfully
     """
+    aid = str(alarm_id)
+    publisher = EventPublisher(redis)
     try:
-        publisher = EventPublisher(redis)
         await publisher.publish_alarm_state_changed(
-            alarm_id=str(alarm_id),
+            alarm_id=aid,
             old_state="unknown",
             new_state=state,
         )
@@ -76,6 +78,6 @@ async def enqueue_alarm_state_changed_event(
     except Exception:
         logger.exception(
             "enqueue alarm_state_changed failed",
-            extra={"alarm_id": str(alarm_id), "state": state},
+            extra={"alarm_id": aid, "state": state},
         )
         return False
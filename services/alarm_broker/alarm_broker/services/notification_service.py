@@ -6,15 +6,24 @@ various channels (Zammad, SMS, Signal) and logging the results.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from types import MappingProxyType
 from typing import Any
 
-from sqlalchemy import select
+import httpx
+import orjson
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from alarm_broker import constants
+from alarm_broker.connectors.base import (
+    DEFAULT_CALL_DEADLINE_S,
+    create_http_client,
+    retry_async,
+)
 from alarm_broker.connectors.sendxms import SendXmsClient
 from alarm_broker.connectors.signal import SignalClient
 from alarm_broker.connectors.zammad import ZammadClient
@@ -23,6 +32,73 @@ from alarm_broker.worker.message import format_alarm_message
 
 logger = logging.getLogger("alarm_broker")
 
+# Webhooks get the same budget as a connector call, so their retries finish
+# inside the channel deadline below instead of being cut off by it
+_WEBHOOK_DEADLINE_S = DEFAULT_CALL_DEADLINE_S
+_WEBHOOK_BACKOFF_S = 0.5
+
+# Per-target budget; a hung provider cannot hold a whole escalation step open.
+# Connector calls and webhooks hit their own deadline first (connectors also
+# count it on their breaker), so this is only a backstop.
+_CHANNEL_DEADLINE_S = DEFAULT_CALL_DEADLINE_S + 1.0
+
+# Severity -> priority ID for external systems; unknown severities are critical
+_PRIORITY_MAP: dict[str, int] = {
+    constants.PRIORITY_CRITICAL: 3,  # P0
+    constants.PRIORITY_HIGH: 2,  # P1
+    constants.PRIORITY_MEDIUM: 2,  # P2
+    constants.PRIORITY_LOW: 1,  # P3
+}
+_DEFAULT_PRIORITY = 3
+
+# Tags keyed by (first step, critical severity)
+_TAGS: dict[tuple[bool, bool], tuple[str, ...]] = {
+    (True, True): (constants.TAG_EMERGENCY, constants.TAG_SILENT),
+    (True, False): (constants.TAG_EMERGENCY,),
+    (False, True): (constants.TAG_SILENT,),
+    (False, False): (),
+}
+
+_TARGETS_STMT = (
+    select(EscalationTarget)
+    .join(EscalationStep, EscalationStep.target_id == EscalationTarget.id)
+    .where(EscalationTarget.enabled.is_(True))
+)
+
+# Core columns: the schedule is plain integers, no ORM entity processing needed
+_STEPS = EscalationStep.__table__
+_SCHEDULE_STMT = (
+    select(_STEPS.c.step_no, _STEPS.c.after_seconds).where(_STEPS.c.step_no > 0).distinct()
+)
+
+# (result rows, target, payload, prepared channel payload) -> None
+_ChannelHandler = Callable[
+    [list[dict[str, Any]], EscalationTarget, Mapping[str, Any], Any], Awaitable[None]
+]
+
+
+class NotificationPayload(Mapping[str, Any]):
+    """Read-only notification payload that also carries the alarm UUID.
+
+    ``alarm_id`` inside the mapping stays a string for JSON consumers; the
+    UUID rides along as an attribute so logging results never re-parses it.
+    """
+
+    __slots__ = ("_data", "alarm_uuid")
+
+    def __init__(self, data: dict[str, Any], alarm_uuid: uuid.UUID) -> None:
+        self._data = data
+        self.alarm_uuid = alarm_uuid
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
 
 async def log_notification(
     session: AsyncSession,
@@ -70,17 +146,60 @@ class NotificationService:
         zammad: ZammadClient,
         sendxms: SendXmsClient,
         signal: SignalClient,
+        http: httpx.AsyncClient | None = None,
+        max_concurrency: int = 20,
     ) -> None:
         """Initialize the notification service.
 
+        The connectors must run on the shared pooled client (see
+        :class:`~alarm_broker.connectors.base.PooledAsyncClient`); they
+        outlive this service, which is created per job, and are closed by
+        the worker on shutdown.
+
         Args:
             zammad: Zammad client for ticket management
             sendxms: SMS client for text messages
             signal: Signal client for group messages
+            http: Pooled HTTP client for webhooks; the caller keeps ownership.
+                Without one, a client is created on first use and closed
+                by :meth:`aclose`.
+            max_concurrency: Maximum targets of one step notified at once
         """
         self._zammad = zammad
         self._sendxms = sendxms
         self._signal = signal
+        self._http = http
+        self._owns_http = False
+        self._max_concurrency = max_concurrency
+        # Channel -> client whose enabled() gates it; webhooks need no client
+        self._channel_clients: dict[str, ZammadClient | SendXmsClient | SignalClient] = {
+            "email": zammad,
+            "sms": sendxms,
+            "signal": signal,
+        }
+        # Channel -> handler, resolved with one lookup per target
+        self._dispatch: dict[str, _ChannelHandler] = {
+            "email": self._send_email_notifications,
+            "sms": self._send_sms_notifications,
+            "signal": self._send_signal_notifications,
+            "webhook": self._send_webhook_notifications,
+        }
+
+    def _webhook_client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = create_http_client()
+            self._owns_http = True
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the webhook HTTP client if this service created it.
+
+        Injected connectors and clients are left open for their owner.
+        """
+        if self._owns_http and self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._owns_http = False
 
     async def send(
         self,
@@ -91,15 +210,20 @@ class NotificationService:
         step_no: int,
         ack_url: str,
         policy_id: str = "default",
+        payload: Mapping[str, Any] | None = None,
     ) -> None:
         """Main orchestrator for sending notifications across all channels.
 
         This method coordinates the notification flow by:
-        1. Building the notification payload
-        2. Fetching escalation targets
+        1. Fetching escalation targets (returning early if every
+           channel's client is disabled)
+        2. Building the notification payload
         3. Sending to each enabled channel
         4. Logging results
 
+        Targets are notified concurrently; their results are committed
+        together once all channels have finished.
+
         Args:
             session: Database session
             alarm: Alarm instance
@@ -107,23 +231,105 @@ class NotificationService:
             step_no: Escalation step number
             ack_url: ACK URL for responders
             policy_id: Escalation policy ID
+            payload: Payload from :meth:`build_payload` for this step, if the
+                caller already built it
         """
-        # Build notification payload
-        payload = self._build_notification_payload(
-            alarm=alarm,
-            enriched=enriched,
-            step_no=step_no,
-            ack_url=ack_url,
-        )
-
-        # Fetch escalation targets for this step
+        # Fetch the enabled escalation targets for this step
         targets = await self._get_escalation_targets(session, policy_id, step_no)
 
-        # Send to each target's preferred channel
-        for target in targets:
-            if not target.enabled:
-                continue
-            await self._send_to_channel(session, target, payload)
+        # Nothing can be delivered: skip formatting the message at all, but
+        # keep one audit row so the step does not vanish from the trail
+        if not any(self._channel_enabled(target.channel) for target in targets):
+            if targets:
+                logger.info(
+                    "notifications_skipped_channels_disabled",
+                    extra={"alarm_id": str(alarm.id), "step_no": step_no},
+                )
+                await log_notification(
+                    session,
+                    alarm_id=alarm.id,
+                    channel="escalation",
+                    target_id=None,
+                    payload={
+                        "action": "skip_step",
+                        "step_no": step_no,
+                        "target_ids": sorted(target.id for target in targets),
+                    },
+                    result="error",
+                    error="All channels disabled",
+                )
+            return
+
+        # Build the notification payload once; it is shared read-only by all targets
+        if payload is None:
+            payload = self.build_payload(alarm, enriched, step_no=step_no, ack_url=ack_url)
+
+        # Channel-specific payloads are rendered once per step, not per target
+        channels = {target.channel for target in targets}
+        prepared: dict[str, Any] = {}
+        if "email" in channels:
+            prepared["email"] = self._build_email_payload(payload)
+        if "webhook" in channels:
+            prepared["webhook"] = orjson.dumps(dict(payload))
+
+        # Send to all targets concurrently; total latency is bounded by the
+        # per-target deadline instead of the sum of all channels. Large steps
+        # are capped so they cannot flood the providers or the HTTP pool.
+        results: list[dict[str, Any]] = []
+        limit = asyncio.Semaphore(self._max_concurrency)
+        # SMS targets all get the same text, so a bulk endpoint receives them
+        # in one request; without one, each goes out under its own slot and
+        # deadline like any other target
+        bulk_sms = [target for target in targets if target.channel == "sms"]
+        if len(bulk_sms) < 2 or not self._sendxms.bulk_enabled():
+            bulk_sms = []
+        async with asyncio.TaskGroup() as tg:
+            if bulk_sms:
+                tg.create_task(self._dispatch_sms_bulk(results, bulk_sms, payload, limit))
+            for target in targets:
+                if bulk_sms and target.channel == "sms":
+                    continue
+                tg.create_task(
+                    self._dispatch_with_budget(
+                        results, target, payload, prepared.get(target.channel), limit
+                    )
+                )
+        # One multi-row INSERT and one commit for all of the step's results
+        if results:
+            await session.execute(insert(AlarmNotification), results)
+            await session.commit()
+
+    def build_payload(
+        self,
+        alarm: Alarm,
+        enriched: dict[str, Any],
+        *,
+        step_no: int,
+        ack_url: str,
+    ) -> NotificationPayload:
+        """Build the read-only notification payload for one escalation step.
+
+        Callers that also open a Zammad ticket build it once and pass it to
+        both :meth:`handle_zammad_ticket` and :meth:`send`.
+
+        Args:
+            alarm: Alarm instance
+            enriched: Enriched alarm context
+            step_no: Escalation step number
+            ack_url: ACK URL for responders
+
+        Returns:
+            Read-only payload with title, body, tags, and priority
+        """
+        return NotificationPayload(
+            self._build_notification_payload(
+                alarm=alarm,
+                enriched=enriched,
+                step_no=step_no,
+                ack_url=ack_url,
+            ),
+            alarm.id,
+        )
 
     def _build_notification_payload(
         self,
@@ -185,13 +391,7 @@ class NotificationService:
         Returns:
             Priority ID for systems like Zammad
         """
-        priority_map = {
-            constants.PRIORITY_CRITICAL: 3,  # P0
-            constants.PRIORITY_HIGH: 2,  # P1
-            constants.PRIORITY_MEDIUM: 2,  # P2
-            constants.PRIORITY_LOW: 1,  # P3
-        }
-        return priority_map.get(severity, 3)
+        return _PRIORITY_MAP.get(severity, _DEFAULT_PRIORITY)
 
     def _build_title(self, enriched: dict[str, Any], step_no: int) -> str:
         """Build notification title based on step and context.
@@ -210,7 +410,7 @@ class NotificationService:
             return f"NOTFALLALARM – {person} – {room}"
         return f"ESKALATION Stufe {step_no} – {person} – {room}"
 
-    def _build_tags(self, step_no: int, severity: str) -> list[str]:
+    def _build_tags(self, step_no: int, severity: str) -> tuple[str, ...]:
         """Build tags for notification based on step and severity.
 
         Args:
@@ -218,14 +418,9 @@ class NotificationService:
             severity: Alarm severity
 
         Returns:
-            List of tag strings
+            Shared, immutable tuple of tag strings
         """
-        tags = []
-        if step_no == 0:
-            tags.append(constants.TAG_EMERGENCY)
-        if severity == constants.PRIORITY_CRITICAL:
-            tags.append(constants.TAG_SILENT)
-        return tags
+        return _TAGS[step_no == 0, severity == constants.PRIORITY_CRITICAL]
 
     async def _get_escalation_targets(
         self,
@@ -243,77 +438,157 @@ class NotificationService:
         Returns:
             List of enabled EscalationTarget objects
         """
-        steps = (
+        # Targets straight off the step join; disabled ones never leave the
+        # database. Not cached: policy edits made through the API process must
+        # reach the worker before its next page goes out.
+        return list(
             await session.scalars(
-                select(EscalationStep)
-                .options(selectinload(EscalationStep.target))
-                .where(EscalationStep.policy_id == policy_id)
-                .where(EscalationStep.step_no == step_no)
+                _TARGETS_STMT.where(
+                    EscalationStep.policy_id == policy_id,
+                    EscalationStep.step_no == step_no,
+                )
             )
-        ).all()
-        return [step.target for step in steps if step.target.enabled]
+        )
 
-    async def _send_to_channel(
+    def _channel_enabled(self, channel: str) -> bool:
+        """Check whether a channel's client can deliver at all.
+
+        Args:
+            channel: Target channel name
+
+        Returns:
+            False only if the channel's client is disabled
+        """
+        client = self._channel_clients.get(channel)
+        return client is None or client.enabled()
+
+    async def _dispatch_with_budget(
         self,
-        session: AsyncSession,
+        results: list[dict[str, Any]],
         target: EscalationTarget,
-        payload: dict[str, Any],
+        payload: Mapping[str, Any],
+        prepared: Any,
+        limit: asyncio.Semaphore,
     ) -> None:
-        """Dispatch notification to the appropriate channel-specific method.
+        """Run :meth:`_send_to_channel` within the per-target deadline.
 
-        Routes the notification based on the target's channel preference.
-        Errors in one channel do not affect other channels.
+        A target that misses the deadline is cancelled and logged as a
+        timeout; the other targets of the step are not affected. The
+        deadline starts once the target holds a ``limit`` slot.
 
         Args:
-            session: Database session
+            results: Notification rows collected for the step
             target: Target configuration with channel preference
             payload: Notification payload to send
+            prepared: Channel payload rendered once per step, if any
+            limit: Semaphore bounding concurrent targets of the step
         """
-        try:
-            if target.channel == "email":
-                await self._send_email_notifications(session, target, payload)
-            elif target.channel == "sms":
-                await self._send_sms_notifications(session, target, payload)
-            elif target.channel == "signal":
-                await self._send_sms_notifications(session, target, payload)
-            elif target.channel == "webhook":
-                await self._send_webhook_notifications(session, target, payload)
-            else:
+        async with limit:
+            try:
+                async with asyncio.timeout(_CHANNEL_DEADLINE_S):
+                    await self._send_to_channel(results, target, payload, prepared)
+            except TimeoutError:
                 logger.warning(
-                    "unknown_channel",
+                    "channel_timeout",
                     extra={"channel": target.channel, "target_id": target.id},
                 )
-        except Exception as e:
-            logger.exception(
-                "channel_dispatch_failed",
-                extra={"channel": target.channel, "target_id": target.id, "error": str(e)},
-            )
+                self._stage_notification_result(results, target, payload, "error", "timeout")
 
-    async def _send_email_notifications(
+    async def _dispatch_sms_bulk(
         self,
-        session: AsyncSession,
+        results: list[dict[str, Any]],
+        targets: list[EscalationTarget],
+        payload: Mapping[str, Any],
+        limit: asyncio.Semaphore,
+    ) -> None:
+        """Send the step's SMS message to all SMS targets in one request.
+
+        The request takes one ``limit`` slot and one deadline; every target
+        still gets its own result row. Only used when the SMS client has a
+        bulk endpoint.
+
+        Args:
+            results: Notification rows collected for the step
+            targets: SMS targets of the step
+            payload: Notification payload to send
+            limit: Semaphore bounding concurrent targets of the step
+        """
+        errors: list[BaseException | str | None]
+        async with limit:
+            try:
+                async with asyncio.timeout(_CHANNEL_DEADLINE_S):
+                    errors = list(
+                        await self._sendxms.send_bulk_sms(
+                            [target.address for target in targets], payload["body"]
+                        )
+                    )
+            except TimeoutError:
+                logger.warning(
+                    "channel_timeout",
+                    extra={"channel": "sms", "target_ids": [target.id for target in targets]},
+                )
+                errors = ["timeout"] * len(targets)
+            except Exception as e:
+                errors = [e] * len(targets)
+
+        for target, error in zip(targets, errors, strict=True):
+            if error is None:
+                self._stage_notification_result(results, target, payload, "ok")
+                continue
+            if isinstance(error, BaseException) and logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "sendxms_notification_failed",
+                    exc_info=error,
+                    extra={"target_id": target.id, "error": str(error)},
+                )
+            self._stage_notification_result(results, target, payload, "error", str(error))
+
+    async def _send_to_channel(
+        self,
+        results: list[dict[str, Any]],
         target: EscalationTarget,
-        payload: dict[str, Any],
+        payload: Mapping[str, Any],
+        prepared: Any = None,
     ) -> None:
-        """Send email notification via Zammad.
+        """Dispatch notification to the appropriate channel-specific method.
 
-        Formats the email payload and creates a ticket in Zammad.
-        Failure does not affect other channels.
+        Routes the notification based on the target's channel preference.
+        Errors in one channel do not affect other channels.
 
         Args:
-            session: Database session
-            target: Target with email configuration
-            payload: Notification payload
+            results: Notification rows collected for the step
+            target: Target configuration with channel preference
+            payload: Notification payload to send
+            prepared: Channel payload rendered once per step (Zammad ticket
+                for email, encoded JSON body for webhooks), if any
         """
-        if not self._zammad.enabled():
-            await self._log_notification_result(
-                session, target, payload, "error", "Zammad not enabled"
+        handler = self._dispatch.get(target.channel)
+        if handler is None:
+            logger.warning(
+                "unknown_channel",
+                extra={"channel": target.channel, "target_id": target.id},
             )
             return
-
         try:
-            # Format email payload for Zammad
-            email_payload = {
+            await handler(results, target, payload, prepared)
+        except Exception as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.exception(
+                    "channel_dispatch_failed",
+                    extra={"channel": target.channel, "target_id": target.id, "error": str(e)},
+                )
+
+    def _build_email_payload(self, payload: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Build the Zammad ticket payload for email targets.
+
+        Args:
+            payload: Notification payload
+
+        Returns:
+            Read-only Zammad ticket payload
+        """
+        return MappingProxyType(
+            {
                 "title": payload["title"],
                 "group": "Notfallstelle",
                 "priority_id": payload["priority"],
@@ -327,180 +602,255 @@ class NotificationService:
                     "internal": True,
                 },
             }
+        )
+
+    async def _send_email_notifications(
+        self,
+        results: list[dict[str, Any]],
+        target: EscalationTarget,
+        payload: Mapping[str, Any],
+        email_payload: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Send email notification via Zammad.
+
+        Formats the email payload and creates a ticket in Zammad.
+        Failure does not affect other channels.
+
+        Args:
+            results: Notification rows collected for the step
+            target: Target with email configuration
+            payload: Notification payload
+            email_payload: Prebuilt Zammad payload; built from ``payload`` if omitted
+        """
+        if not self._zammad.enabled():
+            self._stage_notification_result(results, target, payload, "error", "Zammad not enabled")
+            return
+
+        try:
+            if email_payload is None:
+                email_payload = self._build_email_payload(payload)
             ticket_id = await self._zammad.create_ticket(email_payload)
-            await self._log_notification_result(
-                session, target, payload, "ok", ticket_id=str(ticket_id)
+            self._stage_notification_result(
+                results, target, payload, "ok", ticket_id=str(ticket_id)
             )
         except Exception as e:
-            logger.exception(
-                "email_notification_failed",
-                extra={"target_id": target.id, "error": str(e)},
-            )
-            await self._log_notification_result(session, target, payload, "error", str(e))
+            self._stage_failure(results, target, payload, "email_notification_failed", e)
 
     async def _send_sms_notifications(
         self,
-        session: AsyncSession,
+        results: list[dict[str, Any]],
         target: EscalationTarget,
-        payload: dict[str, Any],
+        payload: Mapping[str, Any],
+        prepared: Any = None,  # noqa: ARG002 - uniform channel handler signature
     ) -> None:
-        """Send SMS notification via Signal or SendXMS.
-
-        Tries Signal first, falls back to SendXMS if Signal fails.
-        Failure in one provider does not affect the other.
+        """Send SMS notification via SendXMS.
 
         Args:
-            session: Database session
+            results: Notification rows collected for the step
             target: Target with SMS configuration
             payload: Notification payload
         """
-        message = payload["body"]
+        await self._send_via_sendxms(results, target, payload["body"], payload)
 
-        # Try Signal first
-        if target.channel == "signal":
-            await self._send_via_signal(session, target, message, payload)
-            return
+    async def _send_signal_notifications(
+        self,
+        results: list[dict[str, Any]],
+        target: EscalationTarget,
+        payload: Mapping[str, Any],
+        prepared: Any = None,  # noqa: ARG002 - uniform channel handler signature
+    ) -> None:
+        """Send group message via Signal.
 
-        # Try SendXMS for SMS
-        if target.channel == "sms":
-            await self._send_via_sendxms(session, target, message, payload)
+        Args:
+            results: Notification rows collected for the step
+            target: Target with Signal configuration
+            payload: Notification payload
+        """
+        await self._send_via_signal(results, target, payload["body"], payload)
 
     async def _send_via_signal(
         self,
-        session: AsyncSession,
+        results: list[dict[str, Any]],
         target: EscalationTarget,
         message: str,
-        payload: dict[str, Any],
+        payload: Mapping[str, Any],
     ) -> None:
         """Send message via Signal client.
 
         Args:
-            session: Database session
+            results: Notification rows collected for the step
             target: Target with Signal configuration
             message: Message to send
             payload: Full notification payload for logging
         """
         try:
             await self._signal.send_group_message(message, group_id=target.address)
-            await self._log_notification_result(session, target, payload, "ok")
+            self._stage_notification_result(results, target, payload, "ok")
         except Exception as e:
-            logger.exception(
-                "signal_notification_failed",
-                extra={"target_id": target.id, "error": str(e)},
-            )
-            await self._log_notification_result(session, target, payload, "error", str(e))
+            self._stage_failure(results, target, payload, "signal_notification_failed", e)
 
     async def _send_via_sendxms(
         self,
-        session: AsyncSession,
+        results: list[dict[str, Any]],
         target: EscalationTarget,
         message: str,
-        payload: dict[str, Any],
+        payload: Mapping[str, Any],
     ) -> None:
         """Send message via SendXMS client.
 
         Args:
-            session: Database session
+            results: Notification rows collected for the step
             target: Target with SendXMS configuration
             message: Message to send
             payload: Full notification payload for logging
         """
         try:
             await self._sendxms.send_sms(target.address, message)
-            await self._log_notification_result(session, target, payload, "ok")
+            self._stage_notification_result(results, target, payload, "ok")
         except Exception as e:
-            logger.exception(
-                "sendxms_notification_failed",
-                extra={"target_id": target.id, "error": str(e)},
-            )
-            await self._log_notification_result(session, target, payload, "error", str(e))
+            self._stage_failure(results, target, payload, "sendxms_notification_failed", e)
 
     async def _send_webhook_notifications(
         self,
-        session: AsyncSession,
+        results: list[dict[str, Any]],
         target: EscalationTarget,
-        payload: dict[str, Any],
+        payload: Mapping[str, Any],
+        body: bytes | None = None,
     ) -> None:
         """Send webhook notification via HTTP POST.
 
         Sends the notification payload to a configured webhook URL.
+        Transient failures (429, 5xx, network errors) are retried with
+        backoff within ``_WEBHOOK_DEADLINE_S``; non-2xx responses are
+        logged as errors.
 
         Args:
-            session: Database session
+            results: Notification rows collected for the step
             target: Target with webhook configuration
             payload: Notification payload to send
+            body: ``payload`` encoded as JSON; encoded here if omitted
         """
-        # Note: This uses httpx for HTTP requests
-        # Import here to avoid circular dependencies
-        import httpx
-
         webhook_url = target.address
         if not webhook_url:
-            await self._log_notification_result(
-                session, target, payload, "error", "No webhook URL configured"
+            self._stage_notification_result(
+                results, target, payload, "error", "No webhook URL configured"
             )
             return
 
+        content = body if body is not None else orjson.dumps(dict(payload))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _WEBHOOK_DEADLINE_S
+        attempts = 0
+
+        async def post() -> None:
+            nonlocal attempts
+            attempts += 1
+            # Each attempt only gets what is left of the budget
+            await self._post_webhook(webhook_url, content, deadline - loop.time())
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                await client.post(
-                    webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-            await self._log_notification_result(session, target, payload, "ok")
-        except Exception as e:
-            logger.exception(
-                "webhook_notification_failed",
-                extra={"target_id": target.id, "error": str(e)},
+            async with asyncio.timeout_at(deadline):
+                await retry_async(post, operation="webhook", base=_WEBHOOK_BACKOFF_S)
+            self._stage_notification_result(results, target, payload, "ok")
+        except TimeoutError:
+            logger.warning(
+                "webhook_deadline_exceeded",
+                extra={"target_id": target.id, "attempts": attempts},
             )
-            await self._log_notification_result(session, target, payload, "error", str(e))
+            self._stage_notification_result(results, target, payload, "error", "timeout")
+        except Exception as e:
+            self._stage_failure(results, target, payload, "webhook_notification_failed", e)
+
+    async def _post_webhook(self, url: str, body: bytes, timeout: float) -> None:
+        # Pooled client: keep-alive connections are reused across escalations
+        response = await self._webhook_client().post(
+            url,
+            content=body,
+            headers={"Content-Type": "application/json"},
+            timeout=max(timeout, 0.0),
+        )
+        response.raise_for_status()
 
-    async def _log_notification_result(
+    def _stage_notification_result(
         self,
-        session: AsyncSession,
+        results: list[dict[str, Any]],
         target: EscalationTarget,
-        payload: dict[str, Any],
+        payload: Mapping[str, Any],
         result: str,
         error: str | None = None,
     ) -> None:
-        """Log notification result to database and track metrics.
+        """Collect a notification result for auditing and metrics.
 
-        Records successful and failed notification attempts for auditing
-        and metrics purposes.
+        Records successful and failed notification attempts; :meth:`send`
+        inserts all of a step's results with one statement.
 
         Args:
-            session: Database session
+            results: Notification rows collected for the step
             target: Target that was notified
             payload: Payload that was sent
             result: Result status ("ok" or "error")
             error: Error message if result is error
         """
-        await log_notification(
-            session,
-            alarm_id=uuid.UUID(payload["alarm_id"]),
-            channel=target.channel,
-            target_id=str(target.id),
-            payload=payload,
-            result=result,
-            error=error,
+        alarm_id = (
+            payload.alarm_uuid
+            if isinstance(payload, NotificationPayload)
+            else uuid.UUID(payload["alarm_id"])
         )
+        results.append(
+            {
+                "alarm_id": alarm_id,
+                "channel": target.channel,
+                "target_id": str(target.id),
+                # Each row owns its copy; the shared payload stays read-only
+                "payload": dict(payload),
+                "result": result,
+                "error": error,
+            }
+        )
+
+    def _stage_failure(
+        self,
+        results: list[dict[str, Any]],
+        target: EscalationTarget,
+        payload: Mapping[str, Any],
+        event: str,
+        exc: Exception,
+    ) -> None:
+        """Log a failed channel attempt and collect its error row.
+
+        Must be called from the ``except`` block so the traceback is logged.
+        The error text is rendered once for both the log and the row; the
+        log record is only built if ERROR is enabled.
+
+        Args:
+            results: Notification rows collected for the step
+            target: Target that failed
+            payload: Payload that was sent
+            event: Log event name
+            exc: The exception being handled
+        """
+        error = "timeout" if isinstance(exc, TimeoutError) else str(exc)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.exception(event, extra={"target_id": target.id, "error": error})
+        self._stage_notification_result(results, target, payload, "error", error)
 
     async def handle_zammad_ticket(
         self,
         session: AsyncSession,
         alarm: Alarm,
-        enriched: dict[str, Any],
-        ack_url: str,
+        payload: Mapping[str, Any],
         settings: Any,
     ) -> int | None:
         """Create a Zammad ticket for the alarm.
 
+        The ticket ID is stored on the alarm and committed in the same
+        transaction as the notification log row.
+
         Args:
             session: Database session
             alarm: Alarm instance
-            enriched: Enriched alarm context
-            ack_url: ACK URL for responders
+            payload: Step 0 payload from :meth:`build_payload`; its title and
+                body are reused for the ticket
             settings: Application settings
 
         Returns:
@@ -509,31 +859,25 @@ class NotificationService:
         if not self._zammad.enabled():
             return None
 
-        payload = {
-            "title": f"NOTFALLALARM – {enriched['person_name']} – {enriched['room_label']}",
+        ticket = {
+            "title": payload["title"],
             "group": settings.zammad_group,
             "priority_id": settings.zammad_priority_id_p0,
             "state_id": settings.zammad_state_id_new,
             "customer_id": settings.zammad_customer,
-            "tags": [constants.TAG_EMERGENCY, constants.TAG_SILENT],
+            "tags": _TAGS[True, True],
             "article": {
                 "subject": "Alarm ausgelöst (silent)",
-                "body": format_alarm_message(
-                    alarm_id=str(alarm.id),
-                    person=str(enriched["person_name"]),
-                    room=str(enriched["room_label"]),
-                    site=str(enriched.get("site_name")) if enriched.get("site_name") else None,
-                    created_at=alarm.created_at,
-                    ack_url=ack_url,
-                    step_no=0,
-                ),
+                "body": payload["body"],
                 "type": "note",
                 "internal": True,
             },
         }
 
         try:
-            ticket_id = await self._zammad.create_ticket(payload)
+            ticket_id = await self._zammad.create_ticket(ticket)
+            # Committed together with the audit row below
+            alarm.zammad_ticket_id = ticket_id
             await log_notification(
                 session,
                 alarm_id=alarm.id,
@@ -544,10 +888,12 @@ class NotificationService:
             )
             return ticket_id
         except Exception as e:
-            logger.exception(
-                "zammad_create_ticket_failed",
-                extra={"alarm_id": str(alarm.id), "error": str(e)},
-            )
+            error = str(e)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.exception(
+                    "zammad_create_ticket_failed",
+                    extra={"alarm_id": str(alarm.id), "error": error},
+                )
             await log_notification(
                 session,
                 alarm_id=alarm.id,
@@ -555,7 +901,7 @@ class NotificationService:
                 target_id=None,
                 payload={"action": "create_ticket"},
                 result="error",
-                error=str(e),
+                error=error,
             )
             return None
 
@@ -605,10 +951,11 @@ class NotificationService:
             )
             return True
         except Exception as e:
-            logger.exception(
-                "zammad_ack_note_failed",
-                extra={"ticket_id": ticket_id, "error": str(e)},
-            )
+            if logger.isEnabledFor(logging.ERROR):
+                logger.exception(
+                    "zammad_ack_note_failed",
+                    extra={"ticket_id": ticket_id, "error": str(e)},
+                )
             return False
 
     async def send_escalation_step(
@@ -620,6 +967,7 @@ class NotificationService:
         step_no: int,
         ack_url: str,
         policy_id: str = "default",
+        payload: Mapping[str, Any] | None = None,
     ) -> None:
         """Send notifications for an escalation step.
 
@@ -633,6 +981,7 @@ class NotificationService:
             step_no: Escalation step number
             ack_url: ACK URL for responders
             policy_id: Escalation policy ID
+            payload: Prebuilt payload for this step, if any
         """
         await self.send(
             session=session,
@@ -641,6 +990,7 @@ class NotificationService:
             step_no=step_no,
             ack_url=ack_url,
             policy_id=policy_id,
+            payload=payload,
         )
 
     async def get_escalation_schedule(
@@ -657,12 +1007,5 @@ class NotificationService:
         Returns:
             List of (step_no, after_seconds) tuples
         """
-        rows = (
-            await session.execute(
-                select(EscalationStep.step_no, EscalationStep.after_seconds)
-                .where(EscalationStep.policy_id == policy_id)
-                .where(EscalationStep.step_no > 0)
-                .distinct()
-            )
-        ).all()
-        return [(row[0], row[1]) for row in rows]
+        result = await session.execute(_SCHEDULE_STMT.where(_STEPS.c.policy_id == policy_id))
+        return [(step_no, after_seconds) for step_no, after_seconds in result]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from alarm_broker.api.schemas import EscalationPolicyIn
@@ -9,32 +11,6 @@ from alarm_broker.db.models import EscalationPolicy, EscalationStep, EscalationT
 
 
 async def apply_escalation_policy(session: AsyncSession, body: EscalationPolicyIn) -> str:
-    policy = await session.get(EscalationPolicy, body.policy_id)
-    if not policy:
-        policy = EscalationPolicy(id=body.policy_id, name=body.name)
-        session.add(policy)
-    else:
-        policy.name = body.name
-
-    for target_in in body.targets:
-        target = await session.get(EscalationTarget, target_in.id)
-        if not target:
-            session.add(
-                EscalationTarget(
-                    id=target_in.id,
-                    label=target_in.label,
-                    channel=target_in.channel,
-                    address=target_in.address,
-                    enabled=target_in.enabled,
-                )
-            )
-            continue
-
-        target.label = target_in.label
-        target.channel = target_in.channel
-        target.address = target_in.address
-        target.enabled = target_in.enabled
-
     seen_pairs: set[tuple[int, str]] = set()
     for step in body.steps:
         if len(step.target_ids) != len(set(step.target_ids)):
@@ -53,38 +29,67 @@ async def apply_escalation_policy(session: AsyncSession, body: EscalationPolicyI
                 )
             seen_pairs.add(pair)
 
+    # One SELECT for every target the body mentions instead of a get() each
     incoming_target_ids = {target.id for target in body.targets}
     referenced_target_ids = {target_id for step in body.steps for target_id in step.target_ids}
-    if referenced_target_ids:
-        existing_target_ids = set(
-            await session.scalars(
-                select(EscalationTarget.id).where(EscalationTarget.id.in_(referenced_target_ids))
+    lookup_ids = incoming_target_ids | referenced_target_ids
+    existing_targets: dict[str, EscalationTarget] = {}
+    if lookup_ids:
+        existing_targets = {
+            target.id: target
+            for target in await session.scalars(
+                select(EscalationTarget).where(EscalationTarget.id.in_(lookup_ids))
             )
+        }
+    missing_target_ids = referenced_target_ids - incoming_target_ids - existing_targets.keys()
+    if missing_target_ids:
+        missing_targets = ", ".join(sorted(missing_target_ids))
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown escalation target ids: {missing_targets}",
         )
-        missing_target_ids = referenced_target_ids - incoming_target_ids - existing_target_ids
-        if missing_target_ids:
-            missing_targets = ", ".join(sorted(missing_target_ids))
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unknown escalation target ids: {missing_targets}",
-            )
 
-    existing_steps = await session.scalars(
-        select(EscalationStep).where(EscalationStep.policy_id == body.policy_id)
-    )
-    for step in existing_steps:
-        await session.delete(step)
+    policy = await session.get(EscalationPolicy, body.policy_id)
+    if not policy:
+        policy = EscalationPolicy(id=body.policy_id, name=body.name)
+        session.add(policy)
+    else:
+        policy.name = body.name
 
-    for step in body.steps:
-        for target_id in step.target_ids:
-            session.add(
-                EscalationStep(
-                    policy_id=body.policy_id,
-                    step_no=step.step_no,
-                    after_seconds=step.after_seconds,
-                    target_id=target_id,
-                )
-            )
+    new_targets: dict[str, dict[str, Any]] = {}
+    for target_in in body.targets:
+        target = existing_targets.get(target_in.id)
+        if not target:
+            new_targets[target_in.id] = {
+                "id": target_in.id,
+                "label": target_in.label,
+                "channel": target_in.channel,
+                "address": target_in.address,
+                "enabled": target_in.enabled,
+            }
+            continue
+
+        target.label = target_in.label
+        target.channel = target_in.channel
+        target.address = target_in.address
+        target.enabled = target_in.enabled
+    if new_targets:
+        await session.execute(insert(EscalationTarget), list(new_targets.values()))
+
+    # Replace the policy's steps with one DELETE and one executemany INSERT
+    await session.execute(delete(EscalationStep).where(EscalationStep.policy_id == body.policy_id))
+    step_rows = [
+        {
+            "policy_id": body.policy_id,
+            "step_no": step.step_no,
+            "after_seconds": step.after_seconds,
+            "target_id": target_id,
+        }
+        for step in body.steps
+        for target_id in step.target_ids
+    ]
+    if step_rows:
+        await session.execute(insert(EscalationStep), step_rows)
 
     await session.commit()
     return body.policy_id
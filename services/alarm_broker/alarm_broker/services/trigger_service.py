@@ -26,6 +26,47 @@ from alarm_broker.settings import Settings
 
 logger = logging.getLogger("alarm_broker")
 
+# Outcomes returned by the trigger guard script.
+GUARD_NEW = 0
+GUARD_DUPLICATE = 1
+GUARD_RATE_LIMITED = 2
+
+# Atomically checks the idempotency key, counts the trigger against the rate
+# limit and reserves the candidate alarm ID, all in one Redis round trip.
+# KEYS = [idempotency_key, rate_limit_key]
+# ARGV = [candidate_alarm_id, idempotency_ttl, rate_limit_ttl, rate_limit]
+TRIGGER_GUARD_LUA = """
+local existing = redis.call('GET', KEYS[1])
+if existing then
+  return {1, existing}
+end
+local count = redis.call('INCR', KEYS[2])
+if count == 1 then
+  redis.call('EXPIRE', KEYS[2], ARGV[3])
+end
+if count > tonumber(ARGV[4]) then
+  return {2, count}
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return {0, ARGV[1]}
+"""
+
+_IDEMPOTENCY_TTL_SECONDS = 30
+_RATE_LIMIT_TTL_SECONDS = 70
+
+
+def register_trigger_guard(redis: ArqRedis) -> Any:
+    """Register the trigger guard Lua script on a Redis client.
+
+    The returned script object runs via EVALSHA and transparently falls
+    back to EVAL when the server reports NOSCRIPT.
+    """
+    return redis.register_script(TRIGGER_GUARD_LUA)
+
+
+def _as_str(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
 
 def _hash_token_for_logging(token: str) -> str:
     """Create a safe hash of the token for logging purposes."""
@@ -91,6 +132,7 @@ class TriggerService:
         settings: Settings,
         idempotency_bucket: int | None = None,
         rate_limit_bucket: int | None = None,
+        guard_script: Any | None = None,
     ) -> None:
         """Initialize the trigger service.
 
@@ -100,6 +142,7 @@ class TriggerService:
             settings: Application settings
             idempotency_bucket: Optional pre-computed idempotency bucket
             rate_limit_bucket: Optional pre-computed rate limit bucket
+            guard_script: Optional pre-registered trigger guard script
         """
         self._session = session
         self._redis = redis
@@ -111,6 +154,7 @@ class TriggerService:
             rate_limit_bucket if rate_limit_bucket is not None else minute_bucket()
         )
         self._event_publisher = EventPublisher(redis)
+        self._guard_script = guard_script
 
     def _get_idempotency_key(self, token: str) -> str:
         """Get the Redis key for idempotency checking.
@@ -173,7 +217,9 @@ class TriggerService:
         # Try up to 3 times to handle race conditions
         for _attempt in range(3):
             reserved_id = uuid.uuid4()
-            ok = await self._redis.set(idem_key, str(reserved_id), ex=30, nx=True)
+            ok = await self._redis.set(
+                idem_key, str(reserved_id), ex=_IDEMPOTENCY_TTL_SECONDS, nx=True
+            )
             if ok:
                 return reserved_id
             # Check if there's an existing alarm ID we can use
@@ -207,7 +253,7 @@ class TriggerService:
         rl_key = self._get_rate_limit_key(token)
         rl_val = await self._redis.incr(rl_key)
         if rl_val == 1:
-            await self._redis.expire(rl_key, 70)
+            await self._redis.expire(rl_key, _RATE_LIMIT_TTL_SECONDS)
         return rl_val <= self._settings.rate_limit_per_minute
 
     async def validate_device(self, token: str) -> tuple[Device | None, str | None]:
@@ -288,11 +334,12 @@ class TriggerService:
         Returns:
             True if enqueued successfully
         """
+        aid = str(alarm_id)
         try:
-            await self._event_publisher.publish_alarm_created(alarm_id=str(alarm_id))
+            await self._event_publisher.publish_alarm_created(alarm_id=aid)
             return True
         except Exception:
-            logger.exception("enqueue_alarm_created_failed", extra={"alarm_id": str(alarm_id)})
+            logger.exception("enqueue_alarm_created_failed", extra={"alarm_id": aid})
             return False
 
     def _validate_trigger(
@@ -317,20 +364,50 @@ class TriggerService:
             return False, f"Invalid severity: {severity}"
         return True, None
 
-    async def _check_idempotency(
+    async def _guard_trigger(
         self,
         token: str,
-    ) -> tuple[bool, uuid.UUID | None, Alarm | None]:
-        """Check idempotency and return existing alarm if found.
+    ) -> tuple[int | None, uuid.UUID | None, Alarm | None]:
+        """Check idempotency, rate limit and reserve an alarm ID in one round trip.
 
         Args:
             token: Device token
 
         Returns:
-            Tuple of (is_duplicate, alarm_id, existing_alarm)
+            Tuple of (outcome, alarm_id, existing_alarm). The outcome is one of
+            the GUARD_* constants, or None if no alarm ID could be reserved.
         """
-        is_duplicate, existing_id = await self.check_idempotency(token)
-        if is_duplicate and existing_id:
+        if self._guard_script is None:
+            self._guard_script = register_trigger_guard(self._redis)
+
+        idem_key = self._get_idempotency_key(token)
+        rl_key = self._get_rate_limit_key(token)
+
+        # Retry a few times when the stored reference is stale or invalid
+        for _attempt in range(3):
+            candidate = uuid.uuid4()
+            outcome, value = await self._guard_script(
+                keys=[idem_key, rl_key],
+                args=[
+                    str(candidate),
+                    _IDEMPOTENCY_TTL_SECONDS,
+                    _RATE_LIMIT_TTL_SECONDS,
+                    self._settings.rate_limit_per_minute,
+                ],
+            )
+            outcome = int(outcome)
+            if outcome == GUARD_NEW:
+                return GUARD_NEW, candidate, None
+            if outcome == GUARD_RATE_LIMITED:
+                return GUARD_RATE_LIMITED, None, None
+
+            try:
+                existing_id = uuid.UUID(_as_str(value))
+            except ValueError:
+                # Invalid UUID in Redis, clear it
+                await self._redis.delete(idem_key)
+                continue
+
             existing_alarm = await self._session.get(Alarm, existing_id)
             if existing_alarm:
                 logger.info(
@@ -340,38 +417,15 @@ class TriggerService:
                         "token_hash": _hash_token_for_logging(token),
                     },
                 )
-                return True, existing_id, existing_alarm
-            # Invalid reference, clear and continue
-            await self.clear_idempotency(token)
-        return False, None, None
-
-    async def _reserve_idempotency_key(self, token: str) -> uuid.UUID | None:
-        """Reserve idempotency key for the request.
-
-        Args:
-            token: Device token
-
-        Returns:
-            Reserved UUID or None if reservation failed
-        """
-        alarm_id = await self.reserve_alarm_id(token)
-        if not alarm_id:
-            logger.error(
-                "idempotency_reservation_failed",
-                extra={"token_hash": _hash_token_for_logging(token)},
-            )
-        return alarm_id
-
-    async def _check_rate_limit(self, token: str) -> bool:
-        """Check if request is within rate limits.
-
-        Args:
-            token: Device token
+                return GUARD_DUPLICATE, existing_id, existing_alarm
+            # Invalid reference, clear and retry
+            await self._redis.delete(idem_key)
 
-        Returns:
-            True if within limits, False if exceeded
-        """
-        return await self.check_rate_limit(token)
+        logger.error(
+            "idempotency_reservation_failed",
+            extra={"token_hash": _hash_token_for_logging(token)},
+        )
+        return None, None, None
 
     async def _enrich_trigger_data(
         self,
@@ -448,17 +502,20 @@ class TriggerService:
         Returns:
             True if notifications sent successfully
         """
-        # Enqueue notification task
-        notification_ok = await self.enqueue_alarm_created(alarm.id)
-
-        # Enqueue state changed event via EventPublisher
-        await self._event_publisher.publish_alarm_state_changed(
-            alarm_id=str(alarm.id),
-            old_state="none",
-            new_state=alarm.status.value,
-        )
-
-        return notification_ok
+        # Both events go out in one batch instead of two sequential round trips
+        aid = str(alarm.id)
+        try:
+            async with self._event_publisher.batch():
+                await self._event_publisher.publish_alarm_created(alarm_id=aid)
+                await self._event_publisher.publish_alarm_state_changed(
+                    alarm_id=aid,
+                    old_state="none",
+                    new_state=alarm.status.value,
+                )
+        except Exception:
+            logger.exception("enqueue_alarm_created_failed", extra={"alarm_id": aid})
+            return False
+        return True
 
     async def process_trigger(
         self,
@@ -469,28 +526,21 @@ class TriggerService:
     ) -> TriggerResult:
         """Process an alarm trigger request (orchestrator).
 
-        Delegates to smaller methods: validate, idempotency check,
-        rate limit check, enrich data, evaluate policies,
-        create alarm, send notifications.
+        Delegates to smaller methods: validate, idempotency and rate limit
+        guard, enrich data, evaluate policies, create alarm, send
+        notifications.
         """
         # Step 1: Validate trigger data
         is_valid, validation_error = self._validate_trigger(token)
         if not is_valid:
             return TriggerResult.error(400, validation_error)
 
-        # Step 2: Check idempotency - return existing if duplicate
-        is_duplicate, _, existing_alarm = await self._check_idempotency(token)
-        if is_duplicate and existing_alarm:
+        # Steps 2-4: Idempotency check, rate limit and alarm ID reservation
+        outcome, alarm_id, existing_alarm = await self._guard_trigger(token)
+        if outcome == GUARD_DUPLICATE and existing_alarm:
             return TriggerResult.ok(existing_alarm.id, existing_alarm.status, is_duplicate=True)
 
-        # Step 3: Reserve idempotency key
-        alarm_id = await self._reserve_idempotency_key(token)
-        if not alarm_id:
-            return TriggerResult.error(500, "Idempotency failure")
-
-        # Step 4: Check rate limit
-        if not await self._check_rate_limit(token):
-            await self.clear_idempotency(token)
+        if outcome == GUARD_RATE_LIMITED:
             logger.warning(
                 "rate_limit_exceeded",
                 extra={
@@ -500,6 +550,9 @@ class TriggerService:
             )
             return TriggerResult.error(429, "Rate limit exceeded")
 
+        if not alarm_id:
+            return TriggerResult.error(500, "Idempotency failure")
+
         # Step 5: Enrich trigger data (validate device)
         device, device_error = await self._enrich_trigger_data(token)
         if device_error:
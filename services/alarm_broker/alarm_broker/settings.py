@@ -122,6 +122,9 @@ class SmsSettings(BaseSettings):
         sendxms_api_key: API key for authentication
         sendxms_from: Sender name/number
         sendxms_send_path: API endpoint path
+        sendxms_bulk_send_path: API endpoint path for multi-recipient sends
+        sendxms_bulk_recipients_field: Body field holding the recipient list
+            on multi-recipient sends
         sendxms_mode: API mode (currently only 'json' supported)
     """
 
@@ -132,6 +135,8 @@ class SmsSettings(BaseSettings):
     sendxms_api_key: str = ""  # Empty = disabled
     sendxms_from: str = "Notfall"
     sendxms_send_path: str = "/send"
+    sendxms_bulk_send_path: str = ""
+    sendxms_bulk_recipients_field: str = "to"
     sendxms_mode: Literal["json"] = "json"
 
     def is_enabled(self) -> bool:
@@ -242,6 +247,11 @@ class Settings(BaseSettings):
     base_url: AnyHttpUrl = "http://localhost:8080"
     log_level: str = "INFO"
 
+    # Database connection pool (ignored for SQLite)
+    db_pool_size: int = Field(default=20, ge=1)
+    db_max_overflow: int = Field(default=40, ge=0)
+    db_pool_recycle_seconds: int = Field(default=1800, ge=-1)
+
     # Yealink inbound
     yelk_token_query_param: str = "token"
     yelk_ip_allowlist: str = ""
@@ -270,6 +280,8 @@ class Settings(BaseSettings):
     sendxms_api_key: str = ""
     sendxms_from: str = "Notfall"
     sendxms_send_path: str = "/send"
+    sendxms_bulk_send_path: str = ""
+    sendxms_bulk_recipients_field: str = "to"
     sendxms_mode: Literal["json"] = "json"
 
     # Signal
@@ -278,6 +290,10 @@ class Settings(BaseSettings):
     signal_target_group_id: str = ""
     signal_send_path: str = "/v2/send"
 
+    # Outbound HTTP transport shared by the connectors
+    connector_http_transport: Literal["httpx", "aiohttp"] = "httpx"
+    notification_max_concurrency: int = Field(default=20, ge=1)
+
     # Webhook callbacks
     webhook_enabled: bool = False
     webhook_url: str = ""
@@ -343,6 +359,8 @@ class Settings(BaseSettings):
             sendxms_api_key=self.sendxms_api_key,
             sendxms_from=self.sendxms_from,
             sendxms_send_path=self.sendxms_send_path,
+            sendxms_bulk_send_path=self.sendxms_bulk_send_path,
+            sendxms_bulk_recipients_field=self.sendxms_bulk_recipients_field,
             sendxms_mode=self.sendxms_mode,
         )
 
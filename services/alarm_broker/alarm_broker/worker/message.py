@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 
 
 def format_alarm_message(
@@ -12,13 +13,27 @@ def format_alarm_message(
     created_at: datetime,
     ack_url: str,
     step_no: int,
+) -> str:
+    # Keyed on the ISO string: equal datetimes in different zones render differently
+    return _format_cached(alarm_id, person, room, site, created_at.isoformat(), ack_url, step_no)
+
+
+@lru_cache(maxsize=2048)
+def _format_cached(
+    alarm_id: str,
+    person: str,
+    room: str,
+    site: str | None,
+    created_at: str,
+    ack_url: str,
+    step_no: int,
 ) -> str:
     parts = [
         "NOTFALLALARM (silent)",
         f"Alarm-ID: {alarm_id}",
         f"Person: {person}",
         f"Ort: {room}" + (f" / {site}" if site else ""),
-        f"Zeit: {created_at.isoformat()}",
+        f"Zeit: {created_at}",
         f"Stufe: {step_no}",
         f"Quittieren: {ack_url}",
     ]
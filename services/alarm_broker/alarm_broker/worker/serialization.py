@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+import orjson
+
+# First byte of pickle protocol 2+ streams; never valid at the start of JSON
+_PICKLE_PREFIX = b"\x80"
+
+
+def serialize_job(data: dict[str, Any]) -> bytes:
+    """Serialize an arq job or result with orjson instead of pickle.
+
+    Job arguments must be JSON-compatible; anything else raises
+    ``TypeError`` at enqueue time instead of being silently stringified.
+    The one non-JSON value arq itself produces, the exception stored as
+    the result of a failed job, is converted to an explicit
+    ``{"exc_type", "message"}`` mapping.
+    """
+    result = data.get("r")
+    if data.get("s") is False and isinstance(result, BaseException):
+        data = {**data, "r": {"exc_type": type(result).__name__, "message": str(result)}}
+    return orjson.dumps(data)
+
+
+def deserialize_job(raw: bytes) -> dict[str, Any]:
+    """Deserialize an arq job or result written by :func:`serialize_job`.
+
+    Jobs and results pickled before the switch to JSON are still read, so
+    the queue does not have to be drained for the deploy. Remove the pickle
+    fallback one release after the switch.
+    """
+    if raw[:1] == _PICKLE_PREFIX:
+        return pickle.loads(raw)
+    return orjson.loads(raw)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import httpx
 from arq.connections import RedisSettings
 
+from alarm_broker.connectors.base import PooledAsyncClient, create_http_client
 from alarm_broker.connectors.mock import MockSendXmsClient, MockSignalClient, MockZammadClient
 from alarm_broker.connectors.sendxms import SendXmsClient, SendXmsConfig
 from alarm_broker.connectors.signal import SignalClient, SignalConfig
@@ -10,6 +11,7 @@ from alarm_broker.connectors.zammad import ZammadClient, ZammadConfig
 from alarm_broker.db.engine import create_async_engine_from_url
 from alarm_broker.db.session import create_sessionmaker
 from alarm_broker.settings import get_settings
+from alarm_broker.worker.serialization import deserialize_job, serialize_job
 from alarm_broker.worker.tasks import (
     alarm_acked,
     alarm_created,
@@ -23,11 +25,16 @@ async def startup(ctx: dict) -> None:
     settings = get_settings()
     ctx["settings"] = settings
 
-    engine = create_async_engine_from_url(settings.database_url)
+    engine = create_async_engine_from_url(
+        settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle_seconds,
+    )
     ctx["engine"] = engine
     ctx["sessionmaker"] = create_sessionmaker(engine)
 
-    http = httpx.AsyncClient(timeout=httpx.Timeout(10.0))
+    http = create_http_client(settings.connector_http_transport)
     ctx["http"] = http
 
     # Use mock connectors in simulation mode
@@ -55,6 +62,8 @@ async def startup(ctx: dict) -> None:
                 api_key=settings.sendxms_api_key,
                 from_name=settings.sendxms_from,
                 send_path=settings.sendxms_send_path,
+                bulk_send_path=settings.sendxms_bulk_send_path,
+                bulk_recipients_field=settings.sendxms_bulk_recipients_field,
             ),
         )
         ctx["signal"] = SignalClient(
@@ -69,6 +78,11 @@ async def startup(ctx: dict) -> None:
 
 
 async def shutdown(ctx: dict) -> None:
+    # Connectors first (Zammad sends queued notes), then the pool they share
+    for name in ("zammad", "sendxms", "signal"):
+        connector: PooledAsyncClient | None = ctx.get(name)
+        if connector:
+            await connector.aclose()
     http: httpx.AsyncClient = ctx.get("http")
     if http:
         await http.aclose()
@@ -81,4 +95,7 @@ class WorkerSettings:
     redis_settings = RedisSettings.from_dsn(str(get_settings().redis_url))
     on_startup = startup
     on_shutdown = shutdown
+    # Must match the API's create_pool() so both sides read each other's jobs
+    job_serializer = staticmethod(serialize_job)
+    job_deserializer = staticmethod(deserialize_job)
     functions = [alarm_created, escalate, alarm_acked, alarm_state_changed, process_alarm_event]
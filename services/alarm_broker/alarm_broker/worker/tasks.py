@@ -79,6 +79,8 @@ def _get_notification_service(ctx: dict) -> NotificationService:
         zammad=ctx["zammad"],
         sendxms=ctx["sendxms"],
         signal=ctx["signal"],
+        http=ctx.get("http"),
+        max_concurrency=ctx["settings"].notification_max_concurrency,
     )
 
 
@@ -109,17 +111,15 @@ async def alarm_created(ctx: dict, alarm_id: str) -> None:
         enriched = await enrich_alarm_context(session, alarm)
         ack_url = f"{settings.base_url}/a/{alarm.ack_token}"
 
-        # Create Zammad ticket
-        ticket_id = await notification.handle_zammad_ticket(
-            session, alarm, enriched, ack_url, settings
-        )
-        if ticket_id:
-            alarm.zammad_ticket_id = ticket_id
-            await session.commit()
+        # The ticket and the stage 0 notifications share one rendered message
+        payload = notification.build_payload(alarm, enriched, step_no=0, ack_url=ack_url)
+
+        # Create Zammad ticket; stores the ticket ID on the alarm
+        await notification.handle_zammad_ticket(session, alarm, payload, settings)
 
         # Send stage 0 notifications
         await notification.send_escalation_step(
-            session, alarm, enriched, step_no=0, ack_url=ack_url
+            session, alarm, enriched, step_no=0, ack_url=ack_url, payload=payload
         )
 
         # Schedule future escalation steps
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from alarm_broker.api.main import create_app
 from alarm_broker.db.base import Base
-from alarm_broker.db.models import Device, Person, Room, Site
+from alarm_broker.db.models import Alarm, AlarmStatus, Device, Person, Room, Site
 from alarm_broker.db.session import create_sessionmaker
+from alarm_broker.services.enrichment_service import invalidate as invalidate_enrichment
 from alarm_broker.settings import Settings
 
 
@@ -44,6 +53,22 @@ class FakeRedis:
     async def enqueue_job(self, name: str, *args, **kwargs) -> None:  # noqa: ARG002
         self.jobs.append((name, args))
 
+    def register_script(self, script: str):  # noqa: ARG002
+        # Emulates TRIGGER_GUARD_LUA on the in-memory store
+        async def run(keys: list[str], args: list, client=None):  # noqa: ARG001
+            idem_key, rl_key = keys
+            alarm_id, _idem_ttl, _rl_ttl, limit = args
+            existing = self._store.get(idem_key)
+            if existing is not None:
+                return [1, existing]
+            count = await self.incr(rl_key)
+            if count > int(limit):
+                return [2, count]
+            self._store[idem_key] = alarm_id
+            return [0, alarm_id]
+
+        return run
+
 
 @pytest.fixture
 def anyio_backend() -> str:
@@ -83,6 +108,38 @@ async def seeded_db(sessionmaker: async_sessionmaker) -> None:
             )
         )
         await session.commit()
+    # Every test starts from fresh reference data
+    invalidate_enrichment()
+
+
+@pytest.fixture
+def make_alarm() -> Callable[..., Awaitable[Alarm]]:
+    """Factory that commits a triggered alarm for the seeded device."""
+
+    async def _make(session: AsyncSession, **overrides: Any) -> Alarm:
+        alarm = Alarm(
+            **{
+                "id": uuid.uuid4(),
+                "status": AlarmStatus.TRIGGERED,
+                "source": "test",
+                "event": "alarm.trigger",
+                "person_id": "ma-012",
+                "room_id": "bg-1.23",
+                "site_id": "bg",
+                "device_id": "ylk-t5-10023",
+                "severity": "P0",
+                "silent": True,
+                "ack_token": f"test-{uuid.uuid4().hex}",
+                "created_at": datetime.now(UTC),
+                "meta": {},
+                **overrides,
+            }
+        )
+        session.add(alarm)
+        await session.commit()
+        return alarm
+
+    return _make
 
 
 @pytest.fixture
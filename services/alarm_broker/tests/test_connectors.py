@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from alarm_broker.connectors import base, zammad
+from alarm_broker.connectors.sendxms import SendXmsConfig, SendXmsConnector
+from alarm_broker.connectors.zammad import ZammadConfig, ZammadConnector
+from alarm_broker.core.errors import CircuitOpenError, ConfigurationError, ConnectorError
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    async def _sleep(_seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(base.asyncio, "sleep", _sleep)
+
+
+def _sms_connector(http: httpx.AsyncClient) -> SendXmsConnector:
+    return SendXmsConnector(
+        http,
+        SendXmsConfig(enabled=True, base_url="https://sms.example.test", api_key="k"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_connector_retries_server_errors_then_succeeds(no_backoff):
+    async with httpx.AsyncClient() as http:
+        with respx.mock(assert_all_called=True) as mock_router:
+            route = mock_router.post("https://sms.example.test/send").mock(
+                side_effect=[httpx.Response(503), httpx.Response(429), httpx.Response(200)]
+            )
+            await _sms_connector(http).send_sms("+491701234567", "Alarm")
+
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_connector_does_not_retry_client_errors(no_backoff):
+    async with httpx.AsyncClient() as http:
+        with respx.mock(assert_all_called=True) as mock_router:
+            route = mock_router.post("https://sms.example.test/send").respond(401)
+            with pytest.raises(httpx.HTTPStatusError):
+                await _sms_connector(http).send_sms("+491701234567", "Alarm")
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_after_repeated_outages(no_backoff):
+    async with httpx.AsyncClient() as http:
+        connector = _sms_connector(http)
+        with respx.mock(assert_all_called=True) as mock_router:
+            route = mock_router.post("https://sms.example.test/send").respond(503)
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await connector.send_sms("+491701234567", "Alarm")
+            calls_before_open = route.call_count
+
+            with pytest.raises(CircuitOpenError):
+                await connector.send_sms("+491701234567", "Alarm")
+
+    assert calls_before_open == 5
+    assert route.call_count == calls_before_open
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_probe_reopens_the_breaker():
+    probe_sent = asyncio.Event()
+
+    async def _hung_backend(_request: httpx.Request) -> httpx.Response:
+        probe_sent.set()
+        await asyncio.sleep(60)
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient() as http:
+        connector = _sms_connector(http)
+        breaker = connector._breaker
+        breaker.state = base.CircuitBreaker.OPEN
+        breaker.opened_at = -breaker.reset_timeout
+        with respx.mock(assert_all_called=True) as mock_router:
+            route = mock_router.post("https://sms.example.test/send")
+            route.side_effect = _hung_backend
+            probe = asyncio.create_task(connector.send_sms("+491701234567", "Alarm"))
+            await probe_sent.wait()
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+            assert breaker.state == base.CircuitBreaker.OPEN
+            with pytest.raises(CircuitOpenError):
+                await connector.send_sms("+491701234567", "Alarm")
+
+            breaker.opened_at = -breaker.reset_timeout
+            route.side_effect = None
+            route.return_value = httpx.Response(200)
+            await connector.send_sms("+491701234567", "Alarm")
+
+    assert breaker.state == base.CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_caller_cancel_is_not_counted_as_an_outage():
+    request_sent = asyncio.Event()
+
+    async def _slow_backend(_request: httpx.Request) -> httpx.Response:
+        request_sent.set()
+        await asyncio.sleep(60)
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient() as http:
+        connector = _sms_connector(http)
+        with respx.mock(assert_all_called=False) as mock_router:
+            mock_router.post("https://sms.example.test/send").mock(side_effect=_slow_backend)
+            for _ in range(connector._breaker.threshold):
+                request_sent.clear()
+                call = asyncio.create_task(connector.send_sms("+491701234567", "Alarm"))
+                await request_sent.wait()
+                call.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await call
+
+    assert connector._breaker.state == base.CircuitBreaker.CLOSED
+    assert connector._breaker.failure_count == 0
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_limits_in_flight_requests():
+    in_flight = 0
+    peak = 0
+
+    async def _slow_backend(_request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    config = SendXmsConfig(
+        enabled=True, base_url="https://sms.example.test", api_key="k", max_concurrency=2
+    )
+    async with httpx.AsyncClient() as http:
+        connector = SendXmsConnector(http, config)
+        with respx.mock(assert_all_called=True) as mock_router:
+            mock_router.post("https://sms.example.test/send").mock(side_effect=_slow_backend)
+            await asyncio.gather(*(connector.send_sms("+49170", "Alarm") for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_call_deadline_bounds_slow_backend():
+    async def _hanging_backend(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return httpx.Response(200)
+
+    config = SendXmsConfig(
+        enabled=True, base_url="https://sms.example.test", api_key="k", call_deadline_s=0.05
+    )
+    async with httpx.AsyncClient() as http:
+        connector = SendXmsConnector(http, config)
+        with respx.mock(assert_all_called=False) as mock_router:
+            mock_router.post("https://sms.example.test/send").mock(side_effect=_hanging_backend)
+            with pytest.raises(TimeoutError):
+                await connector.send_sms("+49170", "Alarm")
+
+    assert connector._breaker.failure_count == 1
+
+
+@pytest.mark.asyncio
+async def test_sendxms_sends_precomputed_bearer_header():
+    async with httpx.AsyncClient() as http:
+        with respx.mock(assert_all_called=True) as mock_router:
+            route = mock_router.post("https://sms.example.test/send").respond(200)
+            await _sms_connector(http).send_sms("+491701234567", "Alarm")
+
+    request = route.calls.last.request
+    assert request.headers["Authorization"] == "Bearer k"
+    assert request.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_sendxms_bulk_uses_one_request_when_bulk_path_is_configured():
+    bulk = SendXmsConfig(
+        enabled=True,
+        base_url="https://sms.example.test",
+        api_key="k",
+        bulk_send_path="/bulk",
+        bulk_recipients_field="recipients",
+    )
+    async with httpx.AsyncClient() as http:
+        with respx.mock(assert_all_called=True) as mock_router:
+            bulk_route = mock_router.post("https://sms.example.test/bulk").respond(200)
+            errors = await SendXmsConnector(http, bulk).send_bulk_sms(["+491", "+492"], "Alarm")
+        with pytest.raises(ConfigurationError):
+            await _sms_connector(http).send_bulk_sms(["+491", "+492"], "Alarm")
+
+    assert errors == [None, None]
+    assert json.loads(bulk_route.calls.last.request.content) == {
+        "message": "Alarm",
+        "from": "Notfall",
+        "recipients": ["+491", "+492"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_zammad_create_ticket_sends_json_body_and_parses_id():
+    config = ZammadConfig(base_url="https://zammad.example.test", api_token="t")
+    async with httpx.AsyncClient() as http:
+        with respx.mock(assert_all_called=True) as mock_router:
+            route = mock_router.post("https://zammad.example.test/api/v1/tickets").respond(
+                201, json={"id": 4711}
+            )
+            ticket_id = await ZammadConnector(http, config).create_ticket({"title": "Alarm ä"})
+
+    request = route.calls.last.request
+    assert ticket_id == 4711
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == {"title": "Alarm ä"}
+
+
+@pytest.mark.asyncio
+async def test_zammad_coalesces_concurrent_notes_for_same_ticket(monkeypatch, no_backoff):
+    monkeypatch.setattr(zammad, "_NOTE_BATCH_WINDOW_S", 0)
+    config = ZammadConfig(base_url="https://zammad.example.test", api_token="t")
+    async with httpx.AsyncClient() as http:
+        connector = ZammadConnector(http, config)
+        with respx.mock(assert_all_called=True) as mock_router:
+            ticket_7 = mock_router.put("https://zammad.example.test/api/v1/tickets/7").respond(200)
+            ticket_8 = mock_router.put("https://zammad.example.test/api/v1/tickets/8").respond(500)
+            results = await asyncio.gather(
+                connector.add_internal_note(7, "Alarm quittiert", "A"),
+                connector.add_internal_note(7, "Alarm quittiert", "B"),
+                connector.add_internal_note(8, "Alarm quittiert", "C"),
+                return_exceptions=True,
+            )
+
+    assert results[:2] == [None, None]
+    assert isinstance(results[2], httpx.HTTPStatusError)
+    assert ticket_7.call_count == 1
+    article = json.loads(ticket_7.calls.last.request.content)["article"]
+    assert article["subject"] == "Alarm quittiert"
+    assert article["body"] == "A\n\nB"
+    assert ticket_8.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_zammad_aclose_sends_queued_notes_and_keeps_pool_open():
+    config = ZammadConfig(base_url="https://zammad.example.test", api_token="t")
+    async with httpx.AsyncClient() as http:
+        connector = ZammadConnector(http, config)
+        with respx.mock(assert_all_called=True) as mock_router:
+            ticket = mock_router.put("https://zammad.example.test/api/v1/tickets/7").respond(200)
+            note = asyncio.ensure_future(connector.add_internal_note(7, "Alarm quittiert", "A"))
+            await asyncio.sleep(0)
+            await connector.aclose()
+            await note
+
+        assert ticket.call_count == 1
+        assert not http.is_closed
+
+
+@pytest.mark.asyncio
+async def test_zammad_cancelled_flush_fails_queued_notes():
+    config = ZammadConfig(base_url="https://zammad.example.test", api_token="t")
+    async with httpx.AsyncClient() as http:
+        connector = ZammadConnector(http, config)
+        note = asyncio.ensure_future(connector.add_internal_note(7, "Alarm quittiert", "A"))
+        await asyncio.sleep(0)
+        connector._flusher.cancel()
+
+        with pytest.raises(ConnectorError):
+            await asyncio.wait_for(note, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_zammad_cancelled_caller_does_not_send_its_note(monkeypatch):
+    monkeypatch.setattr(zammad, "_NOTE_BATCH_WINDOW_S", 0.01)
+    config = ZammadConfig(base_url="https://zammad.example.test", api_token="t")
+    async with httpx.AsyncClient() as http:
+        connector = ZammadConnector(http, config)
+        with respx.mock(assert_all_called=True) as mock_router:
+            ticket = mock_router.put("https://zammad.example.test/api/v1/tickets/7").respond(200)
+            dropped = asyncio.ensure_future(connector.add_internal_note(7, "Abbruch", "A"))
+            kept = asyncio.ensure_future(connector.add_internal_note(7, "Alarm quittiert", "B"))
+            await asyncio.sleep(0)
+            dropped.cancel()
+            await kept
+
+    assert ticket.call_count == 1
+    article = json.loads(ticket.calls.last.request.content)["article"]
+    assert article["body"] == "B"
+
+
+@pytest.mark.asyncio
+async def test_retry_async_retries_transient_errors_only(no_backoff):
+    async with httpx.AsyncClient() as http:
+        with respx.mock(assert_all_called=True) as mock_router:
+            flaky = mock_router.post("https://hook.example.test/flaky").mock(
+                side_effect=[httpx.ConnectError("down"), httpx.Response(502), httpx.Response(204)]
+            )
+            rejected = mock_router.post("https://hook.example.test/rejected").respond(403)
+
+            async def _post(url: str) -> httpx.Response:
+                response = await http.post(url)
+                response.raise_for_status()
+                return response
+
+            response = await base.retry_async(
+                lambda: _post("https://hook.example.test/flaky"), operation="test"
+            )
+            with pytest.raises(httpx.HTTPStatusError):
+                await base.retry_async(
+                    lambda: _post("https://hook.example.test/rejected"), operation="test"
+                )
+
+    assert response.status_code == 204
+    assert flaky.call_count == 3
+    assert rejected.call_count == 1
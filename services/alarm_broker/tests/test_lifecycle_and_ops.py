@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import json
 import re
 import uuid
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
+from fastapi import HTTPException
 from httpx import ASGITransport, AsyncClient
 
 from alarm_broker.api.main import create_app
+from alarm_broker.core.errors import ConflictError
 from alarm_broker.db.models import Alarm, AlarmStatus
+from alarm_broker.services.alarm_service import (
+    acknowledge_alarm,
+    get_alarm_by_ack_token,
+    transition_alarm,
+)
 
 pytestmark = [pytest.mark.integration]
 
@@ -205,6 +213,47 @@ async def test_alarm_pagination_cursor(engine, sessionmaker, seeded_db, fake_red
             assert len(page_2.json()) >= 1
 
 
+@pytest.mark.asyncio
+async def test_alarm_ndjson_stream_matches_list_order(
+    engine, sessionmaker, seeded_db, fake_redis, settings, make_alarm
+):
+    settings.admin_api_key = "dev-admin-key"
+
+    now = datetime.now(UTC)
+    async with sessionmaker() as session:
+        alarm_ids = [
+            (await make_alarm(session, created_at=now - timedelta(minutes=index))).id
+            for index in range(3)
+        ]
+
+    app = create_app(settings=settings, injected_engine=engine, injected_redis=fake_redis)
+
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            page_1 = await client.get(
+                "/v1/alarms.ndjson",
+                params={"limit": 2},
+                headers={"X-Admin-Key": "dev-admin-key"},
+            )
+            assert page_1.status_code == 200
+            assert page_1.headers["content-type"] == "application/x-ndjson"
+            rows = [json.loads(line) for line in page_1.text.splitlines()]
+            assert [row["id"] for row in rows] == [str(alarm_ids[0]), str(alarm_ids[1])]
+
+            page_2 = await client.get(
+                "/v1/alarms.ndjson",
+                params={"limit": 2, "cursor": rows[-1]["id"]},
+                headers={"X-Admin-Key": "dev-admin-key"},
+            )
+            assert [json.loads(line)["id"] for line in page_2.text.splitlines()] == [
+                str(alarm_ids[2])
+            ]
+
+            unauthorized = await client.get("/v1/alarms.ndjson")
+            assert unauthorized.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_bulk_resolve_reports_changed_unchanged_and_missing(
     engine, sessionmaker, seeded_db, fake_redis, settings
@@ -362,6 +411,53 @@ async def test_bulk_ack_enqueues_jobs_only_for_newly_acknowledged(
     assert queued_ack_jobs[0][1][0]["alarm_id"] == str(triggered_id)
 
 
+@pytest.mark.asyncio
+async def test_concurrent_ack_is_rejected_for_the_loser(sessionmaker, seeded_db, make_alarm):
+    async with sessionmaker() as session:
+        alarm_id = (await make_alarm(session, ack_token="race-ack")).id
+
+    async with sessionmaker() as first, sessionmaker() as second:
+        first_alarm = await get_alarm_by_ack_token(first, "race-ack")
+        second_alarm = await get_alarm_by_ack_token(second, "race-ack")
+        await second.commit()
+
+        assert await acknowledge_alarm(first, first_alarm, acked_by="First", note="first")
+        assert first_alarm.status == AlarmStatus.ACKNOWLEDGED
+        assert first_alarm.meta == {"ack_note": "first"}
+
+        # second still sees TRIGGERED in memory; the guarded UPDATE must not match
+        with pytest.raises(ConflictError):
+            await acknowledge_alarm(second, second_alarm, acked_by="Second")
+        assert second_alarm.status == AlarmStatus.ACKNOWLEDGED
+
+    async with sessionmaker() as session:
+        stored = await session.get(Alarm, alarm_id)
+        assert stored is not None
+        assert stored.acked_by == "First"
+
+
+@pytest.mark.asyncio
+async def test_transition_rechecks_status_after_lost_race(sessionmaker, seeded_db, make_alarm):
+    async with sessionmaker() as session:
+        alarm_id = (await make_alarm(session, meta={"origin": "test"})).id
+
+    async with sessionmaker() as first, sessionmaker() as second:
+        first_alarm = await first.get(Alarm, alarm_id)
+        second_alarm = await second.get(Alarm, alarm_id)
+        await second.commit()
+
+        assert await transition_alarm(
+            first, first_alarm, target_status=AlarmStatus.RESOLVED, actor="First", note="done"
+        )
+        assert first_alarm.meta == {"origin": "test", "resolve_note": "done"}
+
+        # Stale TRIGGERED in memory: the guarded UPDATE misses and RESOLVED wins
+        with pytest.raises(HTTPException) as exc_info:
+            await transition_alarm(second, second_alarm, target_status=AlarmStatus.CANCELLED)
+        assert exc_info.value.status_code == 409
+        assert second_alarm.status == AlarmStatus.RESOLVED
+
+
 @pytest.mark.asyncio
 async def test_metrics_endpoint_exposes_prometheus_text(engine, seeded_db, fake_redis, settings):
     app = create_app(settings=settings, injected_engine=engine, injected_redis=fake_redis)
@@ -391,6 +487,24 @@ async def test_metrics_endpoint_exposes_prometheus_text(engine, seeded_db, fake_
     assert int(match.group(1)) >= 1
 
 
+@pytest.mark.asyncio
+async def test_request_logs_carry_request_id_from_context(
+    engine, seeded_db, fake_redis, settings, caplog
+):
+    app = create_app(settings=settings, injected_engine=engine, injected_redis=fake_redis)
+
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            with caplog.at_level("INFO", logger="alarm_broker"):
+                resp = await client.get("/healthz", headers={"X-Request-ID": "req-123"})
+
+    assert resp.headers["X-Request-ID"] == "req-123"
+    completed = [r for r in caplog.records if r.getMessage() == "request_completed"]
+    assert completed
+    assert completed[-1].request_id == "req-123"
+
+
 @pytest.mark.asyncio
 async def test_admin_dashboard_requires_key_and_renders_alarms(
     engine, sessionmaker, seeded_db, fake_redis, settings
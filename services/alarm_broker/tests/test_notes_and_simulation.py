@@ -6,6 +6,7 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from alarm_broker.api.main import create_app
+from alarm_broker.connectors import mock
 from alarm_broker.connectors.mock import get_mock_store
 
 pytestmark = [pytest.mark.integration]
@@ -208,3 +209,21 @@ async def test_admin_ui_simulation_panel_state(engine, seeded_db, fake_redis, se
             assert "id='simulation-panel'" in disabled_page.text
             assert "data-enabled='false'" in disabled_page.text
             assert "Simulation mode is currently disabled on this server." in disabled_page.text
+
+
+def test_mock_store_bounds_history_and_keeps_channel_index_in_sync(monkeypatch):
+    monkeypatch.setattr(mock, "_MAX_NOTIFICATIONS", 3)
+    store = get_mock_store()
+    store.clear()
+    try:
+        for index, channel in enumerate(["sms", "signal", "sms", "zammad", "sms"]):
+            store.add(channel, {"n": index})
+
+        assert [n.payload["n"] for n in store.get_all()] == [2, 3, 4]
+        assert [n.payload["n"] for n in store.get_by_channel("sms")] == [2, 4]
+        assert store.get_by_channel("signal") == []
+        assert store.get_all()[-1].id == "mock-5"
+        assert store.generate_ticket_id() == 1001
+    finally:
+        monkeypatch.undo()
+        store.clear()
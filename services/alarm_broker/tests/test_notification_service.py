@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
+from contextlib import contextmanager
 from datetime import UTC, datetime
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
 
-from alarm_broker.db.models import Alarm, AlarmNotification, AlarmStatus
+from alarm_broker.db.models import (
+    Alarm,
+    AlarmNotification,
+    AlarmStatus,
+    EscalationPolicy,
+    EscalationStep,
+    EscalationTarget,
+)
+from alarm_broker.services import enrichment_service, notification_service
 from alarm_broker.services.notification_service import NotificationService
+from alarm_broker.settings import Settings
 
 
 class _DummyZammad:
@@ -24,6 +35,42 @@ class _DummyNoop:
     pass
 
 
+class _DummySignal:
+    def enabled(self) -> bool:
+        return True
+
+    async def send_group_message(self, message: str, group_id: str) -> None:
+        assert message
+        assert group_id
+
+
+async def _add_step_targets(session, *targets: EscalationTarget) -> None:
+    session.add(EscalationPolicy(id="default", name="Default"))
+    for target in targets:
+        session.add(target)
+        session.add(
+            EscalationStep(policy_id="default", step_no=0, after_seconds=0, target_id=target.id)
+        )
+    await session.commit()
+
+
+async def _send_step(svc: NotificationService, session, alarm: Alarm) -> None:
+    await svc.send(
+        session,
+        alarm,
+        {"person_name": "Person X", "room_label": "Raum 1.23"},
+        step_no=0,
+        ack_url=f"http://test/a/{alarm.ack_token}",
+    )
+
+
+async def _notification_rows(session, alarm_id: uuid.UUID) -> list[AlarmNotification]:
+    rows = await session.scalars(
+        select(AlarmNotification).where(AlarmNotification.alarm_id == alarm_id)
+    )
+    return list(rows)
+
+
 @pytest.mark.asyncio
 async def test_add_zammad_ack_note_logs_with_real_alarm_id(sessionmaker, seeded_db):
     alarm_id = uuid.uuid4()
@@ -76,3 +123,297 @@ async def test_add_zammad_ack_note_logs_with_real_alarm_id(sessionmaker, seeded_
     assert row is not None
     assert row.payload.get("action") == "ack_update"
     assert row.payload.get("ticket_id") == 42
+
+
+class _TicketZammad(_DummyZammad):
+    async def create_ticket(self, payload: dict) -> int:
+        assert payload["article"]["body"]
+        return 99
+
+
+@pytest.mark.asyncio
+async def test_zammad_ticket_id_and_log_row_share_one_commit(sessionmaker, seeded_db, make_alarm):
+    async with sessionmaker() as session:
+        alarm = await make_alarm(session, ack_token="ticket-test")
+
+        svc = NotificationService(zammad=_TicketZammad(), sendxms=_DummyNoop(), signal=_DummyNoop())
+        payload = svc.build_payload(
+            alarm,
+            {"person_name": "Person X", "room_label": "Raum 1.23"},
+            step_no=0,
+            ack_url="http://test/a/ticket-test",
+        )
+        commits = 0
+        real_commit = session.commit
+
+        async def _counting_commit() -> None:
+            nonlocal commits
+            commits += 1
+            await real_commit()
+
+        session.commit = _counting_commit
+        ticket_id = await svc.handle_zammad_ticket(session, alarm, payload, Settings())
+
+    async with sessionmaker() as session:
+        stored = await session.get(Alarm, alarm.id)
+        row = await session.scalar(
+            select(AlarmNotification).where(AlarmNotification.alarm_id == alarm.id)
+        )
+
+    assert ticket_id == 99
+    assert commits == 1
+    assert stored.zammad_ticket_id == 99
+    assert row.payload == {"action": "create_ticket", "ticket_id": 99}
+
+
+class _SlowSignal:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    def enabled(self) -> bool:
+        return True
+
+    async def send_group_message(self, message: str, group_id: str) -> None:  # noqa: ARG002
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_send_notifies_targets_concurrently_and_logs_each(
+    sessionmaker, seeded_db, make_alarm
+):
+    signal = _SlowSignal()
+
+    async with sessionmaker() as session:
+        await _add_step_targets(
+            session,
+            *(
+                EscalationTarget(id=f"sig-{n}", label=f"S {n}", channel="signal", address=f"g{n}")
+                for n in range(3)
+            ),
+        )
+        alarm = await make_alarm(session, ack_token="concurrent-send")
+
+        svc = NotificationService(zammad=_DummyNoop(), sendxms=_DummyNoop(), signal=signal)
+        await _send_step(svc, session, alarm)
+        rows = await _notification_rows(session, alarm.id)
+
+    assert signal.peak == 3
+    assert sorted((row.target_id, row.result) for row in rows) == [
+        ("sig-0", "ok"),
+        ("sig-1", "ok"),
+        ("sig-2", "ok"),
+    ]
+
+    signal.peak = 0
+    capped = NotificationService(
+        zammad=_DummyNoop(), sendxms=_DummyNoop(), signal=signal, max_concurrency=2
+    )
+    async with sessionmaker() as session:
+        await _send_step(capped, session, alarm)
+    assert signal.peak == 2
+
+
+class _BulkSms:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def enabled(self) -> bool:
+        return True
+
+    def bulk_enabled(self) -> bool:
+        return True
+
+    async def send_bulk_sms(self, recipients: list[str], message: str) -> list:
+        assert message
+        self.calls.append(list(recipients))
+        return [None if to != "+4912" else RuntimeError("rejected") for to in recipients]
+
+
+@pytest.mark.asyncio
+async def test_send_hands_sms_targets_to_sendxms_in_one_call(sessionmaker, seeded_db, make_alarm):
+    sms = _BulkSms()
+
+    async with sessionmaker() as session:
+        await _add_step_targets(
+            session,
+            *(
+                EscalationTarget(id=f"sms-{n}", label=f"SMS {n}", channel="sms", address=f"+491{n}")
+                for n in range(3)
+            ),
+        )
+        alarm = await make_alarm(session, ack_token="bulk-sms")
+
+        svc = NotificationService(zammad=_DummyNoop(), sendxms=sms, signal=_DummyNoop())
+        await _send_step(svc, session, alarm)
+        rows = await _notification_rows(session, alarm.id)
+
+    assert len(sms.calls) == 1
+    assert sorted(sms.calls[0]) == ["+4910", "+4911", "+4912"]
+    assert sorted((row.target_id, row.result, row.error) for row in rows) == [
+        ("sms-0", "ok", None),
+        ("sms-1", "ok", None),
+        ("sms-2", "error", "rejected"),
+    ]
+
+
+class _HungSms:
+    def enabled(self) -> bool:
+        return True
+
+    def bulk_enabled(self) -> bool:
+        return False
+
+    async def send_sms(self, to: str, message: str) -> None:  # noqa: ARG002
+        if to == "+4917":
+            await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_send_times_out_hung_target_without_blocking_others(
+    sessionmaker, seeded_db, make_alarm, monkeypatch
+):
+    monkeypatch.setattr(notification_service, "_CHANNEL_DEADLINE_S", 0.05)
+
+    async with sessionmaker() as session:
+        await _add_step_targets(
+            session,
+            EscalationTarget(id="sms", label="SMS", channel="sms", address="+4917"),
+            EscalationTarget(id="sms-2", label="SMS 2", channel="sms", address="+4918"),
+            EscalationTarget(id="sig", label="Signal", channel="signal", address="grp"),
+        )
+        alarm = await make_alarm(session, ack_token="hung-send")
+
+        svc = NotificationService(zammad=_DummyNoop(), sendxms=_HungSms(), signal=_DummySignal())
+        await _send_step(svc, session, alarm)
+        rows = await _notification_rows(session, alarm.id)
+
+    assert sorted((row.target_id, row.result, row.error) for row in rows) == [
+        ("sig", "ok", None),
+        ("sms", "error", "timeout"),
+        ("sms-2", "ok", None),
+    ]
+
+
+class _DisabledClient:
+    def enabled(self) -> bool:
+        return False
+
+
+@pytest.mark.asyncio
+async def test_send_skips_formatting_when_all_channels_are_disabled(
+    sessionmaker, seeded_db, make_alarm, monkeypatch
+):
+    def _fail(**_kwargs):
+        raise AssertionError("message must not be formatted")
+
+    monkeypatch.setattr(notification_service, "format_alarm_message", _fail)
+
+    async with sessionmaker() as session:
+        await _add_step_targets(
+            session,
+            EscalationTarget(id="sms", label="SMS", channel="sms", address="+4917"),
+            EscalationTarget(id="mail", label="Mail", channel="email", address="a@b.c"),
+        )
+        alarm = await make_alarm(session, ack_token="disabled-send")
+
+        disabled = _DisabledClient()
+        svc = NotificationService(zammad=disabled, sendxms=disabled, signal=disabled)
+        await _send_step(svc, session, alarm)
+        rows = await _notification_rows(session, alarm.id)
+
+    assert [(row.channel, row.target_id, row.result, row.error) for row in rows] == [
+        ("escalation", None, "error", "All channels disabled")
+    ]
+    assert rows[0].payload == {"action": "skip_step", "step_no": 0, "target_ids": ["mail", "sms"]}
+
+
+@contextmanager
+def _count_queries(engine):
+    statements: list[str] = []
+
+    def _before_cursor_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_escalation_targets_load_in_one_query(engine, sessionmaker, seeded_db):
+    async with sessionmaker() as session:
+        session.add(EscalationPolicy(id="default", name="Default"))
+        for n in range(4):
+            session.add(
+                EscalationTarget(id=f"t-{n}", label=f"T {n}", channel="sms", address=f"+49{n}")
+            )
+            session.add(
+                EscalationStep(policy_id="default", step_no=1, after_seconds=60, target_id=f"t-{n}")
+            )
+        await session.commit()
+
+    svc = NotificationService(zammad=_DummyNoop(), sendxms=_DummyNoop(), signal=_DummyNoop())
+    async with sessionmaker() as session:
+        with _count_queries(engine) as statements:
+            targets = await svc._get_escalation_targets(session, "default", 1)
+
+    assert sorted(target.id for target in targets) == ["t-0", "t-1", "t-2", "t-3"]
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_target_is_not_paged_after_policy_edit(sessionmaker, seeded_db):
+    async with sessionmaker() as session:
+        session.add(EscalationPolicy(id="default", name="Default"))
+        session.add(EscalationTarget(id="t-0", label="T 0", channel="sms", address="+490"))
+        session.add(
+            EscalationStep(policy_id="default", step_no=1, after_seconds=60, target_id="t-0")
+        )
+        await session.commit()
+
+    svc = NotificationService(zammad=_DummyNoop(), sendxms=_DummyNoop(), signal=_DummyNoop())
+    async with sessionmaker() as session:
+        first = await svc._get_escalation_targets(session, "default", 1)
+        assert await svc.get_escalation_schedule(session) == [(1, 60)]
+
+    # Edited elsewhere (the admin API runs in another process than the worker)
+    async with sessionmaker() as session:
+        (await session.get(EscalationTarget, "t-0")).enabled = False
+        await session.commit()
+
+    async with sessionmaker() as session:
+        second = await svc._get_escalation_targets(session, "default", 1)
+
+    assert [target.id for target in first] == ["t-0"]
+    assert second == []
+
+
+def test_enrichment_invalidate_only_drops_matching_entries(monkeypatch):
+    entry = (float("inf"), {})
+    monkeypatch.setattr(
+        enrichment_service,
+        "_cache",
+        {
+            ("ma-1", "room-1", "bg"): entry,
+            ("ma-1", None, "bg"): entry,
+            (None, "room-1", "bg"): entry,
+            (None, None, "bg"): entry,
+            ("ma-2", "room-2", "bg"): entry,
+        },
+    )
+
+    enrichment_service.invalidate(person_id="ma-1")
+    assert set(enrichment_service._cache) == {
+        (None, "room-1", "bg"),
+        (None, None, "bg"),
+        ("ma-2", "room-2", "bg"),
+    }
+
+    enrichment_service.invalidate(room_id="room-1")
+    assert set(enrichment_service._cache) == {(None, None, "bg"), ("ma-2", "room-2", "bg")}
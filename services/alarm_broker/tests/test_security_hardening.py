@@ -5,11 +5,13 @@ from pathlib import Path
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
 
 from alarm_broker.api.main import create_app
+from alarm_broker.core import ip_allowlist
 from alarm_broker.core.ip_allowlist import ip_allowed
 from alarm_broker.core.rate_limit import rate_limit_key
-from alarm_broker.db.models import Alarm, AlarmStatus, Person
+from alarm_broker.db.models import Alarm, AlarmStatus, EscalationStep, EscalationTarget, Person
 from alarm_broker.seed import apply_seed
 from alarm_broker.settings import Settings
 
@@ -436,6 +438,16 @@ def test_ip_allowlist_ipv6_host_entry_matches_only_exact_host() -> None:
     assert not ip_allowed("2001:db8::2", "2001:db8::1")
 
 
+def test_ip_allowlist_matches_overlapping_and_mixed_version_entries() -> None:
+    allowlist = "10.0.0.0/8, 10.1.0.0/16, 192.0.2.7, 2001:db8::/64"
+    assert ip_allowed("10.1.2.3", allowlist)
+    assert ip_allowed("192.0.2.7", allowlist)
+    assert ip_allowed("2001:db8::abcd", allowlist)
+    assert not ip_allowed("11.0.0.1", allowlist)
+    assert not ip_allowed("192.0.2.8", allowlist)
+    assert not ip_allowed("2001:db8:0:1::1", allowlist)
+
+
 @pytest.mark.asyncio
 async def test_policy_duplicate_step_target_rejected(engine, seeded_db, fake_redis) -> None:
     app = create_app(
@@ -479,6 +491,59 @@ async def test_policy_duplicate_step_target_rejected(engine, seeded_db, fake_red
     assert resp.status_code == 400
 
 
+@pytest.mark.asyncio
+async def test_policy_update_replaces_steps_and_updates_targets(
+    engine, sessionmaker, seeded_db, fake_redis
+) -> None:
+    app = create_app(
+        settings=Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            redis_url="redis://fake/0",
+            base_url="http://localhost:8080",
+            admin_api_key="test-admin-key",
+            zammad_api_token="",
+            sendxms_enabled=False,
+            signal_enabled=False,
+        ),
+        injected_engine=engine,
+        injected_redis=fake_redis,
+    )
+
+    def _policy(address: str, steps: list[dict]) -> dict:
+        return {
+            "policy_id": "default",
+            "name": "Default",
+            "targets": [
+                {"id": "t1", "label": "T1", "channel": "sms", "address": address, "enabled": True},
+                {"id": "t2", "label": "T2", "channel": "sms", "address": "+492", "enabled": True},
+            ],
+            "steps": steps,
+        }
+
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            for body in (
+                _policy("+491", [{"step_no": 0, "after_seconds": 0, "target_ids": ["t1", "t2"]}]),
+                _policy("+499", [{"step_no": 1, "after_seconds": 60, "target_ids": ["t2"]}]),
+            ):
+                resp = await client.post(
+                    "/v1/admin/escalation-policy",
+                    headers={"X-Admin-Key": "test-admin-key"},
+                    json=body,
+                )
+                assert resp.status_code == 200
+
+    async with sessionmaker() as session:
+        steps = (
+            await session.execute(select(EscalationStep.step_no, EscalationStep.target_id))
+        ).all()
+        t1 = await session.get(EscalationTarget, "t1")
+
+    assert [tuple(row) for row in steps] == [(1, "t2")]
+    assert t1.address == "+499"
+
+
 @pytest.mark.asyncio
 async def test_admin_seed_invalid_structure_returns_400(engine, seeded_db, fake_redis) -> None:
     app = create_app(
@@ -525,3 +590,16 @@ async def test_seed_env_false_expands_to_boolean_false(sessionmaker, settings, m
 
     assert person is not None
     assert person.active is False
+
+
+def test_ip_allowlist_cache_is_bounded_by_range_count(monkeypatch) -> None:
+    monkeypatch.setattr(ip_allowlist, "_MAX_CACHED_RANGES", 2)
+    ip_allowlist.clear_cache()
+
+    assert ip_allowed("10.0.0.1", "10.0.0.0/8")
+    assert ip_allowed("192.0.2.1", "192.0.2.1, 2001:db8::1")
+    assert list(ip_allowlist._compiled_cache) == ["192.0.2.1, 2001:db8::1"]
+
+    ip_allowlist.clear_cache()
+    assert not ip_allowlist._compiled_cache
+    assert ip_allowlist._cached_ranges == 0
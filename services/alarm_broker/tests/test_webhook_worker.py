@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pickle
 import uuid
 from datetime import UTC, datetime
 
@@ -9,6 +10,7 @@ import respx
 from sqlalchemy import select
 
 from alarm_broker.db.models import Alarm, AlarmNotification, AlarmStatus
+from alarm_broker.worker.serialization import deserialize_job, serialize_job
 from alarm_broker.worker.tasks import alarm_state_changed
 
 
@@ -70,3 +72,17 @@ async def test_alarm_state_changed_posts_webhook_and_logs_result(
         assert row.payload.get("state") == "triggered"
 
     await http.aclose()
+
+
+def test_job_serializer_rejects_non_json_arguments_and_keeps_failures():
+    with pytest.raises(TypeError):
+        serialize_job({"f": "escalate", "a": [object()], "k": {}})
+
+    failed = deserialize_job(serialize_job({"f": "escalate", "s": False, "r": ValueError("boom")}))
+    assert failed["r"] == {"exc_type": "ValueError", "message": "boom"}
+
+
+def test_job_deserializer_reads_jobs_pickled_before_the_switch():
+    job = {"t": 1, "f": "escalate", "a": ("alarm-id", 1), "k": {}, "et": 0}
+    assert deserialize_job(pickle.dumps(job)) == job
+    assert deserialize_job(serialize_job(job))["a"] == ["alarm-id", 1]